@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks of the normalizers of utils.normalization.
+
+Usage:
+    python benchmarks/normalization.py [run] [--sizes N [N ...]] [--cases NAME [NAME ...]]
+                                       [--repeat N] [--dirty-ratio RATIO] [--output PATH]
+                                       [--with-cache] [--no-memory]
+    python benchmarks/normalization.py compare BASELINE CURRENT [--threshold RATIO]
+
+``run`` feeds every normalizer, through ``apply_and_check``, and ``apply_and_check_dict``
+synthetic series of each size. Distinct values are drawn from realistic pools (the
+normalization dictionaries with case, accent and spacing variants, dates in every
+accepted format...) with the cardinality of the real columns, and a share of the rows
+is replaced by unknown markers ("No consta", "n/c"...). Each scalar normalizer is also
+called on a sample of values to report its cost per call. Throughput (rows/s) is the
+best of ``--repeat`` runs; peak memory is measured with tracemalloc in a separate run.
+Results are saved as JSON under ``logs/benchmarks``.
+
+The on-disk normalization cache is disabled unless ``--with-cache`` is given, so that
+the normalizers themselves are measured.
+
+``compare`` matches the results of two runs by case and size and exits with status 1
+if the throughput of any of them dropped by more than ``--threshold``.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.logging import setup_logging
+from utils.normalization import (
+    NormalizationResult,
+    NormalizationStatus,
+    apply_and_check,
+    apply_and_check_dict,
+    normalize_age_group,
+    normalize_comunidad_autonoma,
+    normalize_date,
+    normalize_json_string,
+    normalize_month,
+    normalize_municipio,
+    normalize_municipio_id,
+    normalize_nationality,
+    normalize_plain_text,
+    normalize_positive_float,
+    normalize_positive_integer,
+    normalize_provincia,
+    normalize_quarter,
+    normalize_year,
+)
+from utils.normalization_cache import CACHE_ENV_VAR
+from utils.normalization_dicts import (
+    DICT_COMUNIDADES_AUTOMAS,
+    DICT_MONTHS,
+    DICT_NATIONALITIES,
+    DICT_PROVINCIAS,
+    DICT_QUARTER,
+    get_municipio_ids,
+    get_municipios_dict,
+)
+
+RESULTS_DIR = Path("logs") / "benchmarks"
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+SCALAR_SAMPLE_SIZE = 10_000
+UNKNOWN_MARKERS = ["No consta", "n/c", " NO CONSTA ", "Desconocida", ""]
+SEXO_MAPPING = {"Hombres": "Hombre", "Mujeres": "Mujer", "Ambos sexos": "Total", "Total": "Total"}
+
+
+@dataclass(frozen=True)
+class Case:
+    """A normalizer benchmarked on series drawn from a pool of raw values."""
+
+    name: str
+    # None for apply_and_check_dict with ``mapping``
+    normalizer: Optional[Callable[[Any], NormalizationResult]]
+    pool: Callable[[random.Random], list[Any]]
+    # Distinct values of a typical column
+    cardinality: int
+    # Unknown markers the normalizer accepts for the dirty rows
+    unknown: Callable[[], list[Any]] = lambda: UNKNOWN_MARKERS
+    mapping: Optional[dict[str, Any]] = None
+
+
+@dataclass
+class BenchmarkResult:
+    """Throughput and peak memory of a case at a size."""
+
+    case: str
+    kind: str
+    rows: int
+    seconds: float
+    rows_per_s: float
+    us_per_row: float
+    peak_mb: Optional[float] = None
+
+
+def _name_variants(names: list[str]) -> list[str]:
+    """Add the case and spacing variants found in the raw sources."""
+    return [variant for name in names for variant in (name, name.upper(), name.lower(), f"  {name} ")]
+
+
+def _dates(rng: random.Random) -> list[str]:
+    start = date(2000, 1, 1)
+    formats = ["%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%Y/%m/%d"]
+    return [(start + timedelta(days=day)).strftime(rng.choice(formats)) for day in range(0, 9000, 2)]
+
+
+def _age_groups(rng: random.Random) -> list[str]:
+    labels = ["De 0 a 15 años", "De 16 a 64 años", "65 años y más", "De 65 y más años", "<16", ">84", "+16"]
+    labels += [f"{age}-{age + 4}" for age in range(0, 100, 5)] + [f"{age} años" for age in range(100)]
+    labels += [f"De {age} a {age + 9} años" for age in range(10, 90, 10)]
+    return labels
+
+
+def _municipios(rng: random.Random) -> list[tuple[str, int]]:
+    return [(name, provincia_id) for provincia_id, names in get_municipios_dict().items() for name in names]
+
+
+def _json_strings(rng: random.Random) -> list[str]:
+    return [json.dumps({"p1": rng.randint(1, 5), "p2": [rng.random() for _ in range(3)]}) for _ in range(500)]
+
+
+def _plain_texts(rng: random.Random) -> list[str]:
+    words = ["centro", "mujer", "atención", "servicio", "Comunidad", "programa", "red", "casa", "acogida"]
+    return [" ".join(rng.choices(words, k=rng.randint(2, 8))) for _ in range(5000)]
+
+
+CASES = [
+    Case("provincia", normalize_provincia, lambda rng: _name_variants(list(DICT_PROVINCIAS)), 60),
+    Case(
+        "comunidad_autonoma",
+        normalize_comunidad_autonoma,
+        lambda rng: _name_variants(list(DICT_COMUNIDADES_AUTOMAS)),
+        20,
+    ),
+    Case("nationality", normalize_nationality, lambda rng: _name_variants(list(DICT_NATIONALITIES)), 150),
+    Case(
+        "municipio_id",
+        normalize_municipio_id,
+        lambda rng: sorted(get_municipio_ids()) + [f"{municipio_id:05d}" for municipio_id in get_municipio_ids()],
+        8000,
+    ),
+    Case("municipio", normalize_municipio, _municipios, 8000, lambda: [("No consta", 28), ("n/c", "Madrid")]),
+    Case(
+        "month",
+        normalize_month,
+        lambda rng: _name_variants(list(DICT_MONTHS)) + [str(m) for m in range(1, 13)] + list(range(1, 13)),
+        12,
+    ),
+    Case("year", normalize_year, lambda rng: [str(y) for y in range(1990, 2025)] + list(range(1990, 2025)), 30),
+    Case("date", normalize_date, _dates, 3000, lambda: ["No consta", "n/c"]),
+    Case(
+        "quarter",
+        normalize_quarter,
+        lambda rng: [str(q) for q in range(1, 5)] + list(DICT_QUARTER) + list(range(1, 5)),
+        8,
+        lambda: ["No consta", "n/c"],
+    ),
+    Case("age_group", normalize_age_group, _age_groups, 40),
+    Case(
+        "positive_integer",
+        normalize_positive_integer,
+        lambda rng: [str(rng.randint(0, 10**6)) for _ in range(50_000)]
+        + [rng.randint(0, 10**6) for _ in range(50_000)],
+        100_000,
+    ),
+    Case(
+        "positive_float",
+        normalize_positive_float,
+        lambda rng: [f"{rng.uniform(0, 1000):.2f}" for _ in range(50_000)]
+        + [rng.uniform(0, 100) for _ in range(50_000)],
+        100_000,
+    ),
+    Case("plain_text", normalize_plain_text, _plain_texts, 5000),
+    Case("json_string", normalize_json_string, _json_strings, 500),
+    Case("dict", None, lambda rng: list(SEXO_MAPPING), 4, mapping=SEXO_MAPPING),
+]
+
+
+def _valid_pool(case: Case, rng: random.Random) -> list[Any]:
+    """Return the pool of the case without the values its normalizer rejects."""
+    normalizer = case.normalizer
+    if normalizer is None:
+        return case.pool(rng)
+    return [value for value in case.pool(rng) if normalizer(value).status is not NormalizationStatus.INVALID]
+
+
+def make_series(pool: list[Any], unknown: list[Any], rows: int, cardinality: int, dirty_ratio: float, seed: int):
+    """Draw a series of rows from ``cardinality`` values of the pool, with a share of unknown markers."""
+    rng = np.random.default_rng(seed)
+    distinct = np.empty(min(cardinality, len(pool)), dtype=object)
+    distinct[:] = [pool[i] for i in rng.choice(len(pool), size=len(distinct), replace=False)]
+    values = distinct[rng.integers(0, len(distinct), rows)]
+    dirty = np.flatnonzero(rng.random(rows) < dirty_ratio)
+    markers = np.empty(len(unknown), dtype=object)
+    markers[:] = unknown
+    values[dirty] = markers[rng.integers(0, len(markers), len(dirty))]
+    return pd.Series(values, dtype=object)
+
+
+def _time(func: Callable[[], Any], repeat: int) -> float:
+    """Return the best wall time of several calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_memory_mb(func: Callable[[], Any]) -> float:
+    """Return the peak memory allocated by a call, as traced by tracemalloc."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def _result(case: str, kind: str, rows: int, seconds: float, peak_mb: Optional[float]) -> BenchmarkResult:
+    return BenchmarkResult(
+        case=case,
+        kind=kind,
+        rows=rows,
+        seconds=round(seconds, 6),
+        rows_per_s=round(rows / seconds, 1) if seconds > 0 else float("inf"),
+        us_per_row=round(seconds / rows * 1e6, 4),
+        peak_mb=round(peak_mb, 2) if peak_mb is not None else None,
+    )
+
+
+def run_case(case: Case, sizes: list[int], repeat: int, dirty_ratio: float, memory: bool) -> list[BenchmarkResult]:
+    """Benchmark the scalar normalizer and the series normalization of a case at every size."""
+    rng = random.Random(0)
+    pool = _valid_pool(case, rng)
+    unknown = case.unknown()
+    results: list[BenchmarkResult] = []
+
+    sample = make_series(pool, unknown, SCALAR_SAMPLE_SIZE, len(pool), dirty_ratio, seed=1).tolist()
+    normalizer = case.normalizer
+    if normalizer is not None:
+        seconds = _time(lambda: [normalizer(value) for value in sample], repeat)
+        results.append(_result(case.name, "scalar", len(sample), seconds, None))
+        logging.info(f"{case.name:>18} {results[-1].us_per_row:>10.2f} us per scalar call")
+
+    for rows in sizes:
+        series = make_series(pool, unknown, rows, case.cardinality, dirty_ratio, seed=rows)
+        if normalizer is None:
+            mapping = case.mapping or {}
+
+            def func() -> Any:
+                return apply_and_check_dict(series, mapping)
+
+        else:
+
+            def func() -> Any:
+                return apply_and_check(series, normalizer)
+
+        seconds = _time(func, repeat)
+        peak_mb = _peak_memory_mb(func) if memory else None
+        results.append(_result(case.name, "series", rows, seconds, peak_mb))
+        logging.info(
+            f"{case.name:>18} {rows:>10} rows {results[-1].rows_per_s:>14,.0f} rows/s"
+            + (f" {peak_mb:8.1f} MB peak" if peak_mb is not None else "")
+        )
+    return results
+
+
+def run(args: argparse.Namespace) -> Path:
+    """Run the benchmarks and save their results."""
+    if not args.with_cache:
+        os.environ[CACHE_ENV_VAR] = "0"
+    cases = [case for case in CASES if not args.cases or case.name in args.cases]
+    unknown_cases = set(args.cases or []) - {case.name for case in CASES}
+    if unknown_cases:
+        raise ValueError(f"Unknown cases: {sorted(unknown_cases)}")
+
+    results: list[BenchmarkResult] = []
+    for case in cases:
+        try:
+            results.extend(run_case(case, args.sizes, args.repeat, args.dirty_ratio, not args.no_memory))
+        except FileNotFoundError as e:
+            logging.warning(f"Skipping {case.name}: {e}")
+
+    output = args.output or RESULTS_DIR / f"normalization-{datetime.now().strftime('%Y%m%dT%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "created": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "dirty_ratio": args.dirty_ratio,
+        "with_cache": args.with_cache,
+        "results": [asdict(result) for result in results],
+    }
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    logging.info(f"Benchmark results saved to {output}")
+    return output
+
+
+def compare(baseline_path: Path, current_path: Path, threshold: float) -> list[str]:
+    """Log the throughput change of every case and size and return the regressions."""
+    baseline = {
+        (r["case"], r["kind"], r["rows"]): r for r in json.loads(baseline_path.read_text(encoding="utf-8"))["results"]
+    }
+    current = json.loads(current_path.read_text(encoding="utf-8"))["results"]
+    regressions: list[str] = []
+    for result in current:
+        key = (result["case"], result["kind"], result["rows"])
+        if key not in baseline:
+            continue
+        ratio = result["rows_per_s"] / baseline[key]["rows_per_s"]
+        description = f"{result['case']:>18} {result['kind']:>6} {result['rows']:>10} rows {ratio:7.2f}x"
+        if ratio < 1 - threshold:
+            regressions.append(description)
+            logging.warning(f"{description} REGRESSION")
+        else:
+            logging.info(description)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the normalizers")
+    subparsers = parser.add_subparsers(dest="command")
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks (default)")
+    compare_parser = subparsers.add_parser("compare", help="Compare two benchmark results")
+    for run_args in (parser, run_parser):
+        run_args.add_argument(
+            "--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Rows of the benchmarked series"
+        )
+        run_args.add_argument("--cases", nargs="+", help=f"Cases to run: {', '.join(case.name for case in CASES)}")
+        run_args.add_argument("--repeat", type=int, default=3, help="Runs per case and size (default: 3)")
+        run_args.add_argument(
+            "--dirty-ratio", type=float, default=0.05, help="Share of rows with unknown markers (default: 0.05)"
+        )
+        run_args.add_argument("--output", type=Path, help="JSON file for the results")
+        run_args.add_argument("--with-cache", action="store_true", help="Use the on-disk normalization cache")
+        run_args.add_argument("--no-memory", action="store_true", help="Do not measure peak memory")
+    compare_parser.add_argument("baseline", type=Path, help="JSON results of the baseline run")
+    compare_parser.add_argument("current", type=Path, help="JSON results of the run to check")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Flag cases whose throughput dropped by more than this ratio (default: 0.1)",
+    )
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        regressions = compare(args.baseline, args.current, args.threshold)
+        if regressions:
+            logging.error(f"{len(regressions)} regressions beyond {args.threshold:.0%}")
+            sys.exit(1)
+    else:
+        run(args)
+
+
+if __name__ == "__main__":
+    setup_logging()
+    main()
@@ -1,22 +1,47 @@
 """Create the database schema."""
 
+import argparse
 import logging
 from pathlib import Path
+from typing import Optional
 
 from utils.logging import setup_logging
 from utils.run_script import run_sql_script
+from utils.sql_schema import SHARED_SCHEMAS, get_dependent_views, get_schema_statements
 
 SCHEMA_PATH = Path("sql") / "schema.sql"
 VIEWS_PATH = Path("sql") / "views.sql"
 PERMISSIONS_PATH = Path("sql") / "permissions.sql"
 
 
-def main():
-    logging.info("Creating the database schema...")
-    run_sql_script(SCHEMA_PATH.read_text())
+def create_schema(schema: str):
+    """Create a single schema, the enums used only by its tables and the views that depend on it.
 
-    logging.info("Creating views...")
-    run_sql_script(VIEWS_PATH.read_text())
+    The shared schemas (geo, metadata, enums, analisis) must already exist."""
+    if schema in SHARED_SCHEMAS:
+        raise ValueError(f"Shared schema '{schema}' can only be created with all the others")
+    statements = get_schema_statements(SCHEMA_PATH.read_text(), schema)
+    if not statements:
+        raise ValueError(f"Schema '{schema}' is not defined in {SCHEMA_PATH}")
+    views = get_dependent_views(VIEWS_PATH.read_text(), schema)
+
+    logging.info(f"Creating schema {schema}...")
+    run_sql_script("\n\n".join(statement.sql for statement in statements))
+
+    logging.info(f"Creating {len(views)} dependent views...")
+    run_sql_script("\n\n".join(view.sql for view in views))
+
+
+def main(schema: Optional[str] = None):
+    """Create every schema or, if schema is provided, only that schema (see create_schema)."""
+    if schema:
+        create_schema(schema.lower())
+    else:
+        logging.info("Creating the database schema...")
+        run_sql_script(SCHEMA_PATH.read_text())
+
+        logging.info("Creating views...")
+        run_sql_script(VIEWS_PATH.read_text())
 
     logging.info("Granting permissions...")
     run_sql_script(PERMISSIONS_PATH.read_text())
@@ -26,4 +51,7 @@ def main():
 
 if __name__ == "__main__":
     setup_logging()
-    main()
+    parser = argparse.ArgumentParser(description="Create the database schemas")
+    parser.add_argument("schema", nargs="?", help="If provided, only this schema and its dependent views are created")
+    args = parser.parse_args()
+    main(args.schema)
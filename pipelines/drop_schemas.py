@@ -1,16 +1,47 @@
 """Reset the PostgreSQL database using the reset template."""
 
+import argparse
 import logging
 from pathlib import Path
+from typing import Optional
 
 from utils.logging import setup_logging
 from utils.run_script import run_sql_script
+from utils.sql_schema import SHARED_SCHEMAS, get_dependent_views, get_schema_enums
 
 TEMPLATE_PATH = Path("sql") / "reset_db_template.sql"
 DROP_TABLES_PATH = Path("pipelines") / "001b_drop_all_tables.py"
+SCHEMA_PATH = Path("sql") / "schema.sql"
+VIEWS_PATH = Path("sql") / "views.sql"
 
 
-def main():
+def drop_schema(schema: str):
+    """Drop a single schema, the enums used only by its tables and the views that depend on it.
+
+    Shared schemas (geo, metadata, enums, analisis) are left untouched."""
+    if schema in SHARED_SCHEMAS:
+        raise ValueError(f"Shared schema '{schema}' can only be dropped with all the others")
+
+    views = [view.name for view in get_dependent_views(VIEWS_PATH.read_text(), schema)]
+    enums = get_schema_enums(SCHEMA_PATH.read_text(), schema)
+    sql_script = ""
+    if views:
+        sql_script += f"DROP VIEW IF EXISTS {', '.join(views)} CASCADE;\n"
+    sql_script += f"DROP SCHEMA IF EXISTS {schema} CASCADE;\n"
+    if enums:
+        sql_script += f"DROP TYPE IF EXISTS {', '.join(enums)} CASCADE;\n"
+
+    run_sql_script(sql_script)
+    logging.info(f"Dropped schema {schema} with {len(enums)} enums and {len(views)} dependent views")
+
+
+def main(schema: Optional[str] = None):
+    """Drop every schema or, if schema is provided, only that schema (see drop_schema)."""
+    if schema:
+        logging.info(f"Dropping schema {schema}...")
+        drop_schema(schema.lower())
+        return
+
     logging.info("Resetting database schemas..")
 
     # SQL to drop and recreate the public schema
@@ -36,4 +67,7 @@ def main():
 
 if __name__ == "__main__":
     setup_logging()
-    main()
+    parser = argparse.ArgumentParser(description="Drop the database schemas")
+    parser.add_argument("schema", nargs="?", help="If provided, only this schema and its dependent views are dropped")
+    args = parser.parse_args()
+    main(args.schema)
@@ -12,8 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
+    normalize_frame,
     normalize_municipio_id,
     normalize_positive_integer,
     normalize_year,
@@ -53,13 +52,15 @@ def main():
         df = df[df["sexo"] != "Total"]
 
         # Normalize and validate all columns (municipio_id is already validated)
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["sexo"] = apply_and_check_dict(
-            df["sexo"],
-            {"Hombres": "Hombre", "Mujeres": "Mujer"},
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "sexo": {"Hombres": "Hombre", "Mujeres": "Mujer"},
+                "poblacion": normalize_positive_integer,
+                "municipio_id": normalize_municipio_id,
+            },
         )
-        df["poblacion"] = apply_and_check(df["poblacion"], normalize_positive_integer)
-        df["municipio_id"] = apply_and_check(df["municipio_id"], normalize_municipio_id)
 
         # Save cleaned CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -12,9 +12,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
     normalize_age_group,
+    normalize_frame,
     normalize_nationality,
     normalize_positive_integer,
     normalize_year,
@@ -47,11 +46,16 @@ def main():
         df = df[df["sexo"] != "Ambos sexos"]
 
         # Normalize and validate columns
-        df["grupo_edad"] = apply_and_check(df["grupo_edad"], normalize_age_group)
-        df["nacionalidad"] = apply_and_check(df["nacionalidad"], normalize_nationality)
-        df["sexo"] = apply_and_check_dict(df["sexo"], {"Hombres": "Hombre", "Mujeres": "Mujer"})
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["poblacion"] = apply_and_check(df["poblacion"], normalize_positive_integer)
+        df = normalize_frame(
+            df,
+            {
+                "grupo_edad": normalize_age_group,
+                "nacionalidad": normalize_nationality,
+                "sexo": {"Hombres": "Hombre", "Mujeres": "Mujer"},
+                "anio": normalize_year,
+                "poblacion": normalize_positive_integer,
+            },
+        )
 
         # Save to CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -13,9 +13,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
     normalize_age_group,
+    normalize_frame,
     normalize_positive_integer,
     normalize_provincia,
     normalize_year,
@@ -85,18 +84,20 @@ def main():
         df["edad"] = df["edad"].replace({"Menos de 15 años": "<15"})
 
         # Normalize and validate columns
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["sexo"] = apply_and_check_dict(df["sexo"], {"Hombres": "Hombre", "Mujeres": "Mujer"})
-        df["edad"] = apply_and_check(df["edad"], normalize_age_group)
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["matrimonios"] = apply_and_check(df["matrimonios"], normalize_positive_integer)
-        df["estado_civil_anterior"] = apply_and_check_dict(
-            df["estado_civil_anterior"],
+        df = normalize_frame(
+            df,
             {
-                "Total": "Total",
-                "Solteros/Solteras": "Solteros/Solteras",
-                "Viudos/Viudas": "Viudos/Viudas",
-                "Divorciados/Divorciadas": "Divorciados/Divorciadas",
+                "provincia_id": normalize_provincia,
+                "sexo": {"Hombres": "Hombre", "Mujeres": "Mujer"},
+                "edad": normalize_age_group,
+                "anio": normalize_year,
+                "matrimonios": normalize_positive_integer,
+                "estado_civil_anterior": {
+                    "Total": "Total",
+                    "Solteros/Solteras": "Solteros/Solteras",
+                    "Viudos/Viudas": "Viudos/Viudas",
+                    "Divorciados/Divorciadas": "Divorciados/Divorciadas",
+                },
             },
         )
 
@@ -13,8 +13,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
     normalize_age_group,
+    normalize_frame,
     normalize_positive_integer,
     normalize_provincia,
     normalize_year,
@@ -79,12 +79,17 @@ def main():
         df["conyuge_2_grupo_edad"] = df["conyuge_2_grupo_edad"].replace("Menos de 15 años", "<15")
 
         # Normalize and validate data
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["conyuge_1_grupo_edad"] = apply_and_check(df["conyuge_1_grupo_edad"], normalize_age_group)
-        df["conyuge_2_grupo_edad"] = apply_and_check(df["conyuge_2_grupo_edad"], normalize_age_group)
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["matrimonios_hombres"] = apply_and_check(df["matrimonios_hombres"], normalize_positive_integer)
-        df["matrimonios_mujeres"] = apply_and_check(df["matrimonios_mujeres"], normalize_positive_integer)
+        df = normalize_frame(
+            df,
+            {
+                "provincia_id": normalize_provincia,
+                "conyuge_1_grupo_edad": normalize_age_group,
+                "conyuge_2_grupo_edad": normalize_age_group,
+                "anio": normalize_year,
+                "matrimonios_hombres": normalize_positive_integer,
+                "matrimonios_mujeres": normalize_positive_integer,
+            },
+        )
 
         # Save to CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -12,9 +12,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
     normalize_age_group,
+    normalize_frame,
     normalize_positive_float,
     normalize_provincia,
     normalize_year,
@@ -61,11 +60,16 @@ def main():
         df = df[df["provincia_id"] != "Total Nacional"]
 
         # Normalize and validate data
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["grupo_edad"] = apply_and_check(df["grupo_edad"], normalize_age_group)
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["tasa_divorcialidad"] = apply_and_check(df["tasa_divorcialidad"], normalize_positive_float)
-        df["sexo"] = apply_and_check_dict(df["sexo"], {"Hombres": "Hombre", "Mujeres": "Mujer"})
+        df = normalize_frame(
+            df,
+            {
+                "provincia_id": normalize_provincia,
+                "grupo_edad": normalize_age_group,
+                "anio": normalize_year,
+                "tasa_divorcialidad": normalize_positive_float,
+                "sexo": {"Hombres": "Hombre", "Mujeres": "Mujer"},
+            },
+        )
 
         # Save to CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
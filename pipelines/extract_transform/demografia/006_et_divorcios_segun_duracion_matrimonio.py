@@ -2,7 +2,7 @@
 Sources:
     INE008
 Target tables:
-    divrorcios_segun_duracion_matrimonio
+    divorcios_segun_duracion_matrimonio
 """
 
 import logging
@@ -12,7 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
+    normalize_frame,
     normalize_plain_text,
     normalize_positive_float,
     normalize_provincia,
@@ -56,10 +56,15 @@ def main():
         df = df[df["provincia_id"] != "Total Nacional"]
 
         # Normalize and validate data
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["duracion_matrimonio"] = apply_and_check(df["duracion_matrimonio"], normalize_plain_text)
-        df["porcentaje_divorcios"] = apply_and_check(df["porcentaje_divorcios"], normalize_positive_float)
+        df = normalize_frame(
+            df,
+            {
+                "provincia_id": normalize_provincia,
+                "anio": normalize_year,
+                "duracion_matrimonio": normalize_plain_text,
+                "porcentaje_divorcios": normalize_positive_float,
+            },
+        )
 
         # Save to CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
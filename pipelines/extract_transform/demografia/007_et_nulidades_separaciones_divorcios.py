@@ -12,7 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
+    normalize_frame,
     normalize_plain_text,
     normalize_positive_integer,
     normalize_provincia,
@@ -52,10 +52,15 @@ def main():
         df = df[df["tipo_disolucion"] != "Total"]
 
         # Normalize and validate data
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["tipo_disolucion"] = apply_and_check(df["tipo_disolucion"], normalize_plain_text)
-        df["disoluciones_matrimoniales"] = apply_and_check(df["disoluciones_matrimoniales"], normalize_positive_integer)
+        df = normalize_frame(
+            df,
+            {
+                "provincia_id": normalize_provincia,
+                "anio": normalize_year,
+                "tipo_disolucion": normalize_plain_text,
+                "disoluciones_matrimoniales": normalize_positive_integer,
+            },
+        )
 
         # Save to CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -12,10 +12,9 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
     normalize_age_group,
     normalize_comunidad_autonoma,
+    normalize_frame,
     normalize_plain_text,
     normalize_positive_float,
     normalize_year,
@@ -61,12 +60,17 @@ def main():
         )
 
         # Normalize and validate columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["sexo"] = apply_and_check_dict(df["sexo"], {"Hombre": "Hombre", "Mujer": "Mujer"})
-        df["grupo_edad"] = apply_and_check(df["grupo_edad"], normalize_age_group)
-        df["estado_civil"] = apply_and_check(df["estado_civil"], normalize_plain_text)
-        df["hogares_monoparentales"] = apply_and_check(df["hogares_monoparentales"], normalize_positive_float)
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "sexo": {"Hombre": "Hombre", "Mujer": "Mujer"},
+                "grupo_edad": normalize_age_group,
+                "estado_civil": normalize_plain_text,
+                "hogares_monoparentales": normalize_positive_float,
+            },
+        )
 
         # Save to CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -12,7 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
+    normalize_frame,
     normalize_positive_float,
     normalize_provincia,
     normalize_year,
@@ -41,9 +41,14 @@ def main():
         df = df[df["provincia_id"] != "Total Nacional"]
 
         # Validate and normalize columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["tasa_bruta_natalidad"] = apply_and_check(df["tasa_bruta_natalidad"], normalize_positive_float)
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "provincia_id": normalize_provincia,
+                "tasa_bruta_natalidad": normalize_positive_float,
+            },
+        )
 
         # Save to CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -13,9 +13,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
     normalize_comunidad_autonoma,
+    normalize_frame,
     normalize_plain_text,
     normalize_positive_integer,
     normalize_year,
@@ -125,12 +124,17 @@ def main():
         df = pd.concat([df_2009, df_2002], ignore_index=True)
 
         # Validate and normalize columns
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["sexo"] = apply_and_check_dict(df["sexo"], {"Varones": "Hombre", "Mujeres": "Mujer"})
-        df["actividad"] = apply_and_check(df["actividad"], normalize_plain_text)
-        df["horas"] = apply_and_check(df["horas"], normalize_positive_integer)
-        df["minutos"] = apply_and_check(df["minutos"], normalize_positive_integer)
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
+        df = normalize_frame(
+            df,
+            {
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "sexo": {"Varones": "Hombre", "Mujeres": "Mujer"},
+                "actividad": normalize_plain_text,
+                "horas": normalize_positive_integer,
+                "minutos": normalize_positive_integer,
+                "anio": normalize_year,
+            },
+        )
 
         # Save to CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -12,8 +12,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
     normalize_comunidad_autonoma,
+    normalize_frame,
     normalize_positive_float,
     normalize_year,
 )
@@ -42,9 +42,14 @@ def main():
         df["tasa_bruta_divorcialidad"] = df["tasa_bruta_divorcialidad"].str.replace(",", ".").astype(float)
 
         # Validate and normalize columns
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["tasa_bruta_divorcialidad"] = apply_and_check(df["tasa_bruta_divorcialidad"], normalize_positive_float)
+        df = normalize_frame(
+            df,
+            {
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "anio": normalize_year,
+                "tasa_bruta_divorcialidad": normalize_positive_float,
+            },
+        )
 
         # Save to CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -12,8 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
+    normalize_frame,
     normalize_positive_float,
     normalize_provincia,
     normalize_quarter,
@@ -48,17 +47,19 @@ def main():
         df["total"] = df["total"].astype(str).str.replace(",", ".", regex=False).astype(float)
 
         # Normalize and validate columns
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["trimestre"] = apply_and_check(df["trimestre"], normalize_quarter)
-        df["total"] = apply_and_check(df["total"], normalize_positive_float)
-        df["sexo"] = apply_and_check_dict(df["sexo"], {"Hombres": "Hombre", "Mujeres": "Mujer", "Ambos sexos": "Total"})
-        df["tasa"] = apply_and_check_dict(
-            df["tasa"],
+        df = normalize_frame(
+            df,
             {
-                "Tasa de actividad": "Tasa de actividad",
-                "Tasa de paro de la población": "Tasa de paro",
-                "Tasa de empleo de la población": "Tasa de empleo",
+                "provincia_id": normalize_provincia,
+                "anio": normalize_year,
+                "trimestre": normalize_quarter,
+                "total": normalize_positive_float,
+                "sexo": {"Hombres": "Hombre", "Mujeres": "Mujer", "Ambos sexos": "Total"},
+                "tasa": {
+                    "Tasa de actividad": "Tasa de actividad",
+                    "Tasa de paro de la población": "Tasa de paro",
+                    "Tasa de empleo de la población": "Tasa de empleo",
+                },
             },
         )
 
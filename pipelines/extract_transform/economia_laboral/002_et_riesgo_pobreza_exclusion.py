@@ -12,9 +12,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
     normalize_comunidad_autonoma,
+    normalize_frame,
     normalize_positive_float,
     normalize_year,
 )
@@ -39,16 +38,18 @@ def main():
         )
 
         # Normalize and validate columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["porcentaje"] = apply_and_check(df["porcentaje"], normalize_positive_float)
-        df["indicador"] = apply_and_check_dict(
-            df["indicador"],
+        df = normalize_frame(
+            df,
             {
-                "Tasa de riesgo de pobreza o exclusión social (indicador AROPE)": "Tasa de riesgo de pobreza o exclusión social (indicador AROPE)",  # noqa: E501
-                "En riesgo de pobreza (renta año anterior a la entrevista)": "En riesgo de pobreza (renta año anterior a la entrevista)",  # noqa: E501
-                "Con carencia material severa": "Con carencia material severa",
-                "Viviendo en hogares con baja intensidad en el trabajo (de 0 a 59 años)": "Viviendo en hogares con baja intensidad en el trabajo (de 0 a 59 años)",  # noqa: E501
+                "anio": normalize_year,
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "porcentaje": normalize_positive_float,
+                "indicador": {
+                    "Tasa de riesgo de pobreza o exclusión social (indicador AROPE)": "Tasa de riesgo de pobreza o exclusión social (indicador AROPE)",  # noqa: E501
+                    "En riesgo de pobreza (renta año anterior a la entrevista)": "En riesgo de pobreza (renta año anterior a la entrevista)",  # noqa: E501
+                    "Con carencia material severa": "Con carencia material severa",
+                    "Viviendo en hogares con baja intensidad en el trabajo (de 0 a 59 años)": "Viviendo en hogares con baja intensidad en el trabajo (de 0 a 59 años)",  # noqa: E501
+                },
             },
         )
 
@@ -12,9 +12,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
     normalize_comunidad_autonoma,
+    normalize_frame,
     normalize_positive_float,
     normalize_quarter,
     normalize_year,
@@ -50,11 +49,16 @@ def main():
         )
 
         # Normalize and validate columns
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["trimestre"] = apply_and_check(df["trimestre"], normalize_quarter)
-        df["tasa_paro"] = apply_and_check(df["tasa_paro"], normalize_positive_float)
-        df["sexo"] = apply_and_check_dict(df["sexo"], {"Hombres": "Hombre", "Mujeres": "Mujer", "Ambos sexos": "Total"})
+        df = normalize_frame(
+            df,
+            {
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "anio": normalize_year,
+                "trimestre": normalize_quarter,
+                "tasa_paro": normalize_positive_float,
+                "sexo": {"Hombres": "Hombre", "Mujeres": "Mujer", "Ambos sexos": "Total"},
+            },
+        )
 
         # Save to CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
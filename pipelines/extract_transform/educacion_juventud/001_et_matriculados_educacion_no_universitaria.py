@@ -13,8 +13,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
+    normalize_frame,
     normalize_plain_text,
     normalize_positive_integer,
     normalize_provincia,
@@ -304,19 +303,21 @@ def main():
         df = df[df["ensenianza"] != "TOTAL"]
 
         # Validate and normalize columns
-        df["titularidad"] = apply_and_check_dict(
-            df["titularidad"],
+        df = normalize_frame(
+            df,
             {
-                "Público": "Público",
-                "Privado": "Privado",
-                "Privado concertado": "Privado concertado",
-                "Privado no concertado": "Privado no concertado",
+                "titularidad": {
+                    "Público": "Público",
+                    "Privado": "Privado",
+                    "Privado concertado": "Privado concertado",
+                    "Privado no concertado": "Privado no concertado",
+                },
+                "sexo": {"Hombres": "Hombre", "Mujeres": "Mujer"},
+                "provincia_id": normalize_provincia,
+                "ensenianza": normalize_plain_text,
+                "matriculados": normalize_positive_integer,
             },
         )
-        df["sexo"] = apply_and_check_dict(df["sexo"], {"Hombres": "Hombre", "Mujeres": "Mujer"})
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["ensenianza"] = apply_and_check(df["ensenianza"], normalize_plain_text)
-        df["matriculados"] = apply_and_check(df["matriculados"], normalize_positive_integer)
 
         # Save cleaned CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
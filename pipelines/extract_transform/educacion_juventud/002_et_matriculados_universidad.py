@@ -12,9 +12,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
     normalize_comunidad_autonoma,
+    normalize_frame,
     normalize_plain_text,
     normalize_positive_integer,
 )
@@ -74,14 +73,19 @@ def main():
         df["curso"] = df["curso"].str.replace(r"(\d{4})-\d{2}(\d{2})", r"\1-\2", regex=True)
 
         # Validate and normalize columns
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["nivel_academico"] = apply_and_check(df["nivel_academico"], normalize_plain_text)
-        df["tipo_universidad"] = apply_and_check(df["tipo_universidad"], normalize_plain_text)
-        df["modalidad_universidad"] = apply_and_check(df["modalidad_universidad"], normalize_plain_text)
-        df["sexo"] = apply_and_check_dict(df["sexo"], {"Hombres": "Hombre", "Mujeres": "Mujer", "Ambos sexos": "Total"})
-        df["rama_conocimiento"] = apply_and_check(df["rama_conocimiento"], normalize_plain_text)
-        df["curso"] = apply_and_check(df["curso"], normalize_plain_text)
-        df["matriculados"] = apply_and_check(df["matriculados"], normalize_positive_integer)
+        df = normalize_frame(
+            df,
+            {
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "nivel_academico": normalize_plain_text,
+                "tipo_universidad": normalize_plain_text,
+                "modalidad_universidad": normalize_plain_text,
+                "sexo": {"Hombres": "Hombre", "Mujeres": "Mujer", "Ambos sexos": "Total"},
+                "rama_conocimiento": normalize_plain_text,
+                "curso": normalize_plain_text,
+                "matriculados": normalize_positive_integer,
+            },
+        )
 
         # Save cleaned CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
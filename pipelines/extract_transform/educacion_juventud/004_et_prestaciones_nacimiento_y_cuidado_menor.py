@@ -13,7 +13,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
+    normalize_frame,
     normalize_positive_float,
     normalize_positive_integer,
     normalize_provincia,
@@ -122,15 +122,16 @@ def main():
         df = get_df_from_all_excels(raw_xlsx_paths)
 
         # Validate and normalize columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["prestaciones_primer_progenitor"] = apply_and_check(
-            df["prestaciones_primer_progenitor"], normalize_positive_integer
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "provincia_id": normalize_provincia,
+                "prestaciones_primer_progenitor": normalize_positive_integer,
+                "prestaciones_segundo_progenitor": normalize_positive_integer,
+                "importe_miles_euros": normalize_positive_float,
+            },
         )
-        df["prestaciones_segundo_progenitor"] = apply_and_check(
-            df["prestaciones_segundo_progenitor"], normalize_positive_integer
-        )
-        df["importe_miles_euros"] = apply_and_check(df["importe_miles_euros"], normalize_positive_float)
 
         # Save cleaned CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -13,8 +13,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
+    normalize_frame,
     normalize_positive_integer,
     normalize_provincia,
     normalize_year,
@@ -179,22 +178,21 @@ def main():
         df["excedencias"] = df["excedencias"].replace("-", None)
 
         # Validate and normalize columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["motivo"] = apply_and_check_dict(
-            df["motivo"],
+        df = normalize_frame(
+            df,
             {
-                "EXCEDENCIAS POR CUIDADO FAMILIAR: CUIDADO DE HIJOS": "Cuidado de hijos",
-                "EXCEDENCIAS POR CUIDADO FAMILIAR: CUIDADO DE FAMILIARES": "Cuidado de familiares",
-                "EXCEDENCIAS POR CUIDADO DE HIJOS": "Cuidado de hijos",
-                "EXCEDENCIAS POR CUIDADO DE FAMILIARES": "Cuidado de familiares",
+                "anio": normalize_year,
+                "provincia_id": normalize_provincia,
+                "motivo": {
+                    "EXCEDENCIAS POR CUIDADO FAMILIAR: CUIDADO DE HIJOS": "Cuidado de hijos",
+                    "EXCEDENCIAS POR CUIDADO FAMILIAR: CUIDADO DE FAMILIARES": "Cuidado de familiares",
+                    "EXCEDENCIAS POR CUIDADO DE HIJOS": "Cuidado de hijos",
+                    "EXCEDENCIAS POR CUIDADO DE FAMILIARES": "Cuidado de familiares",
+                },
+                "sexo": {"MUJERES": "Mujer", "VARONES": "Hombre", "Mujeres": "Mujer", "Varones": "Hombre"},
+                "excedencias": normalize_positive_integer,
             },
         )
-        df["sexo"] = apply_and_check_dict(
-            df["sexo"],
-            {"MUJERES": "Mujer", "VARONES": "Hombre", "Mujeres": "Mujer", "Varones": "Hombre"},
-        )
-        df["excedencias"] = apply_and_check(df["excedencias"], normalize_positive_integer)
 
         # Save cleaned CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -16,8 +16,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
+    normalize_frame,
     normalize_positive_float,
     normalize_positive_integer,
     normalize_provincia,
@@ -385,18 +384,20 @@ def main():
         df["importe_miles_euros"] = pd.to_numeric(df["importe_miles_euros"], errors="coerce").round(2)
 
         # Validate and normalize data
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["tipo"] = apply_and_check_dict(
-            df["tipo"],
+        df = normalize_frame(
+            df,
             {
-                "Maternidad": "Maternidad",
-                "Paternidad": "Paternidad",
+                "anio": normalize_year,
+                "provincia_id": normalize_provincia,
+                "tipo": {
+                    "Maternidad": "Maternidad",
+                    "Paternidad": "Paternidad",
+                },
+                "percibidas_madre": normalize_positive_integer,
+                "percibidas_padre": normalize_positive_integer,
+                "importe_miles_euros": normalize_positive_float,
             },
         )
-        df["percibidas_madre"] = apply_and_check(df["percibidas_madre"], normalize_positive_integer)
-        df["percibidas_padre"] = apply_and_check(df["percibidas_padre"], normalize_positive_integer)
-        df["importe_miles_euros"] = apply_and_check(df["importe_miles_euros"], normalize_positive_float)
 
         # Save cleaned CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
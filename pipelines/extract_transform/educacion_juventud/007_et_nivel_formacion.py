@@ -12,10 +12,9 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
     normalize_age_group,
     normalize_comunidad_autonoma,
+    normalize_frame,
     normalize_positive_float,
     normalize_year,
 )
@@ -45,19 +44,21 @@ def main():
         df = df.fillna({"comunidad_autonoma_id": "Total Nacional"})
 
         # Validate and normalize columns
-        df["grupo_edad"] = apply_and_check(df["grupo_edad"], normalize_age_group)
-        df["nivel_formacion"] = apply_and_check_dict(
-            df["nivel_formacion"],
+        df = normalize_frame(
+            df,
             {
-                "Nivel 0-2": "Nivel 0-2",
-                "Nivel 3-8": "Nivel 3-8",
-                "Nivel 3-4": "Nivel 3-4",
-                "Nivel 5-8": "Nivel 5-8",
+                "grupo_edad": normalize_age_group,
+                "nivel_formacion": {
+                    "Nivel 0-2": "Nivel 0-2",
+                    "Nivel 3-8": "Nivel 3-8",
+                    "Nivel 3-4": "Nivel 3-4",
+                    "Nivel 5-8": "Nivel 5-8",
+                },
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "anio": normalize_year,
+                "porcentaje": normalize_positive_float,
             },
         )
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["porcentaje"] = apply_and_check(df["porcentaje"], normalize_positive_float)
 
         # Save the cleaned DataFrame to a CSV file
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
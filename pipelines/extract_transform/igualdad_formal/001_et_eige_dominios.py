@@ -12,8 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
+    normalize_frame,
     normalize_nationality,
     normalize_positive_float,
     normalize_year,
@@ -67,10 +66,15 @@ def main():
         }
 
         # Normalize and valitate all columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["pais_id"] = apply_and_check(df["pais_id"], normalize_nationality)
-        df["dominio_subdominio"] = apply_and_check_dict(df["dominio_subdominio"], dominio_subdominio_mapping)
-        df["valor"] = apply_and_check(df["valor"], normalize_positive_float)
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "pais_id": normalize_nationality,
+                "dominio_subdominio": dominio_subdominio_mapping,
+                "valor": normalize_positive_float,
+            },
+        )
 
         # Save to clean data
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
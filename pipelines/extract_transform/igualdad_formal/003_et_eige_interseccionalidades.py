@@ -12,8 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
+    normalize_frame,
     normalize_nationality,
     normalize_plain_text,
     normalize_positive_integer,
@@ -74,12 +73,17 @@ def main():
         }
 
         # Normalize and validate all columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["pais_id"] = apply_and_check(df["pais_id"], normalize_nationality)
-        df["valor"] = apply_and_check(df["valor"], normalize_positive_integer)
-        df["interseccionalidad"] = apply_and_check_dict(df["interseccionalidad"], interseccionalidad_map)
-        df["indicador"] = apply_and_check(df["indicador"], normalize_plain_text)
-        df["sexo"] = apply_and_check_dict(df["sexo"], {"Men": "Hombre", "Women": "Mujer"})
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "pais_id": normalize_nationality,
+                "valor": normalize_positive_integer,
+                "interseccionalidad": interseccionalidad_map,
+                "indicador": normalize_plain_text,
+                "sexo": {"Men": "Hombre", "Women": "Mujer"},
+            },
+        )
 
         # Save to clean CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -13,9 +13,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
     normalize_comunidad_autonoma,
+    normalize_frame,
     normalize_plain_text,
     normalize_positive_float,
     normalize_year,
@@ -84,19 +83,21 @@ def main():
         df["ganancia_por_hora_trabajo"] = df["ganancia_por_hora_trabajo"].str.replace(",", ".")
 
         # Normalize and validate all columns
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["sector_actividad"] = apply_and_check(df["sector_actividad"], normalize_plain_text)
-        df["sexo"] = apply_and_check_dict(
-            df["sexo"],
+        df = normalize_frame(
+            df,
             {
-                "Hombres": "Hombre",
-                "Varones": "Hombre",
-                "Mujeres": "Mujer",
-                "Ambos sexos": "Total",
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "sector_actividad": normalize_plain_text,
+                "sexo": {
+                    "Hombres": "Hombre",
+                    "Varones": "Hombre",
+                    "Mujeres": "Mujer",
+                    "Ambos sexos": "Total",
+                },
+                "anio": normalize_year,
+                "ganancia_por_hora_trabajo": normalize_positive_float,
             },
         )
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["ganancia_por_hora_trabajo"] = apply_and_check(df["ganancia_por_hora_trabajo"], normalize_positive_float)
 
         # Save to clean CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
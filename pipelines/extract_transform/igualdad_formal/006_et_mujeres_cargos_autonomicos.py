@@ -12,9 +12,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
     normalize_comunidad_autonoma,
+    normalize_frame,
     normalize_positive_integer,
     normalize_year,
 )
@@ -60,10 +59,15 @@ def main():
         df = pd.concat([df_ambos_sexos, df_mujeres, df_hombres], ignore_index=True)
 
         # Valiedate and normalize columns
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["numero_cargos"] = apply_and_check(df["numero_cargos"], normalize_positive_integer)
-        df["sexo"] = apply_and_check_dict(df["sexo"], {"Hombre": "Hombre", "Mujer": "Mujer", "Total": "Total"})
+        df = normalize_frame(
+            df,
+            {
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "anio": normalize_year,
+                "numero_cargos": normalize_positive_integer,
+                "sexo": {"Hombre": "Hombre", "Mujer": "Mujer", "Total": "Total"},
+            },
+        )
 
         # Save to clean CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
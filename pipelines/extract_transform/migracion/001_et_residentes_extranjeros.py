@@ -15,10 +15,9 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
     normalize_age_group,
     normalize_date,
+    normalize_frame,
     normalize_nationality,
     normalize_positive_integer,
     normalize_provincia,
@@ -532,23 +531,21 @@ def main():
         df = df.where(pd.notnull(df), None)
 
         # Normalize and validate columns
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["nacionalidad"] = apply_and_check(df["nacionalidad"], normalize_nationality)
-        df["tipo_documentacion"] = apply_and_check_dict(
-            df["tipo_documentacion"],
-            {v: v for v in ["Autorización", "Certificado de registro", "TIE-Acuerdo de Retirada"]},
-        )
-        df["sexo"] = apply_and_check_dict(df["sexo"], {"Hombres": "Hombre", "Mujeres": "Mujer"})
-        df["es_nacido_espania"] = apply_and_check_dict(
-            df["es_nacido_espania"],
-            {"España": True, "Extranjero": False},
-        )
-        df["grupo_edad"] = apply_and_check(df["grupo_edad"], normalize_age_group)
-        df["fecha"] = apply_and_check(df["fecha"], normalize_date)
-        df["residentes_extranjeros"] = apply_and_check(df["residentes_extranjeros"], normalize_positive_integer)
-        df["regimen"] = apply_and_check_dict(
-            df["regimen"],
-            {v: v for v in ["Régimen General", "Régimen de libre circulación UE"]},
+        df = normalize_frame(
+            df,
+            {
+                "provincia_id": normalize_provincia,
+                "nacionalidad": normalize_nationality,
+                "tipo_documentacion": {
+                    v: v for v in ["Autorización", "Certificado de registro", "TIE-Acuerdo de Retirada"]
+                },
+                "sexo": {"Hombres": "Hombre", "Mujeres": "Mujer"},
+                "es_nacido_espania": {"España": True, "Extranjero": False},
+                "grupo_edad": normalize_age_group,
+                "fecha": normalize_date,
+                "residentes_extranjeros": normalize_positive_integer,
+                "regimen": {v: v for v in ["Régimen General", "Régimen de libre circulación UE"]},
+            },
         )
 
         # Save to CSV
@@ -17,10 +17,9 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
     normalize_comunidad_autonoma,
     normalize_date,
+    normalize_frame,
     normalize_plain_text,
     normalize_positive_integer,
     normalize_provincia,
@@ -432,23 +431,26 @@ def main():
         df = df.rename(columns={"provincia": "provincia_id", "comunidad_autonoma": "comunidad_autonoma_id"})
 
         # Validate and normalize columns
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["fecha"] = apply_and_check(df["fecha"], normalize_date)
-        df["codigo_estudio"] = apply_and_check(df["codigo_estudio"], normalize_plain_text)
-        df["cuestionario"] = apply_and_check(df["cuestionario"], normalize_positive_integer)
-        df["edad"] = apply_and_check(df["edad"], normalize_positive_integer)
-        df["sexo"] = apply_and_check_dict(
-            df["sexo"], {"Hombre": "Hombre", "Mujer": "Mujer", "hombre": "Hombre", "mujer": "Mujer"}
+        df = normalize_frame(
+            df,
+            {
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "provincia_id": normalize_provincia,
+                "fecha": normalize_date,
+                "codigo_estudio": normalize_plain_text,
+                "cuestionario": normalize_positive_integer,
+                "edad": normalize_positive_integer,
+                "sexo": {"Hombre": "Hombre", "Mujer": "Mujer", "hombre": "Hombre", "mujer": "Mujer"},
+                "ideologia": normalize_positive_integer,
+                "religiosidad": religiosidad_map,
+                "problema_espania_1": normalize_plain_text,
+                "problema_espania_2": normalize_plain_text,
+                "problema_espania_3": normalize_plain_text,
+                "problema_personal_1": normalize_plain_text,
+                "problema_personal_2": normalize_plain_text,
+                "problema_personal_3": normalize_plain_text,
+            },
         )
-        df["ideologia"] = apply_and_check(df["ideologia"], normalize_positive_integer)
-        df["religiosidad"] = apply_and_check_dict(df["religiosidad"], religiosidad_map)
-        df["problema_espania_1"] = apply_and_check(df["problema_espania_1"], normalize_plain_text)
-        df["problema_espania_2"] = apply_and_check(df["problema_espania_2"], normalize_plain_text)
-        df["problema_espania_3"] = apply_and_check(df["problema_espania_3"], normalize_plain_text)
-        df["problema_personal_1"] = apply_and_check(df["problema_personal_1"], normalize_plain_text)
-        df["problema_personal_2"] = apply_and_check(df["problema_personal_2"], normalize_plain_text)
-        df["problema_personal_3"] = apply_and_check(df["problema_personal_3"], normalize_plain_text)
 
         # Fill up comunidad_autonoma_id for entries with provincia_id but missing comunidad_autonoma_id
         provincias_df = pd.read_csv(PROVINCIAS_CSV_PATH, sep=";")
@@ -15,9 +15,9 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
     normalize_comunidad_autonoma,
     normalize_date,
+    normalize_frame,
     normalize_json_string,
     normalize_plain_text,
     normalize_positive_integer,
@@ -53,14 +53,17 @@ def main():
         df_json["variables_json"] = df.apply(lambda x: x.to_dict(), axis=1).apply(json.dumps)
 
         # Normalize and validate columns
-        df_json["variables_json"] = apply_and_check(df_json["variables_json"], normalize_json_string)
-        df_json["comunidad_autonoma_id"] = apply_and_check(
-            df_json["comunidad_autonoma_id"], normalize_comunidad_autonoma
+        df_json = normalize_frame(
+            df_json,
+            {
+                "variables_json": normalize_json_string,
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "provincia_id": normalize_provincia,
+                "codigo_estudio": normalize_plain_text,
+                "cuestionario": normalize_positive_integer,
+                "fecha": normalize_date,
+            },
         )
-        df_json["provincia_id"] = apply_and_check(df_json["provincia_id"], normalize_provincia)
-        df_json["codigo_estudio"] = apply_and_check(df_json["codigo_estudio"], normalize_plain_text)
-        df_json["cuestionario"] = apply_and_check(df_json["cuestionario"], normalize_positive_integer)
-        df_json["fecha"] = apply_and_check(df_json["fecha"], normalize_date)
 
         # Save to clean CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -12,7 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
+    normalize_frame,
     normalize_month,
     normalize_plain_text,
     normalize_positive_integer,
@@ -51,11 +51,16 @@ def main():
         )
 
         # Validate and normalize columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["mes"] = apply_and_check(df["mes"], normalize_month)
-        df["candidatura"] = apply_and_check(df["candidatura"], normalize_plain_text)
-        df["votos"] = apply_and_check(df["votos"], normalize_positive_integer)
-        df["representantes"] = apply_and_check(df["representantes"], normalize_positive_integer)
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "mes": normalize_month,
+                "candidatura": normalize_plain_text,
+                "votos": normalize_positive_integer,
+                "representantes": normalize_positive_integer,
+            },
+        )
 
         # Save to clean CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
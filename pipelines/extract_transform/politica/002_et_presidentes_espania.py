@@ -12,9 +12,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
     normalize_date,
+    normalize_frame,
     normalize_plain_text,
 )
 
@@ -41,18 +40,20 @@ def main():
         df = df.drop(columns=["Observaciones"])
 
         # Validate and normalize columns
-        df["legislatura"] = apply_and_check(df["legislatura"], normalize_plain_text)
-        df["presidente"] = apply_and_check(df["presidente"], normalize_plain_text)
-        df["nombramiento"] = apply_and_check(df["nombramiento"], normalize_date)
-        df["cese"] = apply_and_check(df["cese"], normalize_date)
-        df["partidos_gobierno"] = apply_and_check(df["partidos_gobierno"], normalize_plain_text)
-        df["tipo_mayoria"] = apply_and_check_dict(
-            df["tipo_mayoria"],
+        df = normalize_frame(
+            df,
             {
-                "Mayoría simple": "Simple",
-                "Mayoría absoluta": "Absoluta",
-                "En funciones": "En funciones",
-                "Minoría": "Minoría",
+                "legislatura": normalize_plain_text,
+                "presidente": normalize_plain_text,
+                "nombramiento": normalize_date,
+                "cese": normalize_date,
+                "partidos_gobierno": normalize_plain_text,
+                "tipo_mayoria": {
+                    "Mayoría simple": "Simple",
+                    "Mayoría absoluta": "Absoluta",
+                    "En funciones": "En funciones",
+                    "Minoría": "Minoría",
+                },
             },
         )
 
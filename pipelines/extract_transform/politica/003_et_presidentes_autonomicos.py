@@ -12,9 +12,9 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
     normalize_comunidad_autonoma,
     normalize_date,
+    normalize_frame,
     normalize_plain_text,
 )
 
@@ -28,11 +28,16 @@ def main():
         df = pd.read_csv(RAW_CSV_PATH, sep=";")
 
         # Validate and normalize columns
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["legislatura"] = apply_and_check(df["legislatura"], normalize_plain_text)
-        df["presidente"] = apply_and_check(df["presidente"], normalize_plain_text)
-        df["nombramiento"] = apply_and_check(df["nombramiento"], normalize_date)
-        df["partido"] = apply_and_check(df["partido"], normalize_plain_text)
+        df = normalize_frame(
+            df,
+            {
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "legislatura": normalize_plain_text,
+                "presidente": normalize_plain_text,
+                "nombramiento": normalize_date,
+                "partido": normalize_plain_text,
+            },
+        )
 
         # Save to clean CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -12,9 +12,9 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
     normalize_comunidad_autonoma,
     normalize_date,
+    normalize_frame,
     normalize_plain_text,
     normalize_positive_integer,
 )
@@ -29,11 +29,16 @@ def main():
         df = pd.read_csv(RAW_CSV_PATH, sep=";", keep_default_na=False, na_values=[])
 
         # Validate and normalize columns
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["fecha"] = apply_and_check(df["fecha"], normalize_date)
-        df["candidatura"] = apply_and_check(df["candidatura"], normalize_plain_text)
-        df["votos"] = apply_and_check(df["votos"], normalize_positive_integer)
-        df["representantes"] = apply_and_check(df["representantes"], normalize_positive_integer)
+        df = normalize_frame(
+            df,
+            {
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "fecha": normalize_date,
+                "candidatura": normalize_plain_text,
+                "votos": normalize_positive_integer,
+                "representantes": normalize_positive_integer,
+            },
+        )
 
         # Save to clean CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
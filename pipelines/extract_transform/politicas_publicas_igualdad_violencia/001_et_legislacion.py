@@ -12,10 +12,9 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
     normalize_comunidad_autonoma,
     normalize_date,
+    normalize_frame,
     normalize_plain_text,
 )
 
@@ -47,14 +46,17 @@ def main():
         df["vigente"] = df["vigente"].apply(lambda x: False if str(x).strip().upper() == "DEROGADA" else True)
 
         # Validate and normalize columns
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["nombre"] = apply_and_check(df["nombre"], normalize_plain_text)
-        df["enlace_boe"] = apply_and_check(df["enlace_boe"], normalize_plain_text)
-        df["tematica"] = apply_and_check_dict(
-            df["tematica"], {"VIOLENCIA": "Violencia de género", "IGUALDAD": "Igualdad"}
+        df = normalize_frame(
+            df,
+            {
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "nombre": normalize_plain_text,
+                "enlace_boe": normalize_plain_text,
+                "tematica": {"VIOLENCIA": "Violencia de género", "IGUALDAD": "Igualdad"},
+                "fecha_aprobacion": normalize_date,
+                "fecha_derogacion": normalize_date,
+            },
         )
-        df["fecha_aprobacion"] = apply_and_check(df["fecha_aprobacion"], normalize_date)
-        df["fecha_derogacion"] = apply_and_check(df["fecha_derogacion"], normalize_date)
 
         # Save to clean CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
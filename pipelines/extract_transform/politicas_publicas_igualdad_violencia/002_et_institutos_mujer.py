@@ -12,8 +12,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
     normalize_comunidad_autonoma,
+    normalize_frame,
     normalize_plain_text,
     normalize_year,
 )
@@ -38,10 +38,15 @@ def main():
         )
 
         # Validate and normalize columns
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["nombre"] = apply_and_check(df["nombre"], normalize_plain_text)
-        df["anio_fundacion"] = apply_and_check(df["anio_fundacion"], normalize_year)
-        df["enlace"] = apply_and_check(df["enlace"], normalize_plain_text)
+        df = normalize_frame(
+            df,
+            {
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "nombre": normalize_plain_text,
+                "anio_fundacion": normalize_year,
+                "enlace": normalize_plain_text,
+            },
+        )
 
         # Save to clean CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -12,7 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
+    normalize_frame,
     normalize_positive_integer,
     normalize_provincia,
     normalize_year,
@@ -363,13 +363,18 @@ def main():
         df = pd.concat([df_2022, df_2020, df_2017], ignore_index=True)
 
         # Validate and normalize columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["centros"] = apply_and_check(df["centros"], normalize_positive_integer)
-        df["plazas"] = apply_and_check(df["plazas"], normalize_positive_integer)
-        df["profesionales"] = apply_and_check(df["profesionales"], normalize_positive_integer)
-        df["mujeres_acogidas"] = apply_and_check(df["mujeres_acogidas"], normalize_positive_integer)
-        df["hijos_a_cargo_acogidos"] = apply_and_check(df["hijos_a_cargo_acogidos"], normalize_positive_integer)
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "provincia_id": normalize_provincia,
+                "centros": normalize_positive_integer,
+                "plazas": normalize_positive_integer,
+                "profesionales": normalize_positive_integer,
+                "mujeres_acogidas": normalize_positive_integer,
+                "hijos_a_cargo_acogidos": normalize_positive_integer,
+            },
+        )
 
         # Save to clean CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
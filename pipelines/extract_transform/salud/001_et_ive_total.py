@@ -1,7 +1,7 @@
 """Extract and transform data
 Sources:
     MINSANIDAD001
-Target tables
+Target tables:
     ive_total
 """
 
@@ -12,7 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
+    normalize_frame,
     normalize_positive_float,
     normalize_positive_integer,
     normalize_year,
@@ -39,10 +39,15 @@ def main():
         )
 
         # Normalize and validate columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["centros_notificadores"] = apply_and_check(df["centros_notificadores"], normalize_positive_integer)
-        df["ives"] = apply_and_check(df["ives"], normalize_positive_integer)
-        df["tasa"] = apply_and_check(df["tasa"], normalize_positive_float)
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "centros_notificadores": normalize_positive_integer,
+                "ives": normalize_positive_integer,
+                "tasa": normalize_positive_float,
+            },
+        )
 
         # Save to csv
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
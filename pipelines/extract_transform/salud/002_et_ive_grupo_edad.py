@@ -1,7 +1,7 @@
 """Extract and transform data
 Sources:
     MINSANIDAD001
-Target tables
+Target tables:
     ive_grupo_edad
 """
 
@@ -12,8 +12,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
     normalize_age_group,
+    normalize_frame,
     normalize_positive_float,
     normalize_year,
 )
@@ -44,9 +44,14 @@ def main():
         df["grupo_edad"] = df["grupo_edad"].replace("19 y menos años", "<19", regex=True)
 
         # Normalize and validate columns
-        df["grupo_edad"] = apply_and_check(df["grupo_edad"], normalize_age_group)
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["tasa"] = apply_and_check(df["tasa"], normalize_positive_float)
+        df = normalize_frame(
+            df,
+            {
+                "grupo_edad": normalize_age_group,
+                "anio": normalize_year,
+                "tasa": normalize_positive_float,
+            },
+        )
 
         # Save to CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -1,7 +1,7 @@
 """Extract and transform data
 Sources:
     MINSANIDAD001
-Target tables
+Target tables:
     ive_ccaa
 """
 
@@ -12,8 +12,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
     normalize_comunidad_autonoma,
+    normalize_frame,
     normalize_positive_float,
     normalize_year,
 )
@@ -44,9 +44,14 @@ def main():
         df = df[~df["comunidad_autonoma_id"].isin(["Total", "Ceuta y Melilla, Ciudades Autónomas"])]
 
         # Normalize and validate columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["tasa"] = apply_and_check(df["tasa"], normalize_positive_float)
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "tasa": normalize_positive_float,
+            },
+        )
 
         # Save the cleaned DataFrame to a CSV file
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
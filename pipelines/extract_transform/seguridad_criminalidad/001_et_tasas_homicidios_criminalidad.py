@@ -1,7 +1,7 @@
 """Extract and transform data
 Sources:
     INE021
-Target tables
+Target tables:
     tasas_homicidios_criminalidad
 """
 
@@ -12,9 +12,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
     normalize_comunidad_autonoma,
+    normalize_frame,
     normalize_positive_float,
     normalize_year,
 )
@@ -43,13 +42,18 @@ def main():
         df = df.fillna({"comunidad_autonoma_id": "Total Nacional"})
 
         # Normalize and validate columns
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["tipo_tasa"] = apply_and_check_dict(
-            df["tipo_tasa"],
-            {"Tasa de homicidios": "Tasa de homicidios", "Tasa de criminalidad": "Tasa de criminalidad"},
+        df = normalize_frame(
+            df,
+            {
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "anio": normalize_year,
+                "tipo_tasa": {
+                    "Tasa de homicidios": "Tasa de homicidios",
+                    "Tasa de criminalidad": "Tasa de criminalidad",
+                },
+                "total": normalize_positive_float,
+            },
         )
-        df["total"] = apply_and_check(df["total"], normalize_positive_float)
 
         # Save the cleaned DataFrame to a CSV file
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -12,8 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
+    normalize_frame,
     normalize_positive_integer,
     normalize_year,
 )
@@ -47,29 +46,24 @@ def main():
         df = df.dropna(subset=["delitos"])
 
         # Validate and normalize columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["sexo"] = apply_and_check_dict(
-            df["sexo"],
-            {"Hombres": "Hombre", "Mujeres": "Mujer", "Total": "Total"},
-        )
-        df["delitos"] = apply_and_check(df["delitos"], normalize_positive_integer)
-        df["nivel_2"] = apply_and_check_dict(
-            df["nivel_2"], {"8 Contra la libertad e indemnidad sexuales": "8 Contra la libertad e indemnidad sexuales"}
-        )
-        df["nivel_3"] = apply_and_check_dict(
-            df["nivel_3"],
+        df = normalize_frame(
+            df,
             {
-                "8.1 Agresiones sexuales": "8.1 Agresiones sexuales",
-                "8.2 Abusos sexuales": "8.2 Abusos sexuales",
-                "8.2 BIS Abusos y agresiones sexuales a menores de 16 años": "8.2 BIS Abusos y agresiones sexuales a menores de 16 años",  # noqa: E501
-                "8.3 Acoso sexual": "8.3 Acoso sexual",
-                "8.4 Exhibicionismo y provocación sexual": "8.4 Exhibicionismo y provocación sexual",
-                "8.5 Prostitución y corrupción menores": "8.5 Prostitución y corrupción menores",
+                "anio": normalize_year,
+                "sexo": {"Hombres": "Hombre", "Mujeres": "Mujer", "Total": "Total"},
+                "delitos": normalize_positive_integer,
+                "nivel_2": {"8 Contra la libertad e indemnidad sexuales": "8 Contra la libertad e indemnidad sexuales"},
+                "nivel_3": {
+                    "8.1 Agresiones sexuales": "8.1 Agresiones sexuales",
+                    "8.2 Abusos sexuales": "8.2 Abusos sexuales",
+                    "8.2 BIS Abusos y agresiones sexuales a menores de 16 años": "8.2 BIS Abusos y agresiones sexuales a menores de 16 años",  # noqa: E501
+                    "8.3 Acoso sexual": "8.3 Acoso sexual",
+                    "8.4 Exhibicionismo y provocación sexual": "8.4 Exhibicionismo y provocación sexual",
+                    "8.5 Prostitución y corrupción menores": "8.5 Prostitución y corrupción menores",
+                },
+                "nivel_4": {"8.1.1 Agresión sexual": "8.1.1 Agresión sexual", "8.1.2 Violación": "8.1.2 Violación"},
             },
         )
-        df["nivel_4"] = apply_and_check_dict(
-            df["nivel_4"], {"8.1.1 Agresión sexual": "8.1.1 Agresión sexual", "8.1.2 Violación": "8.1.2 Violación"}
-        )
 
         # Save the cleaned DataFrame to a CSV file
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
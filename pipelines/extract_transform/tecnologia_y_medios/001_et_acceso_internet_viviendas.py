@@ -1,7 +1,7 @@
 """Extract and transform data
 Sources:
     INE015
-Target tables
+Target tables:
     acceso_internet_viviendas
 """
 
@@ -12,8 +12,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
     normalize_comunidad_autonoma,
+    normalize_frame,
     normalize_plain_text,
     normalize_positive_float,
     normalize_year,
@@ -40,10 +40,15 @@ def main():
         )
 
         # Normalize and validate columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["tipo_equipamiento"] = apply_and_check(df["tipo_equipamiento"], normalize_plain_text)
-        df["porcentaje"] = apply_and_check(df["porcentaje"], normalize_positive_float)
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "tipo_equipamiento": normalize_plain_text,
+                "porcentaje": normalize_positive_float,
+            },
+        )
 
         # Save to CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
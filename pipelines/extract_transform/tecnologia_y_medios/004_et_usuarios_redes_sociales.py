@@ -1,7 +1,7 @@
 """Extract and transform data
 Sources:
     SMF001
-Target tables
+Target tables:
     usuarios_redes_sociales
 """
 
@@ -12,7 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
+    normalize_frame,
     normalize_plain_text,
     normalize_positive_integer,
     normalize_year,
@@ -44,10 +44,15 @@ def main():
         df["ciudad"] = df["ciudad"].str.title()
 
         # Normalize and validate columns
-        df["ciudad"] = apply_and_check(df["ciudad"], normalize_plain_text)
-        df["usuarios"] = apply_and_check(df["usuarios"], normalize_positive_integer)
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["red_social"] = apply_and_check(df["red_social"], normalize_plain_text)
+        df = normalize_frame(
+            df,
+            {
+                "ciudad": normalize_plain_text,
+                "usuarios": normalize_positive_integer,
+                "anio": normalize_year,
+                "red_social": normalize_plain_text,
+            },
+        )
 
         # Save to CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
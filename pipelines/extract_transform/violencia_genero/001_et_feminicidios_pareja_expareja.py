@@ -2,7 +2,8 @@
 Sources:
     DGVG001
 Target tables:
-    feminicios_pareja"""
+    feminicidios_pareja_expareja
+"""
 
 import logging
 from pathlib import Path
@@ -11,8 +12,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
     normalize_age_group,
+    normalize_frame,
     normalize_month,
     normalize_positive_integer,
     normalize_provincia,
@@ -44,13 +45,18 @@ def main():
         )
 
         # Normalize and validate all columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["mes"] = apply_and_check(df["mes"], normalize_month)
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["victima_grupo_edad"] = apply_and_check(df["victima_grupo_edad"], normalize_age_group)
-        df["agresor_grupo_edad"] = apply_and_check(df["agresor_grupo_edad"], normalize_age_group)
-        df["feminicidios"] = apply_and_check(df["feminicidios"], normalize_positive_integer)
-        df["huerfanos_menores"] = apply_and_check(df["huerfanos_menores"], normalize_positive_integer)
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "mes": normalize_month,
+                "provincia_id": normalize_provincia,
+                "victima_grupo_edad": normalize_age_group,
+                "agresor_grupo_edad": normalize_age_group,
+                "feminicidios": normalize_positive_integer,
+                "huerfanos_menores": normalize_positive_integer,
+            },
+        )
 
         # Data for huerfanos_menores is not available before 2013, it is set as NULL
         df.loc[df["anio"] < 2013, "huerfanos_menores"] = None
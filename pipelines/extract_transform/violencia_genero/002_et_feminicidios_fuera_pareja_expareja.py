@@ -2,7 +2,7 @@
 Sources:
     DGVG002
 Target tables:
-    feminicios_no_pareja
+    feminicidios_fuera_pareja_expareja
 """
 
 import logging
@@ -12,9 +12,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
     normalize_comunidad_autonoma,
+    normalize_frame,
     normalize_positive_integer,
     normalize_year,
 )
@@ -48,10 +47,15 @@ def main():
         }
 
         # Normalize and validate all columns
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["feminicidios"] = apply_and_check(df["feminicidios"], normalize_positive_integer)
-        df["tipo_feminicidio"] = apply_and_check_dict(df["tipo_feminicidio"], tipo_feminicidio_mapping)
+        df = normalize_frame(
+            df,
+            {
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "anio": normalize_year,
+                "feminicidios": normalize_positive_integer,
+                "tipo_feminicidio": tipo_feminicidio_mapping,
+            },
+        )
 
         # Save cleaned CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
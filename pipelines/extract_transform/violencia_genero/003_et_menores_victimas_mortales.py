@@ -11,8 +11,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
+    normalize_frame,
     normalize_month,
     normalize_positive_integer,
     normalize_provincia,
@@ -52,12 +51,17 @@ def main():
         }
 
         # Normalize and validate all columns
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["mes"] = apply_and_check(df["mes"], normalize_month)
-        df["es_victima_vicaria"] = apply_and_check_dict(df["es_victima_vicaria"], es_victima_vicaria_mapping)
-        df["es_hijo_agresor"] = apply_and_check_dict(df["es_hijo_agresor"], es_hijo_agresor_mapping)
-        df["menores_victimas_mortales"] = apply_and_check(df["menores_victimas_mortales"], normalize_positive_integer)
+        df = normalize_frame(
+            df,
+            {
+                "provincia_id": normalize_provincia,
+                "anio": normalize_year,
+                "mes": normalize_month,
+                "es_victima_vicaria": es_victima_vicaria_mapping,
+                "es_hijo_agresor": es_hijo_agresor_mapping,
+                "menores_victimas_mortales": normalize_positive_integer,
+            },
+        )
 
         # Save cleaned CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
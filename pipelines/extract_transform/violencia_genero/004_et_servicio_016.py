@@ -13,8 +13,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
+    normalize_frame,
     normalize_month,
     normalize_positive_integer,
     normalize_provincia,
@@ -62,15 +61,20 @@ def main():
         }
 
         # Normalize and validate all columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["mes"] = apply_and_check(df["mes"], normalize_month)
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["persona_consulta"] = apply_and_check_dict(df["persona_consulta"], persona_consulta_mapping)
-        df["tipo_violencia"] = apply_and_check_dict(df["tipo_violencia"], tipo_violencia_mapping)
-        df["llamadas"] = apply_and_check(df["llamadas"], normalize_positive_integer)
-        df["whatsapps"] = apply_and_check(df["whatsapps"], normalize_positive_integer)
-        df["emails"] = apply_and_check(df["emails"], normalize_positive_integer)
-        df["chats"] = apply_and_check(df["chats"], normalize_positive_integer)
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "mes": normalize_month,
+                "provincia_id": normalize_provincia,
+                "persona_consulta": persona_consulta_mapping,
+                "tipo_violencia": tipo_violencia_mapping,
+                "llamadas": normalize_positive_integer,
+                "whatsapps": normalize_positive_integer,
+                "emails": normalize_positive_integer,
+                "chats": normalize_positive_integer,
+            },
+        )
 
         # Save cleaned CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -12,7 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
+    normalize_frame,
     normalize_month,
     normalize_positive_integer,
     normalize_provincia,
@@ -47,12 +47,17 @@ def main():
         df = df[df["bajas"] >= 0]
 
         # Normalize and validate all columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["mes"] = apply_and_check(df["mes"], normalize_month)
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["usuarias_activas"] = apply_and_check(df["usuarias_activas"], normalize_positive_integer)
-        df["altas"] = apply_and_check(df["altas"], normalize_positive_integer)
-        df["bajas"] = apply_and_check(df["bajas"], normalize_positive_integer)
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "mes": normalize_month,
+                "provincia_id": normalize_provincia,
+                "usuarias_activas": normalize_positive_integer,
+                "altas": normalize_positive_integer,
+                "bajas": normalize_positive_integer,
+            },
+        )
 
         # Save clean CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -12,7 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
+    normalize_frame,
     normalize_month,
     normalize_positive_integer,
     normalize_provincia,
@@ -43,14 +43,17 @@ def main():
         df = df.drop(columns=["Comunidad autónoma"])
 
         # Normalize and validate all columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["mes"] = apply_and_check(df["mes"], normalize_month)
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["instalaciones_acumuladas"] = apply_and_check(df["instalaciones_acumuladas"], normalize_positive_integer)
-        df["desinstalaciones_acumuladas"] = apply_and_check(
-            df["desinstalaciones_acumuladas"], normalize_positive_integer
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "mes": normalize_month,
+                "provincia_id": normalize_provincia,
+                "instalaciones_acumuladas": normalize_positive_integer,
+                "desinstalaciones_acumuladas": normalize_positive_integer,
+                "dispositivos_activos": normalize_positive_integer,
+            },
         )
-        df["dispositivos_activos"] = apply_and_check(df["dispositivos_activos"], normalize_positive_integer)
 
         # Save clean CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
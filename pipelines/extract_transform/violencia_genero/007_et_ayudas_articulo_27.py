@@ -12,8 +12,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
     normalize_comunidad_autonoma,
+    normalize_frame,
     normalize_positive_integer,
     normalize_year,
 )
@@ -38,9 +38,14 @@ def main():
         )
 
         # Normalize and validate all columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["ayudas_concedidas"] = apply_and_check(df["ayudas_concedidas"], normalize_positive_integer)
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "ayudas_concedidas": normalize_positive_integer,
+            },
+        )
 
         # Save clean data
         df.to_csv(CLEAN_CSV_PATH, index=False, sep=";")
@@ -12,8 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
+    normalize_frame,
     normalize_month,
     normalize_positive_integer,
     normalize_provincia,
@@ -44,21 +43,23 @@ def main():
         df = df.drop(columns=["Comunidad autónoma"])
 
         # Normalize and validate all columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["mes"] = apply_and_check(df["mes"], normalize_month)
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["nivel_riesgo"] = apply_and_check_dict(
-            df["nivel_riesgo"],
+        df = normalize_frame(
+            df,
             {
-                "No apreciado": "No apreciado",
-                "Bajo": "Bajo",
-                "Medio": "Medio",
-                "Alto": "Alto",
-                "Extremo": "Extremo",
+                "anio": normalize_year,
+                "mes": normalize_month,
+                "provincia_id": normalize_provincia,
+                "nivel_riesgo": {
+                    "No apreciado": "No apreciado",
+                    "Bajo": "Bajo",
+                    "Medio": "Medio",
+                    "Alto": "Alto",
+                    "Extremo": "Extremo",
+                },
+                "casos": normalize_positive_integer,
+                "casos_proteccion_policial": normalize_positive_integer,
             },
         )
-        df["casos"] = apply_and_check(df["casos"], normalize_positive_integer)
-        df["casos_proteccion_policial"] = apply_and_check(df["casos_proteccion_policial"], normalize_positive_integer)
 
         # Save clean CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
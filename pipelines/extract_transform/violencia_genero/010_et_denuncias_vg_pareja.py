@@ -12,8 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
+    normalize_frame,
     normalize_positive_integer,
     normalize_provincia,
     normalize_quarter,
@@ -52,11 +51,16 @@ def main():
         }
 
         # Normalize and validate all columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["trimestre"] = apply_and_check(df["trimestre"], normalize_quarter)
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["denuncias"] = apply_and_check(df["denuncias"], normalize_positive_integer)
-        df["origen_denuncia"] = apply_and_check_dict(df["origen_denuncia"], origen_denuncia_mapping)
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "trimestre": normalize_quarter,
+                "provincia_id": normalize_provincia,
+                "denuncias": normalize_positive_integer,
+                "origen_denuncia": origen_denuncia_mapping,
+            },
+        )
 
         # Save clean CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -12,8 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
+    normalize_frame,
     normalize_positive_integer,
     normalize_provincia,
     normalize_quarter,
@@ -57,12 +56,17 @@ def main():
         }
 
         # Normalize and validate all columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["trimestre"] = apply_and_check(df["trimestre"], normalize_quarter)
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["ordenes_proteccion"] = apply_and_check(df["ordenes_proteccion"], normalize_positive_integer)
-        df["estado_proceso"] = apply_and_check_dict(df["estado_proceso"], estado_orden_proteccion_mapping)
-        df["instancia"] = apply_and_check_dict(df["instancia"], instancia_mapping)
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "trimestre": normalize_quarter,
+                "provincia_id": normalize_provincia,
+                "ordenes_proteccion": normalize_positive_integer,
+                "estado_proceso": estado_orden_proteccion_mapping,
+                "instancia": instancia_mapping,
+            },
+        )
 
         # Save to CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -12,7 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
+    normalize_frame,
     normalize_positive_integer,
     normalize_provincia,
     normalize_year,
@@ -39,9 +39,14 @@ def main():
         df = df.drop(columns=["Comunidad autónoma"])
 
         # Normalize and validate all columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["perceptoras"] = apply_and_check(df["perceptoras"], normalize_positive_integer)
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "provincia_id": normalize_provincia,
+                "perceptoras": normalize_positive_integer,
+            },
+        )
 
         # Save to CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
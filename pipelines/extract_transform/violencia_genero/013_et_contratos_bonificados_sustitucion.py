@@ -12,8 +12,7 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
-    apply_and_check_dict,
+    normalize_frame,
     normalize_month,
     normalize_positive_integer,
     normalize_provincia,
@@ -60,13 +59,18 @@ def main():
         }
 
         # Normalize and validate all columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["mes"] = apply_and_check(df["mes"], normalize_month)
-        df["provincia_id"] = apply_and_check(df["provincia_id"], normalize_provincia)
-        df["colectivo"] = apply_and_check_dict(df["colectivo"], colectivo_mapping)
-        df["tipo_contrato"] = apply_and_check_dict(df["tipo_contrato"], tipo_contrato_mapping)
-        df["contratos_bonificados"] = apply_and_check(df["contratos_bonificados"], normalize_positive_integer)
-        df["contratos_sustitucion"] = apply_and_check(df["contratos_sustitucion"], normalize_positive_integer)
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "mes": normalize_month,
+                "provincia_id": normalize_provincia,
+                "colectivo": colectivo_mapping,
+                "tipo_contrato": tipo_contrato_mapping,
+                "contratos_bonificados": normalize_positive_integer,
+                "contratos_sustitucion": normalize_positive_integer,
+            },
+        )
 
         # Save to CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
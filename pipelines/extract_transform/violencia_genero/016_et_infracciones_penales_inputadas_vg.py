@@ -12,8 +12,8 @@ import pandas as pd
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
     normalize_comunidad_autonoma,
+    normalize_frame,
     normalize_plain_text,
     normalize_positive_integer,
     normalize_year,
@@ -46,11 +46,14 @@ def main():
         df = df[df["tipo_infraccion"] != "Total Infracciones"]
 
         # Normalize and validate all columns
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["comunidad_autonoma_id"] = apply_and_check(df["comunidad_autonoma_id"], normalize_comunidad_autonoma)
-        df["tipo_infraccion"] = apply_and_check(df["tipo_infraccion"], normalize_plain_text)
-        df["infracciones_penales_inputadas"] = apply_and_check(
-            df["infracciones_penales_inputadas"], normalize_positive_integer
+        df = normalize_frame(
+            df,
+            {
+                "anio": normalize_year,
+                "comunidad_autonoma_id": normalize_comunidad_autonoma,
+                "tipo_infraccion": normalize_plain_text,
+                "infracciones_penales_inputadas": normalize_positive_integer,
+            },
         )
 
         # Save to CSV
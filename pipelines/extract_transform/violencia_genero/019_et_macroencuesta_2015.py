@@ -16,7 +16,7 @@ import pyreadstat
 
 from utils.logging import setup_logging
 from utils.normalization import (
-    apply_and_check,
+    normalize_frame,
     normalize_json_string,
     normalize_provincia,
 )
@@ -49,8 +49,13 @@ def main():
         )
 
         # Validate and normalize columns
-        df_json["variables_json"] = apply_and_check(df_json["variables_json"], normalize_json_string)
-        df_json["provincia_id"] = apply_and_check(df_json["provincia_id"], normalize_provincia)
+        df_json = normalize_frame(
+            df_json,
+            {
+                "variables_json": normalize_json_string,
+                "provincia_id": normalize_provincia,
+            },
+        )
 
         # Save to CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
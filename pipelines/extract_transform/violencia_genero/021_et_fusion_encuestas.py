@@ -14,6 +14,7 @@ import pyreadstat
 from utils.logging import setup_logging
 from utils.normalization import (
     apply_and_check,
+    normalize_frame,
     normalize_month,
     normalize_positive_integer,
     normalize_provincia,
@@ -96,9 +97,14 @@ def main():
 
         # Normalize and validate columns
         df["provincia_id"] = apply_and_check(df["provincia_id"].astype(str), normalize_provincia)
-        df["codigo_estudio"] = apply_and_check(df["codigo_estudio"], normalize_positive_integer)
-        df["anio"] = apply_and_check(df["anio"], normalize_year)
-        df["mes"] = apply_and_check(df["mes"], normalize_month)
+        df = normalize_frame(
+            df,
+            {
+                "codigo_estudio": normalize_positive_integer,
+                "anio": normalize_year,
+                "mes": normalize_month,
+            },
+        )
 
         # Save to CSV
         CLEAN_CSV_PATH.parent.mkdir(parents=True, exist_ok=True)
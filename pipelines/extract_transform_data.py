@@ -1,12 +1,17 @@
 """Run extract-transform steps for the raw datasets."""
 
+import argparse
+import asyncio
 import logging
-import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
+from utils.checkpoint import get_completed, mark_completed
+from utils.fingerprint import compute_fingerprint, is_up_to_date, load_manifest, save_manifest
 from utils.logging import setup_logging
-from utils.run_script import run_python_script
+from utils.run_report import finish_run_report, start_run_report
+from utils.run_script import ScriptResult, ScriptWorkerPool, run_python_script_async
+from utils.script_paths import CLEAN_DATA_DIR, get_script_paths, get_script_targets
 
 # Define extract transform scripts to run
 ET_SCRIPTS_DIR = Path("pipelines") / "extract_transform"
@@ -86,27 +91,220 @@ SCRIPTS: List[Path] = [
 ]
 
 
-def main(schema_to_et: Optional[str] = None):
+def build_dependency_graph(scripts: List[Path]) -> Dict[Path, Set[Path]]:
+    """Return the scripts each script depends on, i.e. the ones producing its clean inputs.
+
+    Clean inputs that are not produced by any of the given scripts (e.g. the geo CSVs
+    read by utils.normalization_dicts) must already exist."""
+
+    script_paths = {script: get_script_paths(script) for script in scripts}
+    producers = {output: script for script, paths in script_paths.items() for output in paths.outputs}
+
+    graph: Dict[Path, Set[Path]] = {}
+    missing: Set[Path] = set()
+    for script, paths in script_paths.items():
+        graph[script] = set()
+        for path in paths.inputs:
+            producer = producers.get(path)
+            if producer is not None and producer != script:
+                graph[script].add(producer)
+            elif producer is None and path.is_relative_to(CLEAN_DATA_DIR) and not path.exists():
+                missing.add(path)
+
+    if missing:
+        logging.error(f"Missing clean inputs required by the extract-transform scripts: {sorted(missing)}")
+        raise FileNotFoundError(f"Missing clean inputs: {sorted(missing)}")
+    return graph
+
+
+def get_scripts_for_tables(tables: List[str]) -> List[Path]:
+    """Return the scripts needed to rebuild the given schema qualified tables.
+
+    These are the scripts listing a table in their ``Target tables:`` header and,
+    recursively, the scripts reading the clean CSV of a selected table."""
+
+    tables_to_build = {table.lower() for table in tables}
+    csvs_to_build = {CLEAN_DATA_DIR / Path(*table.split(".", 1)).with_suffix(".csv") for table in tables_to_build}
+    selected: Set[Path] = set()
+    changed = True
+    while changed:
+        changed = False
+        for script in SCRIPTS:
+            if script in selected:
+                continue
+            paths = get_script_paths(script)
+            targets = set(get_script_targets(script))
+            if targets & tables_to_build or csvs_to_build.intersection(paths.inputs):
+                selected.add(script)
+                tables_to_build |= targets
+                csvs_to_build.update(paths.outputs)
+                changed = True
+    return [script for script in SCRIPTS if script in selected]
+
+
+def run_scripts(
+    scripts: List[Path],
+    jobs: int = 1,
+    in_process: bool = False,
+    force: bool = False,
+    checkpoint: bool = False,
+    timeout: Optional[float] = None,
+):
+    """Run the scripts respecting their dependencies with up to ``jobs`` scripts at a time.
+
+    Ready scripts are started in list order. When a script fails, the running ones are
+    terminated, no new script is started and the error is raised. If ``in_process`` is
+    set, scripts run in a pool of warm workers instead of one interpreter per script;
+    otherwise each script is terminated if it runs longer than ``timeout`` seconds.
+
+    Scripts whose fingerprint matches the manifest and whose clean CSV still exists are
+    skipped unless ``force`` is set. The manifest is updated after every successful script.
+    With ``checkpoint``, finished scripts are recorded in the state of the pipeline run and
+    the ones already finished in that run are skipped even if ``force`` is set."""
+
+    asyncio.run(_run_scripts(scripts, jobs, in_process, force, checkpoint, timeout))
+
+
+async def _run_scripts(
+    scripts: List[Path], jobs: int, in_process: bool, force: bool, checkpoint: bool, timeout: Optional[float]
+):
+    """Asyncio scheduler of run_scripts."""
+
+    graph = build_dependency_graph(scripts)
+    pending = list(scripts)
+    completed: Set[Path] = set()
+    running: Dict[asyncio.Task, Path] = {}
+    manifest = load_manifest()
+    checkpoints = get_completed("et") if checkpoint else {}
+    fingerprints: Dict[Path, str] = {}
+
+    worker_pool = ScriptWorkerPool(jobs) if in_process else None
+
+    def start_script(script: Path) -> asyncio.Task:
+        if worker_pool is not None:
+            return asyncio.create_task(asyncio.to_thread(worker_pool.run_python_script, script))
+        return asyncio.create_task(run_python_script_async(script, timeout=timeout))
+
+    try:
+        while pending or running:
+            ready = [script for script in pending if graph[script] <= completed]
+            for script in ready:
+                if len(running) >= jobs:
+                    break
+                pending.remove(script)
+                fingerprints[script] = compute_fingerprint(script)
+                if not force and is_up_to_date(script, fingerprints[script], manifest):
+                    logging.info(f"Skipping unchanged script: {script.name}")
+                    completed.add(script)
+                    continue
+                if is_up_to_date(script, fingerprints[script], checkpoints):
+                    logging.info(f"Skipping script completed in the resumed run: {script.name}")
+                    completed.add(script)
+                    continue
+                logging.info(f"Running script: {script.name}")
+                running[start_script(script)] = script
+
+            if not running:
+                # Skipped scripts may have unblocked their dependents
+                if ready:
+                    continue
+                raise RuntimeError(f"Circular dependency between scripts: {[script.name for script in pending]}")
+
+            finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                script = running.pop(task)
+                try:
+                    result = task.result()
+                    if isinstance(result, ScriptResult) and not result.ok:
+                        raise RuntimeError(result.describe())
+                except Exception:
+                    logging.error(f"Script failed: {script.name}. Cancelling remaining scripts")
+                    if worker_pool is not None:
+                        worker_pool.terminate()
+                    for other in running:
+                        other.cancel()
+                    await asyncio.gather(*running, return_exceptions=True)
+                    manifest.pop(str(script), None)
+                    save_manifest(manifest)
+                    raise
+                completed.add(script)
+                manifest[str(script)] = fingerprints[script]
+                save_manifest(manifest)
+                if checkpoint:
+                    mark_completed("et", str(script), fingerprints[script])
+
+    finally:
+        if worker_pool is not None:
+            worker_pool.close()
+
+
+def main(
+    schema_to_et: Optional[str] = None,
+    jobs: int = 1,
+    in_process: bool = False,
+    force: bool = False,
+    checkpoint: bool = False,
+    table: Optional[str] = None,
+    timeout: Optional[float] = None,
+):
     """Main function to run extract-transform scripts. If schema_to_et is provided,
     only scripts for that schema will be run. If no schema is provided, all scripts will
-    be run."""
+    be run. Up to ``jobs`` independent scripts are run at the same time, in warm workers
+    if in_process is set. Unchanged scripts are skipped unless force is set. With
+    checkpoint, progress is recorded in the state of the pipeline run (see main.py).
+    If table is provided, only the scripts needed to rebuild it are run. Scripts running
+    longer than timeout seconds are terminated (not supported in warm workers)."""
 
     logging.info("Starting extract-transform scripts...")
 
-    if schema_to_et:
+    if table:
+        filtered_scripts = get_scripts_for_tables([table])
+        if not filtered_scripts:
+            logging.info(f"No extract-transform script builds table: {table}")
+    elif schema_to_et:
         schema_to_et = schema_to_et.lower()
         filtered_scripts = [script for script in SCRIPTS if script.parent.name.lower() == schema_to_et]
     else:
         filtered_scripts = SCRIPTS
 
-    for script in filtered_scripts:
-        logging.info(f"Running script: {script.name}")
-        run_python_script(script)
+    if in_process and timeout is not None:
+        logging.warning("Timeouts are not supported for scripts run in warm workers, ignoring it")
+    run_scripts(filtered_scripts, jobs, in_process, force, checkpoint, timeout)
 
     logging.info("All extract-transform scripts completed")
 
 
 if __name__ == "__main__":
     setup_logging()
-    schema_arg = sys.argv[1] if len(sys.argv) > 1 else None
-    main(schema_arg)
+    parser = argparse.ArgumentParser(description="Run extract-transform scripts")
+    parser.add_argument("schema", nargs="?", help="If provided, only scripts for this schema will be run")
+    parser.add_argument("--table", help="If provided (schema.table), only scripts needed to rebuild it will be run")
+    parser.add_argument("--jobs", type=int, default=1, help="Number of scripts to run in parallel (default: 1)")
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run scripts by calling their main() in warm worker processes instead of one interpreter each",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run every script even if its inputs and code have not changed",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Record finished scripts in the pipeline run state and skip the ones already finished",
+    )
+    parser.add_argument("--timeout", type=float, help="Terminate scripts running longer than this many seconds")
+    parser.add_argument(
+        "--count-rows",
+        action="store_true",
+        help="Count the rows of the CSVs read and written by every script in the run report",
+    )
+    args = parser.parse_args()
+    report_path = start_run_report(count_rows=args.count_rows)
+    try:
+        main(args.schema, args.jobs, args.in_process, args.force, args.checkpoint, args.table, args.timeout)
+    finally:
+        if report_path is not None:
+            finish_run_report(report_path)
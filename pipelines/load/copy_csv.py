@@ -0,0 +1,213 @@
+"""Bulk load of clean CSVs with ``COPY ... FROM STDIN``.
+
+The CSV is streamed row by row into the COPY, without building a DataFrame. Rows are
+re-encoded on the way so that the database reads the same values ``pd.read_csv(path,
+sep=";", escapechar="\\")`` would: backslash escapes are resolved, the pandas NA markers
+(empty fields, ``NaN``, ``None``...) become NULL and the ``1.0`` floats pandas writes for
+integer columns with missing values are loaded as integers.
+
+Tables with a natural key can be merged instead: the CSV is copied into a temporary
+table and only the differences are applied to the table."""
+
+import csv
+import io
+import itertools
+import logging
+from pathlib import Path
+from typing import IO, Iterator, List, Optional, Sequence
+
+import pandas as pd
+from psycopg2 import sql
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+# Rows re-encoded per read of the COPY stream
+COPY_BATCH_ROWS = 10_000
+# Strings read as NaN by pd.read_csv
+NA_VALUES = frozenset(
+    {"", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA"}
+    | {"NULL", "NaN", "None", "n/a", "nan", "null"}
+)
+INTEGER_TYPES = {"smallint", "integer", "bigint"}
+
+
+class CsvStream:
+    """File-like object returning the rows of a CSV in PostgreSQL CSV format as it is read."""
+
+    def __init__(self, rows: Iterator[List[str]]):
+        self._rows = rows
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, delimiter=";", lineterminator="\n")
+        self.rows = 0
+
+    def read(self, size: int = -1) -> str:
+        """Return the next batch of rows, or an empty string at the end of the CSV."""
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        batch = list(itertools.islice(self._rows, COPY_BATCH_ROWS))
+        self._writer.writerows(batch)
+        self.rows += len(batch)
+        return self._buffer.getvalue()
+
+
+def get_table_columns(conn: Connection, schema: str, table: str) -> dict[str, str]:
+    """Return the columns of a table with their data type, in definition order."""
+    result = conn.execute(
+        text(
+            "SELECT column_name, data_type FROM information_schema.columns "
+            "WHERE table_schema = :schema AND table_name = :table ORDER BY ordinal_position"
+        ),
+        {"schema": schema, "table": table},
+    )
+    return {row[0]: row[1] for row in result.fetchall()}
+
+
+def get_nullable_columns(conn: Connection, schema: str, table: str) -> set[str]:
+    """Return the columns of a table that accept NULL."""
+    result = conn.execute(
+        text(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_schema = :schema AND table_name = :table AND is_nullable = 'YES'"
+        ),
+        {"schema": schema, "table": table},
+    )
+    return set(result.scalars())
+
+
+def read_header(path: Path) -> List[str]:
+    """Return the column names of a clean CSV."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return next(csv.reader(f, delimiter=";", escapechar="\\"), [])
+
+
+def get_csv_columns(conn: Connection, path: Path, schema: str, table: str) -> tuple[List[str], dict[str, str]]:
+    """Return the CSV header and the table columns, checking that every CSV column is in the table."""
+    table_columns = get_table_columns(conn, schema, table)
+    if not table_columns:
+        raise ValueError(f"Table '{schema}.{table}' does not exist")
+    header = read_header(path)
+    unknown = [column for column in header if column not in table_columns]
+    if unknown:
+        raise ValueError(f"Columns of '{path}' not in table '{schema}.{table}': {unknown}")
+    return header, table_columns
+
+
+def read_rows(path: Path, integer_columns: List[int]) -> Iterator[List[str]]:
+    """Yield the data rows of a clean CSV with NA markers emptied and integral floats truncated."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f, delimiter=";", escapechar="\\")
+        next(reader, None)
+        for row in reader:
+            row = ["" if value in NA_VALUES else value for value in row]
+            for i in integer_columns:
+                if row[i].endswith(".0"):
+                    row[i] = row[i][:-2]
+            yield row
+
+
+def copy_csv(conn: Connection, path: Path, schema: str, table: str, into: Optional[str] = None) -> int:
+    """Load a clean CSV into its table with COPY and return the number of rows copied.
+
+    CSV columns are matched to the table columns by name, so the CSV may omit columns
+    with a default (e.g. serial ids) and list the others in any order. If into is given,
+    the rows are copied into that (temporary) table with the same columns instead."""
+    header, table_columns = get_csv_columns(conn, path, schema, table)
+    columns = [column for column in table_columns if column in header]
+    integer_columns = [i for i, column in enumerate(header) if table_columns[column] in INTEGER_TYPES]
+
+    # Column order comes from the table definition, rows are reordered to match it
+    order = [header.index(column) for column in columns]
+    rows = read_rows(path, integer_columns)
+    stream = CsvStream([row[i] for i in order] for row in rows)
+    copy_stream(conn, into or f"{schema}.{table}", columns, stream)
+    return stream.rows
+
+
+def copy_stream(conn: Connection, table: str, columns: List[str], stream: IO[str]) -> None:
+    """Run a COPY of the given columns of a table from a stream of ``;`` separated CSV rows.
+
+    Empty fields, quoted or not, are loaded as NULL like pandas reads them."""
+    identifiers = sql.SQL(", ").join(map(sql.Identifier, columns))
+    statement = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv, DELIMITER ';', FORCE_NULL ({}))").format(
+        sql.Identifier(*table.split(".")), identifiers, identifiers
+    )
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(statement, stream)
+    finally:
+        cursor.close()
+
+
+def copy_dataframe(conn: Connection, df: pd.DataFrame, table: str) -> None:
+    """Copy a DataFrame into the table columns with the same names, missing values as NULL."""
+    buffer = io.StringIO()
+    df.to_csv(buffer, sep=";", index=False, header=False)
+    buffer.seek(0)
+    copy_stream(conn, table, list(df.columns), buffer)
+
+
+def get_key_expressions(key: Sequence[str], nullable: set[str], alias: str) -> List[str]:
+    """Return the expressions comparing the key columns of a table with ``=``.
+
+    NULL keys must match each other, but IS NOT DISTINCT FROM cannot be hashed and joins
+    by nested loops. Nullable columns are compared as one element arrays instead, whose
+    ``=`` treats NULLs as equal and can be hashed and indexed."""
+    return [f"ARRAY[{alias}{column}]" if column in nullable else f"{alias}{column}" for column in key]
+
+
+def merge_csv(conn: Connection, path: Path, schema: str, table: str, key: Sequence[str]) -> int:
+    """Apply the differences between a clean CSV and its table, matching rows by their natural key,
+    and return the number of rows in the CSV.
+
+    The CSV is copied into a temporary table. Then the table rows whose key is no longer in
+    the CSV are deleted, the rows whose other columns changed are updated and the new keys
+    inserted, so unchanged rows are not rewritten. Only rows kept since the previous load
+    are saved: a table emptied before (e.g. by the CASCADE truncate of geo.provincias in a
+    full load) has all its rows inserted again."""
+    header, table_columns = get_csv_columns(conn, path, schema, table)
+    columns = [column for column in table_columns if column in header]
+    missing = [column for column in key if column not in columns]
+    if missing:
+        raise ValueError(f"Natural key columns of '{schema}.{table}' not in '{path}': {missing}")
+    values = [column for column in columns if column not in key]
+
+    delta = f"{table}_delta"
+    conn.execute(text(f"CREATE TEMP TABLE {delta} AS SELECT {', '.join(columns)} FROM {schema}.{table} WITH NO DATA"))
+    rows = copy_csv(conn, path, schema, table, into=delta)
+
+    keys = ", ".join(key)
+    duplicated = conn.execute(text(f"SELECT {keys} FROM {delta} GROUP BY {keys} HAVING count(*) > 1 LIMIT 5"))
+    duplicated_keys = [tuple(row) for row in duplicated.fetchall()]
+    if duplicated_keys:
+        raise ValueError(f"Duplicated natural key ({keys}) in '{path}': {duplicated_keys}")
+
+    # NULL keys (e.g. national totals without provincia_id) match each other
+    nullable = get_nullable_columns(conn, schema, table)
+    table_key, delta_key = get_key_expressions(key, nullable, "t."), get_key_expressions(key, nullable, "d.")
+    match = " AND ".join(f"{t} = {d}" for t, d in zip(table_key, delta_key))
+    index = ", ".join(f"({expression})" for expression in get_key_expressions(key, nullable, ""))
+    conn.execute(text(f"CREATE INDEX ON {delta} ({index})"))
+    conn.execute(text(f"ANALYZE {delta}"))
+    deleted = conn.execute(
+        text(f"DELETE FROM {schema}.{table} t WHERE NOT EXISTS (SELECT 1 FROM {delta} d WHERE {match})")
+    ).rowcount
+    updated = 0
+    if values:
+        updated = conn.execute(
+            text(
+                f"UPDATE {schema}.{table} t SET {', '.join(f'{column} = d.{column}' for column in values)} "
+                f"FROM {delta} d WHERE {match} "
+                f"AND ({', '.join(f't.{column}' for column in values)}) "
+                f"IS DISTINCT FROM ({', '.join(f'd.{column}' for column in values)})"
+            )
+        ).rowcount
+    inserted = conn.execute(
+        text(
+            f"INSERT INTO {schema}.{table} ({', '.join(columns)}) "
+            f"SELECT {', '.join(f'd.{column}' for column in columns)} FROM {delta} d "
+            f"WHERE NOT EXISTS (SELECT 1 FROM {schema}.{table} t WHERE {match})"
+        )
+    ).rowcount
+    conn.execute(text(f"DROP TABLE {delta}"))
+    logging.info(f"Merged {schema}.{table}: {inserted} inserted, {updated} updated, {deleted} deleted")
+    return rows
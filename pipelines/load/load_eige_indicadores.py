@@ -1,26 +1,14 @@
-import numpy as np
 import pandas as pd
-from sqlalchemy import text
-from sqlalchemy.engine import Connection
 
+from pipelines.load.loader_context import LoaderContext
 
-def load_eige_indicadores(conn: Connection, df: pd.DataFrame) -> None:
-    """Load eige_indicadores table from a DataFrame."""
-
-    # Get mapping from pais_id to id (nan are mapped to None and saved as NULL in the database)
-    result = conn.execute(text("SELECT nombre, pais_id FROM geo.paises"))
-    rows = result.fetchall()
-    pais_map = {row[0]: row[1] for row in rows}
-    pais_map[np.nan] = None
 
-    # Check for unmapped pais_id before mapping (nan values are not in the map)
-    unmapped = df[~df["pais_id"].isin(pais_map.keys())]["pais_id"].unique().tolist()
-    if len(unmapped) > 0:
-        raise ValueError(f"Unmapped pais_id values: {unmapped}")
+def load_eige_indicadores(context: LoaderContext, df: pd.DataFrame) -> None:
+    """Load eige_indicadores table from a DataFrame."""
 
-    # Replace 'pais_id' in df with its corresponding id
+    # Replace 'pais_id' names in df with their id (nan are saved as NULL in the database)
     df = df.copy()
-    df["pais_id"] = df["pais_id"].map(pais_map)
+    df["pais_id"] = context.resolve(df["pais_id"], "paises")
 
     # Insert into table
-    df.to_sql("eige_indicadores", schema="igualdad_formal", con=conn, if_exists="append", index=False)
+    df.to_sql("eige_indicadores", schema=context.schema, con=context.conn, if_exists="append", index=False)
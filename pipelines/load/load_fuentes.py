@@ -1,59 +1,63 @@
-from typing import Dict
-
 import pandas as pd
 from sqlalchemy import text
-from sqlalchemy.engine import Connection
 
+from pipelines.load.copy_csv import copy_dataframe
+from pipelines.load.loader_context import LoaderContext
+
+
+def load_fuentes(context: LoaderContext, df: pd.DataFrame) -> None:
+    """Load fuentes and fuentes_tablas tables from a single CSV.
 
-def load_fuentes(conn: Connection, df: pd.DataFrame) -> None:
-    """Load fuentes and fuentes_tablas tables from a single CSV."""
+    The CSV is copied into a temporary table and both tables are filled from it with
+    set based statements, so the number of round trips does not grow with the rows."""
 
-    # Check tabla_nombre existence in db
-    table_names = set(df["tabla_nombre"].unique())
-    schema_table_pairs = [tuple(name.split(".", 1)) if "." in name else ("public", name) for name in table_names]
-    placeholders = ", ".join([f"(:s{i}, :t{i})" for i in range(len(schema_table_pairs))])
-    query = (
-        f"SELECT table_schema, table_name FROM information_schema.tables "
-        f"WHERE table_schema NOT IN ('pg_catalog', 'information_schema') "
-        f"AND (table_schema, table_name) IN ({placeholders})"
+    # Rows keep their CSV order so that fuentes get their ids by first appearance
+    context.conn.execute(
+        text(
+            "CREATE TEMP TABLE fuentes_csv ("
+            "    orden serial, fuente_nombre varchar, tabla_nombre varchar,"
+            "    fecha_actualizacion date, descripcion text, url varchar"
+            ")"
+        )
+    )
+    copy_dataframe(
+        context.conn, df[["fuente_nombre", "tabla_nombre", "fecha_actualizacion", "descripcion", "url"]], "fuentes_csv"
     )
-    params = {}
-    for i, (schema, table) in enumerate(schema_table_pairs):
-        params[f"s{i}"] = schema
-        params[f"t{i}"] = table
-    result = conn.execute(text(query), params)
-    existing_pairs = {(row[0], row[1]) for row in result.fetchall()}
-    missing_pairs = set(schema_table_pairs) - existing_pairs
+
+    # Check tabla_nombre existence in db (names without schema are in public)
+    result = context.conn.execute(
+        text(
+            "SELECT DISTINCT c.table_schema, c.table_name FROM ("
+            "    SELECT"
+            "        CASE WHEN strpos(tabla_nombre, '.') > 0 THEN split_part(tabla_nombre, '.', 1)"
+            "        ELSE 'public' END AS table_schema,"
+            "        substr(tabla_nombre, strpos(tabla_nombre, '.') + 1) AS table_name"
+            "    FROM fuentes_csv"
+            ") c "
+            "LEFT JOIN information_schema.tables t "
+            "ON t.table_schema = c.table_schema AND t.table_name = c.table_name "
+            "AND t.table_schema NOT IN ('pg_catalog', 'information_schema') "
+            "WHERE t.table_name IS NULL"
+        )
+    )
+    missing_pairs = {(row[0], row[1]) for row in result.fetchall()}
     if missing_pairs:
         raise RuntimeError(f"The following tables are not in the database: {missing_pairs}")
 
-    fuentes_df = (
-        df[["fuente_nombre", "descripcion", "url"]]
-        .drop_duplicates(subset="fuente_nombre")
-        .rename(columns={"fuente_nombre": "nombre"})
+    context.conn.execute(
+        text(
+            f"INSERT INTO {context.schema}.fuentes (nombre) "
+            "SELECT fuente_nombre FROM fuentes_csv GROUP BY fuente_nombre ORDER BY min(orden)"
+        )
     )
 
-    # Insert fuentes into the database retrieving their ids
-    fuente_ids: Dict[str, int] = {}
-    for _, row in fuentes_df.iterrows():
-        result = conn.execute(
-            text(("INSERT INTO metadata.fuentes (nombre) VALUES (:nombre) RETURNING fuente_id")),
-            {"nombre": row["nombre"]},
-        )
-        fuente_ids[row["nombre"]] = result.scalar_one()
-
-    # Insert fuentes_tablas with the corresponding fuente_id
-    for _, row in df.iterrows():
-        conn.execute(
-            text(
-                "INSERT INTO metadata.fuentes_tablas (fuente_id, nombre, fecha_actualizacion, descripcion, url) "
-                "VALUES (:fuente_id, :nombre, :fecha_actualizacion, :descripcion, :url)"
-            ),
-            {
-                "fuente_id": fuente_ids[row["fuente_nombre"]],
-                "nombre": row["tabla_nombre"],
-                "fecha_actualizacion": row["fecha_actualizacion"],
-                "descripcion": row["descripcion"] if pd.notnull(row["descripcion"]) else None,
-                "url": row["url"],
-            },
+    # Insert fuentes_tablas resolving the fuente_id of each row by name
+    context.conn.execute(
+        text(
+            f"INSERT INTO {context.schema}.fuentes_tablas (fuente_id, nombre, fecha_actualizacion, descripcion, url) "
+            "SELECT f.fuente_id, c.tabla_nombre, c.fecha_actualizacion, c.descripcion, c.url "
+            f"FROM fuentes_csv c JOIN {context.schema}.fuentes f ON f.nombre = c.fuente_nombre "
+            "ORDER BY c.orden"
         )
+    )
+    context.conn.execute(text("DROP TABLE fuentes_csv"))
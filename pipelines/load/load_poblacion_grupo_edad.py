@@ -1,25 +1,14 @@
 import pandas as pd
-from sqlalchemy import text
-from sqlalchemy.engine import Connection
 
+from pipelines.load.loader_context import LoaderContext
 
-def load_poblacion_grupo_edad(conn: Connection, df: pd.DataFrame) -> None:
-    """Load poblacion_grupo_edad table from a DataFrame."""
 
-    # Get mapping from pais nombre to id
-    result = conn.execute(text("SELECT nombre, pais_id FROM geo.paises"))
-    rows = result.fetchall()
-    nacionalidad_map = {row[0]: row[1] for row in rows}
+def load_poblacion_grupo_edad(context: LoaderContext, df: pd.DataFrame) -> None:
+    """Load poblacion_grupo_edad table from a DataFrame."""
 
-    # Replace 'nacionalidad' in df with its corresponding id
+    # Replace 'nacionalidad' in df with its corresponding id, every row must have one
     df = df.copy()
-    df["nacionalidad"] = df["nacionalidad"].map(nacionalidad_map)
-
-    # Check for unmapped nacionalidades
-    unmapped = df[df["nacionalidad"].isna()]["nacionalidad"].unique().tolist()
-    unmapped_original = df[~df["nacionalidad"].isin(nacionalidad_map.keys())]["nacionalidad"].unique()
-    if len(unmapped) > 0:
-        raise ValueError(f"Unmapped nacionalidad values: {unmapped_original}")
+    df["nacionalidad"] = context.resolve(df["nacionalidad"], "paises", allow_missing=False)
 
     # Insert into table
-    df.to_sql("poblacion_grupo_edad", con=conn, schema="demografia", if_exists="append", index=False)
+    df.to_sql("poblacion_grupo_edad", con=context.conn, schema=context.schema, if_exists="append", index=False)
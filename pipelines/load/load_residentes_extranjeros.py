@@ -1,26 +1,14 @@
-import numpy as np
 import pandas as pd
-from sqlalchemy import text
-from sqlalchemy.engine import Connection
 
+from pipelines.load.loader_context import LoaderContext
 
-def load_residentes_extranjeros(conn: Connection, df: pd.DataFrame) -> None:
-    """Load residentes_extranjeros table from a DataFrame."""
-
-    # Get mapping from pais nombre to id (nan are mapped to None and saved as NULL in the database)
-    result = conn.execute(text("SELECT nombre, pais_id FROM geo.paises"))
-    rows = result.fetchall()
-    nacionalidad_map = {row[0]: row[1] for row in rows}
-    nacionalidad_map[np.nan] = None
 
-    # Check for unmapped nacionalidades before mapping (nan values are not in the map)
-    unmapped = df[~df["nacionalidad"].isin(nacionalidad_map.keys())]["nacionalidad"].unique().tolist()
-    if len(unmapped) > 0:
-        raise ValueError(f"Unmapped nacionalidad values: {unmapped}")
+def load_residentes_extranjeros(context: LoaderContext, df: pd.DataFrame) -> None:
+    """Load residentes_extranjeros table from a DataFrame."""
 
-    # Replace 'nacionalidad' in df with its corresponding id
+    # Replace 'nacionalidad' in df with its corresponding id (nan are saved as NULL in the database)
     df = df.copy()
-    df["nacionalidad"] = df["nacionalidad"].map(nacionalidad_map)
+    df["nacionalidad"] = context.resolve(df["nacionalidad"], "paises")
 
     # Insert into table
-    df.to_sql("residentes_extranjeros", schema="migracion", con=conn, if_exists="append", index=False)
+    df.to_sql("residentes_extranjeros", schema=context.schema, con=context.conn, if_exists="append", index=False)
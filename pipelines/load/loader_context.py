@@ -0,0 +1,75 @@
+"""Context passed to the custom loaders: the connection, the target schema and the geo dimensions.
+
+Each dimension (paises, provincias...) is queried at most once per load, the first time a
+loader resolves a column against it, and kept as an index of names with an array of ids.
+Columns of names are then resolved to ids with a single vectorized lookup."""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+# Name of each dimension with its table in the geo schema and its id column
+DIMENSIONS: Dict[str, Tuple[str, str]] = {
+    "paises": ("paises", "pais_id"),
+    "provincias": ("provincias", "provincia_id"),
+    "comunidades": ("comunidades_autonomas", "comunidad_autonoma_id"),
+    "municipios": ("municipios", "municipio_id"),
+}
+
+
+@dataclass
+class Dimensions:
+    """Lookups of the dimensions shared by every loader of a load.
+
+    Dimensions are read lazily so that the geo tables loaded earlier in the same
+    transaction are seen, from geo_schema (the staging schema when geo is staged too).
+    Names shared by several rows (e.g. municipios with the same name in different
+    provincias) are left out, as they cannot be resolved by name."""
+
+    geo_schema: str = "geo"
+    lookups: Dict[str, Tuple[pd.Index, np.ndarray]] = field(default_factory=dict)
+    # Tables are loaded in threads by parallel loads
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def get(self, conn: Connection, dimension: str) -> Tuple[pd.Index, np.ndarray]:
+        """Return the unique names of a dimension and their ids, querying it on first use."""
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Unknown dimension '{dimension}', expected one of {list(DIMENSIONS)}")
+        with self.lock:
+            if dimension not in self.lookups:
+                table, id_column = DIMENSIONS[dimension]
+                rows = conn.execute(text(f"SELECT nombre, {id_column} FROM {self.geo_schema}.{table}")).fetchall()
+                names = pd.Series([row[0] for row in rows], dtype=object)
+                ids = np.array([row[1] for row in rows], dtype=np.int64)
+                unique = ~names.duplicated(keep=False).to_numpy()
+                self.lookups[dimension] = (pd.Index(names[unique]), ids[unique])
+            return self.lookups[dimension]
+
+
+@dataclass
+class LoaderContext:
+    """Connection and schema a custom loader writes to, with the dimensions of the load."""
+
+    conn: Connection
+    schema: str
+    dimensions: Dimensions = field(default_factory=Dimensions)
+
+    def resolve(self, series: pd.Series, dimension: str, allow_missing: bool = True) -> pd.Series:
+        """Return the ids of the names of a series in a dimension.
+
+        Missing names are resolved to NA (saved as NULL) if allow_missing is set. Raises
+        ValueError listing the values that are not a name of the dimension."""
+        names, ids = self.dimensions.get(self.conn, dimension)
+        positions = names.get_indexer(series)
+        found = positions != -1
+        unmapped = ~found if not allow_missing else ~found & series.notna().to_numpy()
+        if unmapped.any():
+            raise ValueError(f"Unmapped {series.name} values: {series[unmapped].unique().tolist()}")
+        values = np.zeros(len(series), dtype=np.int64)
+        values[found] = ids[positions[found]]
+        return pd.Series(pd.arrays.IntegerArray(values, ~found), index=series.index, name=series.name)
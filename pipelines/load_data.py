@@ -2,18 +2,21 @@
 the database tables with matching names.
 """
 
+import argparse
 import logging
 import os
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Path to clean CSV data (CSV filenames should match SQL table names and columns)
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Connection
+from sqlalchemy.engine import Connection, Engine
 
+from pipelines.extract_transform_data import get_scripts_for_tables
+from pipelines.load.copy_csv import copy_csv, merge_csv
 from pipelines.load.load_eige_dominios import load_eige_dominios
 from pipelines.load.load_eige_indicadores import load_eige_indicadores
 from pipelines.load.load_eige_interseccionalidades import load_eige_interseccionalidades
@@ -21,15 +24,36 @@ from pipelines.load.load_eige_violencia import load_eige_violencia
 from pipelines.load.load_fuentes import load_fuentes
 from pipelines.load.load_poblacion_grupo_edad import load_poblacion_grupo_edad
 from pipelines.load.load_residentes_extranjeros import load_residentes_extranjeros
+from pipelines.load.loader_context import Dimensions, LoaderContext
+from utils.checkpoint import get_completed, mark_completed
+from utils.fingerprint import hash_file, load_manifest, save_manifest
 from utils.logging import setup_logging
+from utils.run_report import count_csv_rows, finish_run_report, measure_step, start_run_report
+from utils.script_paths import get_script_targets
+from utils.sql_schema import get_dependent_views, get_schema_statements, rename_schema, split_statements
 
 CLEAN_DATA_DIR = Path("data") / "clean"
+# Row count and CSV hash of the last load of every table, to reuse unchanged geo and metadata tables
+LOAD_MANIFEST_PATH = Path("data") / "load_manifest.json"
+# Schemas of the tables the other schemas refer to (geo by foreign key, metadata by table name),
+# loaded before them. Not utils.sql_schema.SHARED_SCHEMAS, which also has the enums and views
+REFERENCED_SCHEMAS = {"geo", "metadata"}
+SCHEMA_PATH = Path("sql") / "schema.sql"
+VIEWS_PATH = Path("sql") / "views.sql"
+PERMISSIONS_PATH = Path("sql") / "permissions.sql"
+# Parallel loads fill <schema>__staging and keep the replaced schema as <schema>__old until it is dropped
+STAGING_SUFFIX = "__staging"
+OLD_SUFFIX = "__old"
+
+# Custom loaders insert a DataFrame into their table in the schema of the context
+Loader = Callable[[LoaderContext, pd.DataFrame], None]
 
 # Every table name should match the CSV filename (without extension)
-# and the columns should match the SQL table schema.
+# and the columns should match the SQL table schema. These tables are
+# bulk loaded from the CSV with COPY (see pipelines/load/copy_csv.py).
 # In any other case, a custom loader function should be provided.
 # Parent folder should match the schema name.
-TABLES_TO_LOAD: Dict[Path, Optional[Callable[[Connection, pd.DataFrame], None]]] = {
+TABLES_TO_LOAD: Dict[Path, Optional[Loader]] = {
     CLEAN_DATA_DIR / "geo" / "comunidades_autonomas.csv": None,
     CLEAN_DATA_DIR / "geo" / "provincias.csv": None,
     CLEAN_DATA_DIR / "geo" / "municipios.csv": None,
@@ -109,16 +133,32 @@ TABLES_TO_LOAD: Dict[Path, Optional[Callable[[Connection, pd.DataFrame], None]]]
     CLEAN_DATA_DIR / "seguridad_criminalidad" / "delitos_sexuales.csv": None,
 }
 
+# Columns identifying a row of the tables refreshed by applying the differences to their CSV
+# (see merge_csv) instead of being truncated and loaded again. Only for tables without a custom loader.
+# They reference geo.provincias, so a load that truncates it (e.g. a full load) still empties them
+# with the CASCADE and they are inserted in full; the merge only saves work in --schema/--table loads.
+NATURAL_KEYS: Dict[str, Tuple[str, ...]] = {
+    "violencia_genero.servicio_016": ("provincia_id", "anio", "mes", "persona_consulta", "tipo_violencia"),
+    "violencia_genero.usuarias_atenpro": ("provincia_id", "anio", "mes"),
+    "violencia_genero.dispositivos_electronicos_seguimiento": ("provincia_id", "anio", "mes"),
+    "violencia_genero.viogen": ("provincia_id", "anio", "mes", "nivel_riesgo"),
+}
+
+
+def get_table_name(path: Path) -> str:
+    """Return the schema qualified table name of a clean CSV."""
+    return f"{path.parent.name.lower()}.{path.stem.lower()}"
+
 
 def load_csv_files(paths: List[Path]) -> Dict[str, pd.DataFrame]:
-    """Load CSV files as DataFrames"""
+    """Load the CSV files of the tables with a custom loader as DataFrames"""
     dataframes: Dict[str, pd.DataFrame] = {}
     for path in paths:
         try:
-            df = pd.read_csv(path, sep=";", escapechar="\\")
-            schema = path.parent.name.lower()
-            table_name = path.stem.lower()
-            full_table_name = f"{schema}.{table_name}"
+            full_table_name = get_table_name(path)
+            with measure_step("read", full_table_name) as step:
+                df = pd.read_csv(path, sep=";", escapechar="\\")
+                step.rows_in = step.rows_out = len(df)
             dataframes[full_table_name] = df
         except Exception as e:
             logging.error(f"Failed to read '{path}': {e}")
@@ -126,8 +166,10 @@ def load_csv_files(paths: List[Path]) -> Dict[str, pd.DataFrame]:
 
 
 def truncate_tables(conn: Connection, table_names: List[str]):
-    """Truncate each table before insert"""
+    """Truncate each table before insert, except the tables merged by natural key"""
     for table in table_names:
+        if table in NATURAL_KEYS:
+            continue
         try:
             conn.execute(text(f"TRUNCATE {table} RESTART IDENTITY CASCADE"))
         except Exception as e:
@@ -135,53 +177,171 @@ def truncate_tables(conn: Connection, table_names: List[str]):
     logging.info("Truncated all target tables")
 
 
-def main(schema_to_load: Optional[str] = None):
-    """Main function to load data into the database. If schema_to_load is provided,
-    only tables from that schema will be loaded (geo and metadata are always loaded).
-    If no schema is provided, all tables will be loaded."""
-
-    # Genereate the list of tables to load per schema
-    if schema_to_load:
-        always_schemas = {"geo", "metadata"}
-        schemas_to_load = set(always_schemas)
-        schemas_to_load.add(schema_to_load.lower())
-        filtered_tables = {
-            path: loader for path, loader in TABLES_TO_LOAD.items() if path.parent.name.lower() in schemas_to_load
-        }
-    else:
-        filtered_tables = TABLES_TO_LOAD
-
-    # Read CSV files into DataFrames
-    dataframes = load_csv_files(list(filtered_tables.keys()))
+def get_dependent_tables(conn: Connection, tables: Set[str]) -> Set[str]:
+    """Return the tables referencing the given ones through foreign keys, recursively.
 
-    # Create database engine
-    engine = create_engine(
-        (
-            f"postgresql://{os.getenv('DB_USER')}:"
-            f"{os.getenv('DB_PASSWORD')}@"
-            f"{os.getenv('DB_HOST', 'localhost')}:"
-            f"{os.getenv('DB_PORT', '5432')}/"
-            f"{os.getenv('DB_NAME')}"
+    Truncating a table with CASCADE also empties them, so they must be reloaded."""
+    result = conn.execute(
+        text(
+            "WITH RECURSIVE dependents AS ("
+            "    SELECT conrelid FROM pg_constraint"
+            "    WHERE contype = 'f' AND confrelid = ANY(CAST(:tables AS regclass[]))"
+            "    UNION"
+            "    SELECT c.conrelid FROM pg_constraint c JOIN dependents d ON c.confrelid = d.conrelid"
+            "    WHERE c.contype = 'f'"
+            ") "
+            "SELECT n.nspname || '.' || r.relname FROM dependents d "
+            "JOIN pg_class r ON r.oid = d.conrelid JOIN pg_namespace n ON n.oid = r.relnamespace"
         ),
+        {"tables": sorted(tables)},
     )
+    return {row[0] for row in result.fetchall()}
+
+
+def get_tables_to_rebuild(conn: Connection, table: str) -> Set[str]:
+    """Return a table, the tables built by the ET scripts that rebuild it and their dependents."""
+    tables = {table.lower()}
+    for script in get_scripts_for_tables([table]):
+        tables.update(get_script_targets(script))
+    return tables | get_dependent_tables(conn, tables)
+
+
+def has_table_data(path: Path, loader: Optional[Callable], dataframes: Dict[str, pd.DataFrame]) -> bool:
+    """Return True if the CSV of a table exists, or was read into a DataFrame for its custom loader."""
+    if loader is None:
+        return path.is_file()
+    return get_table_name(path) in dataframes
+
+
+def load_table(
+    conn: Connection,
+    path: Path,
+    loader: Optional[Loader],
+    df: Optional[pd.DataFrame],
+    schema: Optional[str] = None,
+    dimensions: Optional[Dimensions] = None,
+) -> int:
+    """Load a table, with its custom loader if any or else by copying (or merging, if it has a
+    natural key) its CSV, and return the table row count.
+
+    The table is loaded into its own schema unless another one (e.g. a staging schema) is given.
+    Custom loaders resolve names against the dimensions shared by the tables of the load."""
+    schema = schema or path.parent.name.lower()
+    table_name = path.stem.lower()
+    full_table_name = get_table_name(path)
+    with measure_step("load", full_table_name) as step:
+        if loader is not None:
+            step.rows_in = len(df)
+            loader(LoaderContext(conn, schema, dimensions or Dimensions()), df)
+            logging.info(f"Loaded table with custom loader: {schema}.{table_name}")
+        elif full_table_name in NATURAL_KEYS:
+            step.rows_in = merge_csv(conn, path, schema, table_name, NATURAL_KEYS[full_table_name])
+        else:
+            step.rows_in = copy_csv(conn, path, schema, table_name)
+            logging.info(f"Loaded table: {schema}.{table_name}")
+        step.rows_out = conn.execute(text(f"SELECT count(*) FROM {schema}.{table_name}")).scalar_one()
+    return step.rows_out
+
+
+def is_table_intact(conn: Connection, path: Path, checkpoints: dict, csv_hash: Optional[str]) -> bool:
+    """Return True if the table was loaded from the current CSV and still has the recorded rows."""
+    checkpoint = checkpoints.get(get_table_name(path))
+    if checkpoint is None or checkpoint["csv"] != csv_hash:
+        return False
+    if conn.execute(text("SELECT to_regclass(:table)"), {"table": get_table_name(path)}).scalar_one() is None:
+        return False
+    rows = conn.execute(text(f"SELECT count(*) FROM {get_table_name(path)}")).scalar_one()
+    return rows == checkpoint["rows"]
+
+
+def get_tables_to_refresh(conn: Connection, schema: str) -> Set[str]:
+    """Return the tables of a schema, the geo and metadata tables whose CSV changed since
+    they were last loaded and the tables depending on those."""
+    manifest = load_manifest(LOAD_MANIFEST_PATH)
+    changed = {
+        get_table_name(path)
+        for path in TABLES_TO_LOAD
+        if path.parent.name in REFERENCED_SCHEMAS
+        and not is_table_intact(conn, path, manifest, hash_file(path) if path.exists() else None)
+    }
+    tables = {get_table_name(path) for path in TABLES_TO_LOAD if path.parent.name.lower() == schema}
+    if changed:
+        logging.info(f"Geo and metadata tables changed since their last load: {sorted(changed)}")
+        tables |= changed | get_dependent_tables(conn, changed)
+    return tables
+
+
+def record_loaded_tables(loaded: Dict[str, dict]):
+    """Record the row count and CSV hash of the loaded tables in the load manifest."""
+    manifest = load_manifest(LOAD_MANIFEST_PATH)
+    manifest.update(loaded)
+    save_manifest(manifest, LOAD_MANIFEST_PATH)
+
+
+def load_tables_with_checkpoints(engine: Engine, tables: Dict[Path, Optional[Loader]]):
+    """Load each table in its own transaction, recording it in the pipeline run state.
+
+    Tables already loaded in the run are skipped if their CSV did not change and they
+    still have the recorded row count (truncating with CASCADE may have emptied them)."""
+
+    checkpoints = get_completed("load")
+    csv_hashes = {path: hash_file(path) for path in tables if path.exists()}
+
+    pending = [path for path in tables if get_table_name(path) not in checkpoints]
+    while True:
+        with engine.begin() as conn:
+            if pending:
+                truncate_tables(conn, [get_table_name(path) for path in pending])
+            broken = [
+                path
+                for path in tables
+                if path not in pending and not is_table_intact(conn, path, checkpoints, csv_hashes.get(path))
+            ]
+        if not broken:
+            break
+        pending = [path for path in tables if path in pending or path in broken]
+
+    for path in tables:
+        if path not in pending:
+            logging.info(f"Skipping table loaded in the resumed run: {get_table_name(path)}")
+
+    dataframes = load_csv_files([path for path in pending if tables[path] is not None])
+    dimensions = Dimensions()
+    for path in pending:
+        full_table_name = get_table_name(path)
+        if not has_table_data(path, tables[path], dataframes):
+            logging.error(f"No data for table: {full_table_name}")
+            raise RuntimeError(f"No data found for table '{full_table_name}'")
+        try:
+            with engine.begin() as conn:
+                rows = load_table(conn, path, tables[path], dataframes.get(full_table_name), dimensions=dimensions)
+        except Exception as e:
+            logging.error(f"Failed to load '{full_table_name}': {e}")
+            raise RuntimeError(f"Failed to load table '{full_table_name}': {e}")
+        mark_completed("load", full_table_name, {"rows": rows, "csv": csv_hashes[path]})
+        record_loaded_tables({full_table_name: {"rows": rows, "csv": csv_hashes[path]}})
+
+
+def load_tables(engine: Engine, tables: Dict[Path, Optional[Loader]]):
+    """Truncate and load all tables in a single transaction."""
+
+    # Read CSV files of the custom loaders into DataFrames, the other tables are copied from their CSV
+    dataframes = load_csv_files([path for path, loader in tables.items() if loader is not None])
+    dimensions = Dimensions()
+
+    available = [path for path, loader in tables.items() if has_table_data(path, loader, dataframes)]
 
     # Insert with full transaction
+    loaded: Dict[str, dict] = {}
     with engine.begin() as conn:
-        truncate_tables(conn, list(dataframes.keys()))
+        truncate_tables(conn, [get_table_name(path) for path in available])
 
-        for path, loader in filtered_tables.items():
-            schema = path.parent.name.lower()
+        for path, loader in tables.items():
             table_name = path.stem.lower()
-            full_table_name = f"{schema}.{table_name}"
-            df = dataframes.get(full_table_name)
-            if df is not None:
+            if path in available:
                 try:
-                    if loader is not None:
-                        loader(conn, df)
-                        logging.info(f"Loaded table with custom loader: {table_name}")
-                    else:
-                        df.to_sql(table_name, schema=schema, con=conn, if_exists="append", index=False)
-                        logging.info(f"Loaded table: {table_name}")
+                    rows = load_table(conn, path, loader, dataframes.get(get_table_name(path)), dimensions=dimensions)
+                    loaded[get_table_name(path)] = {"rows": rows, "csv": hash_file(path)}
                 except Exception as e:
                     logging.error(f"Failed to load '{table_name}': {e}")
                     logging.warning("Performing rollback for all tables")
@@ -189,9 +349,249 @@ def main(schema_to_load: Optional[str] = None):
             else:
                 logging.error(f"No data for table: {table_name}")
                 raise RuntimeError(f"No data found for table '{table_name}'")
+    record_loaded_tables(loaded)
+
+
+def get_dependent_view_statements(schemas: List[str]):
+    """Return the statements creating the views that read from any of the schemas, in file order."""
+    views_sql = VIEWS_PATH.read_text()
+    names = {view.name for schema in schemas for view in get_dependent_views(views_sql, schema)}
+    return [view for view in split_statements(views_sql) if view.kind == "VIEW" and view.name in names]
+
+
+def get_referencing_schemas(conn: Connection, schemas: Set[str]) -> Set[str]:
+    """Return the schemas with tables referencing a table of the given schemas through foreign
+    keys, leaving out the staging and replaced schemas of parallel loads."""
+    result = conn.execute(
+        text(
+            "SELECT DISTINCT n.nspname FROM pg_constraint c "
+            "JOIN pg_class r ON r.oid = c.conrelid JOIN pg_namespace n ON n.oid = r.relnamespace "
+            "JOIN pg_class f ON f.oid = c.confrelid JOIN pg_namespace fn ON fn.oid = f.relnamespace "
+            "WHERE c.contype = 'f' AND fn.nspname = ANY(CAST(:schemas AS name[]))"
+        ),
+        {"schemas": sorted(schemas)},
+    )
+    return {schema for schema in result.scalars() if not schema.endswith((STAGING_SUFFIX, OLD_SUFFIX))}
+
+
+def get_schemas_to_stage(conn: Connection, schemas: Set[str]) -> List[str]:
+    """Return the schemas and, recursively, the schemas referencing them.
+
+    Foreign keys follow their tables when a schema is renamed, so a schema referencing a
+    replaced one would keep pointing to the old tables and lose its constraints when they
+    are dropped. It must be staged and swapped in along with it."""
+    staged = set(schemas)
+    while referencing := get_referencing_schemas(conn, staged) - staged:
+        logging.info(f"Staging the schemas referencing the staged ones too: {sorted(referencing)}")
+        staged |= referencing
+    return sorted(staged)
+
+
+def create_staging_schemas(conn: Connection, schemas: List[str]):
+    """Create an empty staging schema with the tables of each schema, dropping leftovers of
+    a previous parallel load. The tables reference the staged tables of the other schemas
+    and the live tables and enums of the schemas not staged."""
+    for schema in schemas:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {schema}{STAGING_SUFFIX} CASCADE"))
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {schema}{OLD_SUFFIX} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {schema}{STAGING_SUFFIX}"))
+    # Tables are created in file order, which creates the referenced tables first
+    for statement in split_statements(SCHEMA_PATH.read_text()):
+        if statement.kind == "TABLE" and statement.name.split(".", 1)[0] in schemas:
+            sql = statement.sql
+            for schema in schemas:
+                sql = rename_schema(sql, schema, f"{schema}{STAGING_SUFFIX}")
+            conn.execute(text(sql))
+    logging.info(f"Created staging schemas for: {schemas}")
+
+
+def validate_staging_schemas(conn: Connection, schemas: List[str], rows: Dict[Path, int]):
+    """Check that every staging schema has all the tables of its schema, that no table was
+    left empty while its CSV has rows and that no other schema references a replaced one.
+    Constraints were already checked while loading."""
+    outside = get_referencing_schemas(conn, set(schemas)) - set(schemas)
+    if outside:
+        raise RuntimeError(f"Schemas {sorted(outside)} reference replaced schemas and would lose their foreign keys")
+    schema_sql = SCHEMA_PATH.read_text()
+    for schema in schemas:
+        staging = f"{schema}{STAGING_SUFFIX}"
+        expected = {
+            statement.name.split(".", 1)[1]
+            for statement in get_schema_statements(schema_sql, schema)
+            if statement.kind == "TABLE"
+        }
+        found = set(
+            conn.execute(
+                text("SELECT table_name FROM information_schema.tables WHERE table_schema = :schema"),
+                {"schema": staging},
+            ).scalars()
+        )
+        if found != expected:
+            raise RuntimeError(
+                f"Staging schema '{staging}' does not match '{schema}': "
+                f"missing {sorted(expected - found)}, unexpected {sorted(found - expected)}"
+            )
+    empty = [get_table_name(path) for path, count in rows.items() if count == 0 and count_csv_rows(path)]
+    if empty:
+        raise RuntimeError(f"Staged tables are empty while their CSV has rows: {empty}")
+
+
+def swap_staging_schemas(conn: Connection, schemas: List[str]):
+    """Replace each schema by its staging schema with renames, keeping the replaced one as
+    <schema>__old. The views reading from the schemas are recreated on the new tables and
+    the read-only permissions granted again."""
+    for schema in schemas:
+        conn.execute(text(f"ALTER SCHEMA {schema} RENAME TO {schema}{OLD_SUFFIX}"))
+        conn.execute(text(f"ALTER SCHEMA {schema}{STAGING_SUFFIX} RENAME TO {schema}"))
+    for view in get_dependent_view_statements(schemas):
+        conn.execute(text(view.sql))
+    conn.execute(text(PERMISSIONS_PATH.read_text()))
+
+
+def load_tables_in_parallel(engine: Engine, tables: Dict[Path, Optional[Loader]], jobs: int):
+    """Load the tables of each schema concurrently into staging schemas and swap them in at once.
+
+    The whole schema of every table is replaced, so all its tables are loaded, along with the
+    schemas referencing it (see get_schemas_to_stage): staging geo stages almost every schema.
+    Staged geo and metadata tables are referenced by the others, so they are loaded first,
+    one after another. The staging schemas are validated and swapped in within one
+    short transaction: readers only wait for the renames and a failed load leaves the live
+    schemas untouched."""
+    if not tables:
+        return
+    with engine.connect() as conn:
+        schemas = get_schemas_to_stage(conn, {path.parent.name for path in tables})
+    staged = {path: loader for path, loader in TABLES_TO_LOAD.items() if path.parent.name in schemas}
+
+    dataframes = load_csv_files([path for path, loader in staged.items() if loader is not None])
+    # Names are resolved against the staged geo tables when geo is replaced too
+    dimensions = Dimensions(f"geo{STAGING_SUFFIX}" if "geo" in schemas else "geo")
+    missing = [get_table_name(path) for path, loader in staged.items() if not has_table_data(path, loader, dataframes)]
+    if missing:
+        logging.error(f"No data for tables: {missing}")
+        raise RuntimeError(f"No data found for tables {missing}")
+
+    with engine.begin() as conn:
+        create_staging_schemas(conn, schemas)
+
+    def load_staged_table(path: Path) -> int:
+        with engine.begin() as conn:
+            staging = f"{path.parent.name}{STAGING_SUFFIX}"
+            return load_table(conn, path, staged[path], dataframes.get(get_table_name(path)), staging, dimensions)
+
+    rows: Dict[Path, int] = {}
+    failed: Dict[str, Exception] = {}
+    referenced = [path for path in staged if path.parent.name in REFERENCED_SCHEMAS]
+    for path in referenced:
+        try:
+            rows[path] = load_staged_table(path)
+        except Exception as e:
+            logging.error(f"Failed to load '{get_table_name(path)}': {e}")
+            failed[get_table_name(path)] = e
+            break
+    if not failed:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = {path: executor.submit(load_staged_table, path) for path in staged if path not in referenced}
+            for path, future in futures.items():
+                try:
+                    rows[path] = future.result()
+                except Exception as e:
+                    logging.error(f"Failed to load '{get_table_name(path)}': {e}")
+                    failed[get_table_name(path)] = e
+    if failed:
+        with engine.begin() as conn:
+            for schema in schemas:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {schema}{STAGING_SUFFIX} CASCADE"))
+        raise RuntimeError(f"Failed to load tables {sorted(failed)}, the live schemas were left untouched")
+
+    with engine.begin() as conn:
+        validate_staging_schemas(conn, schemas, rows)
+        swap_staging_schemas(conn, schemas)
+    logging.info(f"Swapped in the staging schemas: {schemas}")
+
+    with engine.begin() as conn:
+        for schema in schemas:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {schema}{OLD_SUFFIX} CASCADE"))
+    record_loaded_tables(
+        {get_table_name(path): {"rows": count, "csv": hash_file(path)} for path, count in rows.items()}
+    )
+
+
+def main(schema_to_load: Optional[str] = None, checkpoint: bool = False, table: Optional[str] = None, jobs: int = 1):
+    """Main function to load data into the database. If schema_to_load is provided,
+    only tables from that schema will be loaded, along with the geo and metadata tables
+    whose CSV changed since their last load (and the tables depending on them).
+    If table is provided (schema.table), only that table, the other tables rebuilt by its
+    ET scripts and the tables referencing them are reloaded. If neither is provided,
+    all tables will be loaded.
+
+    All tables are loaded in a single transaction, unless checkpoint is set: then each
+    table is committed on its own and recorded in the pipeline run state (see main.py),
+    so a failed load can be resumed. If jobs is greater than 1, the schemas are loaded
+    with that many connections into staging schemas and swapped in at once
+    (see load_tables_in_parallel)."""
+    if jobs > 1 and checkpoint:
+        raise ValueError("Parallel loads are swapped in at once and cannot be checkpointed")
+
+    # Create database engine
+    engine = create_engine(
+        (
+            f"postgresql://{os.getenv('DB_USER')}:"
+            f"{os.getenv('DB_PASSWORD')}@"
+            f"{os.getenv('DB_HOST', 'localhost')}:"
+            f"{os.getenv('DB_PORT', '5432')}/"
+            f"{os.getenv('DB_NAME')}"
+        ),
+        pool_size=max(jobs, 5),
+    )
+
+    # Genereate the list of tables to load per schema
+    if table:
+        if table.lower() not in {get_table_name(path) for path in TABLES_TO_LOAD}:
+            raise ValueError(f"Unknown table: {table}")
+        with engine.connect() as conn:
+            tables_to_load = get_tables_to_rebuild(conn, table)
+        logging.info(f"Tables to reload: {sorted(tables_to_load)}")
+        filtered_tables = {
+            path: loader for path, loader in TABLES_TO_LOAD.items() if get_table_name(path) in tables_to_load
+        }
+    elif schema_to_load:
+        with engine.connect() as conn:
+            tables_to_load = get_tables_to_refresh(conn, schema_to_load.lower())
+        filtered_tables = {
+            path: loader for path, loader in TABLES_TO_LOAD.items() if get_table_name(path) in tables_to_load
+        }
+    else:
+        filtered_tables = TABLES_TO_LOAD
+
+    if jobs > 1:
+        load_tables_in_parallel(engine, filtered_tables, jobs)
+    elif checkpoint:
+        load_tables_with_checkpoints(engine, filtered_tables)
+    else:
+        load_tables(engine, filtered_tables)
 
 
 if __name__ == "__main__":
     setup_logging()
-    schema_arg = sys.argv[1] if len(sys.argv) > 1 else None
-    main(schema_arg)
+    parser = argparse.ArgumentParser(description="Load clean CSV files into the database")
+    parser.add_argument("schema", nargs="?", help="If provided, only tables for this schema will be loaded")
+    parser.add_argument("--table", help="If provided (schema.table), only this table and its dependents are reloaded")
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Commit each table and record it in the pipeline run state, skipping tables already loaded",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Load the tables with this many connections into staging schemas swapped in at the end",
+    )
+    args = parser.parse_args()
+    report_path = start_run_report()
+    try:
+        main(args.schema, args.checkpoint, args.table, args.jobs)
+    finally:
+        if report_path is not None:
+            finish_run_report(report_path)
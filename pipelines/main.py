@@ -2,7 +2,9 @@
 """Orchestrate database pipeline steps.
 
 Usage:
-    python pipeline.py [step] [--only] [--schema SCHEMA]
+    python pipeline.py [step] [--only] [--schema SCHEMA | --table SCHEMA.TABLE]
+                       [--jobs N] [--load-jobs N] [--in-process] [--force] [--timeout SECONDS]
+                       [--checkpoint] [--resume] [--count-rows]
 
 Steps:
     drop   - Drop all schemas
@@ -12,13 +14,43 @@ Steps:
 
 Options:
     --only      Run only the specified step, skipping previous steps.
-    --schema    If provided, only ET and load for this schema will be run
-                (geo and metadata are always loaded).
+    --schema    If provided, only this schema, its enums and the analisis views that
+                depend on it are dropped and created, and only ET and load for this
+                schema will be run (geo and metadata are reloaded only if changed).
+    --table     If provided (schema.table), only the ET scripts that build this table
+                are run and only this table and the tables depending on it are reloaded.
+                Schemas are neither dropped nor created.
+    --jobs      Number of extract-transform scripts to run in parallel.
+    --load-jobs Number of tables to load in parallel into staging schemas, which are
+                swapped in at once when all of them are loaded (not checkpointed).
+                Reloading geo or metadata also stages the schemas referencing them.
+    --checkpoint
+                Commit each loaded table on its own so that a failed load can be
+                resumed from the first table not loaded. Implied by --resume.
+    --in-process
+                Run extract-transform scripts in warm worker processes.
+    --force     Run every extract-transform script, even if its inputs and code
+                have not changed since its last successful run.
+    --timeout   Terminate extract-transform scripts running longer than this many seconds.
+    --top       Number of slowest steps shown in the run report summary.
+    --resume    Resume the last failed run with the same steps. Completed steps,
+                ET scripts and loaded tables whose outputs are intact are skipped
+                (tables only if the failed run was checkpointed).
+    --count-rows
+                Count the rows of the CSVs read and written by every ET script in the
+                run report (reads all of them again).
+
+Wall time, CPU time, peak memory and rows of every step are saved to a JSON and a
+CSV report under ``logs/reports``. Progress is checkpointed in ``logs/main/state.json``
+so a failed run can be resumed. The load step truncates and loads all tables in a
+single transaction, rolled back as a whole if any table fails, unless ``--checkpoint``
+or ``--resume`` is given, in which case it commits each table on its own.
 
 If ``step`` is omitted, the script executes the full pipeline. When a ``step``
 is provided, all previous steps are also run unless ``--only`` is supplied.
-If ``--schema`` is provided, only extract-transform and load steps for that
-schema will be executed (geo and metadata always included).
+If ``--schema`` is provided, every step is scoped to that schema; the shared
+schemas (geo, metadata, enums, analisis) are kept and their tables are only
+reloaded when their clean CSVs changed since they were last loaded.
 """
 
 import argparse
@@ -27,8 +59,11 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
+from utils.checkpoint import clear_state, get_completed, load_state, mark_completed, start_run
 from utils.logging import setup_logging
-from utils.run_script import run_python_script
+from utils.run_report import finish_run_report, start_run_report
+from utils.run_script import run_python_scripts
+from utils.sql_schema import SHARED_SCHEMAS
 
 load_dotenv()
 
@@ -39,6 +74,8 @@ ACTIONS: dict[str, list[Path]] = {
     "et": [PIPELINES_DIR / "extract_transform_data.py"],
     "load": [PIPELINES_DIR / "load_data.py"],
 }
+# Scripts that checkpoint their own progress (ET scripts and loaded tables)
+CHECKPOINTED_SCRIPTS = {"extract_transform_data.py", "load_data.py"}
 
 
 def main():
@@ -54,12 +91,70 @@ def main():
         action="store_true",
         help="Run only the specified step without previous steps",
     )
-    parser.add_argument(
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument(
         "--schema",
         type=str,
         help="If provided, only ET and load for this schema will be run",
     )
+    target.add_argument(
+        "--table",
+        type=str,
+        help="If provided (schema.table), only ET and load for this table and its dependents will be run",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of extract-transform scripts to run in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "--load-jobs",
+        type=int,
+        default=1,
+        help="Number of tables to load in parallel into staging schemas swapped in at the end (default: 1)",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run extract-transform scripts in warm worker processes",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run every extract-transform script even if its inputs have not changed",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        help="Terminate extract-transform scripts running longer than this many seconds",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of slowest steps shown in the run report summary (default: 10)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Commit each loaded table on its own so that a failed load can be resumed",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume the last failed run, skipping the steps, ET scripts and tables it completed",
+    )
+    parser.add_argument(
+        "--count-rows",
+        action="store_true",
+        help="Count the rows of the CSVs of every ET script in the run report",
+    )
     args = parser.parse_args()
+    if args.table and args.step in {"drop", "create"}:
+        parser.error("--table can only be used with the et and load steps")
+    if args.checkpoint and args.load_jobs > 1:
+        parser.error("--checkpoint cannot be used with --load-jobs, parallel loads are swapped in at once")
 
     scripts_to_run: list[tuple[Path, list[str]]] = []
     step_order = list(ACTIONS.keys())
@@ -78,27 +173,81 @@ def main():
             for script in ACTIONS[step]:
                 scripts_to_run.append((script, []))
 
-    # If --schema is provided, pass it to extract_transform_data.py and load_data.py
+    # If --schema is provided, pass it to every step. Only that schema and its dependent
+    # views are dropped and created again; shared schemas still reset the whole database
     if args.schema:
-        scripts_to_run = (
-            [
-                (PIPELINES_DIR / "drop_schemas.py", []),
-                (PIPELINES_DIR / "create_schemas.py", []),
-                (PIPELINES_DIR / "extract_transform_data.py", [args.schema]),
-                (PIPELINES_DIR / "load_data.py", [args.schema]),
-            ]
-            if args.step is None
-            else [
-                (script, [args.schema] if script.name in {"extract_transform_data.py", "load_data.py"} else [])
-                for script, _ in scripts_to_run
-            ]
-        )
-
-    for script, script_args in scripts_to_run:
-        logging.info("----------------------------------------")
-        logging.info(f"Running {script.name} {' '.join(script_args)}")
-        logging.info("----------------------------------------")
-        run_python_script(script, *script_args)
+        scoped_scripts = {"extract_transform_data.py", "load_data.py"}
+        if args.schema.lower() not in SHARED_SCHEMAS:
+            scoped_scripts |= {"drop_schemas.py", "create_schemas.py"}
+        scripts_to_run = [
+            (script, [args.schema] if script.name in scoped_scripts else []) for script, _ in scripts_to_run
+        ]
+
+    # If --table is provided, rebuild only that table in the existing schemas
+    if args.table:
+        scripts_to_run = [
+            (script, ["--table", args.table])
+            for script, _ in scripts_to_run
+            if script.name in {"extract_transform_data.py", "load_data.py"}
+        ]
+
+    # Start a new run or resume the last one if it had the same steps
+    plan = [[str(script), *script_args] for script, script_args in scripts_to_run]
+    if args.resume and load_state().get("plan") == plan:
+        logging.info("Resuming the last run")
+    else:
+        if args.resume:
+            logging.warning("No interrupted run with the same steps to resume, starting a new run")
+        start_run(plan)
+    # The load step is only checkpointed on request, as it then gives up rolling back all
+    # tables at once. Parallel loads are swapped in all at once and never checkpointed
+    checkpointed_scripts = CHECKPOINTED_SCRIPTS
+    if not (args.checkpoint or args.resume) or args.load_jobs > 1:
+        checkpointed_scripts = CHECKPOINTED_SCRIPTS - {"load_data.py"}
+    scripts_to_run = [
+        (script, script_args + ["--checkpoint"] if script.name in checkpointed_scripts else script_args)
+        for script, script_args in scripts_to_run
+    ]
+    if args.load_jobs > 1:
+        scripts_to_run = [
+            (script, script_args + ["--jobs", str(args.load_jobs)] if script.name == "load_data.py" else script_args)
+            for script, script_args in scripts_to_run
+        ]
+
+    # Forward the execution options of the extract-transform scripts
+    et_args: list[str] = []
+    if args.jobs > 1:
+        et_args += ["--jobs", str(args.jobs)]
+    if args.in_process:
+        et_args.append("--in-process")
+    if args.force:
+        et_args.append("--force")
+    if args.timeout is not None:
+        et_args += ["--timeout", str(args.timeout)]
+    scripts_to_run = [
+        (script, script_args + et_args if script.name == "extract_transform_data.py" else script_args)
+        for script, script_args in scripts_to_run
+    ]
+
+    # Every step records its metrics in a report saved under logs/reports
+    report_path = start_run_report(count_rows=args.count_rows)
+    try:
+        for (script, script_args), step_key in zip(scripts_to_run, [" ".join(entry) for entry in plan]):
+            # Checkpointed scripts always run to verify and skip their completed items
+            if step_key in get_completed("steps") and script.name not in checkpointed_scripts:
+                logging.info(f"Skipping {script.name}, completed in the resumed run")
+                continue
+            logging.info("----------------------------------------")
+            logging.info(f"Running {script.name} {' '.join(script_args)}")
+            logging.info("----------------------------------------")
+            (result,) = run_python_scripts([(script, script_args)])
+            if not result.ok:
+                raise RuntimeError(result.describe())
+            mark_completed("steps", step_key)
+        clear_state()
+    finally:
+        if report_path is not None:
+            finish_run_report(report_path, top_n=args.top)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,95 @@
+import sys
+
+import pytest
+
+import pipelines.main as pipeline_main
+from utils.checkpoint import STATE_PATH, clear_state, get_completed, load_state, mark_completed, start_run
+
+
+class Result:
+    def __init__(self, ok: bool):
+        self.ok = ok
+
+    def describe(self) -> str:
+        return "failed"
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """Run pipelines/main.py in tmp_path with fake scripts, failing the ones listed in fail."""
+    monkeypatch.chdir(tmp_path)
+    runs: list[tuple[str, list[str]]] = []
+    fail: set[str] = set()
+
+    def run_python_scripts(scripts):
+        ((script, script_args),) = scripts
+        runs.append((script.name, script_args))
+        return [Result(script.name not in fail)]
+
+    monkeypatch.setattr(pipeline_main, "run_python_scripts", run_python_scripts)
+
+    def run(*args: str) -> list[tuple[str, list[str]]]:
+        runs.clear()
+        monkeypatch.setattr(sys, "argv", ["main.py", *args])
+        try:
+            pipeline_main.main()
+        except RuntimeError:
+            pass
+        return list(runs)
+
+    run.fail = fail
+    return run
+
+
+def test_checkpoint_state(tmp_path):
+    path = tmp_path / "state.json"
+    assert load_state(path) == {} and get_completed("load", path) == {}
+    start_run([["pipelines/load_data.py"]], path)
+    mark_completed("load", "salud.casos", {"rows": 2, "csv": "abc"}, path)
+    mark_completed("steps", "pipelines/load_data.py", path=path)
+    assert get_completed("load", path) == {"salud.casos": {"rows": 2, "csv": "abc"}}
+    assert load_state(path)["plan"] == [["pipelines/load_data.py"]]
+    # A new run discards the checkpoints of the previous one
+    start_run([["pipelines/load_data.py"]], path)
+    assert get_completed("load", path) == {} and get_completed("steps", path) == {}
+    clear_state(path)
+    assert not path.exists()
+    path.write_text("{")
+    assert load_state(path) == {}
+
+
+def test_resume_same_plan(pipeline):
+    pipeline.fail.add("extract_transform_data.py")
+    runs = pipeline()
+    assert [name for name, _ in runs] == ["drop_schemas.py", "create_schemas.py", "extract_transform_data.py"]
+    assert set(get_completed("steps")) == {"pipelines/drop_schemas.py", "pipelines/create_schemas.py"}
+
+    pipeline.fail.clear()
+    runs = pipeline("--resume")
+    # Completed steps are skipped, checkpointed ET scripts always run and the load is checkpointed
+    assert runs == [("extract_transform_data.py", ["--checkpoint"]), ("load_data.py", ["--checkpoint"])]
+    assert not STATE_PATH.exists()
+
+
+def test_resume_other_plan_starts_fresh(pipeline):
+    pipeline.fail.add("create_schemas.py")
+    pipeline("create")
+    assert set(get_completed("steps")) == {"pipelines/drop_schemas.py"}
+
+    pipeline.fail.clear()
+    runs = pipeline("--resume")
+    # The drop step completed in a run with other steps, so it runs again
+    assert [name for name, _ in runs] == [
+        "drop_schemas.py",
+        "create_schemas.py",
+        "extract_transform_data.py",
+        "load_data.py",
+    ]
+    assert not STATE_PATH.exists()
+
+
+def test_completed_run_clears_state(pipeline):
+    runs = pipeline()
+    # Without --checkpoint or --resume the load keeps its single transaction
+    assert runs[-1] == ("load_data.py", [])
+    assert not STATE_PATH.exists()
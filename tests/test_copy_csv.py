@@ -0,0 +1,98 @@
+import csv
+import io
+
+import pandas as pd
+import pytest
+
+import pipelines.load.copy_csv as copy_csv_module
+from pipelines.load.copy_csv import CsvStream, copy_csv, read_header, read_rows
+
+DF = pd.DataFrame(
+    {
+        "id": [1, 2, None, 3],
+        "nombre": ["Álava", "a;b", 'say "hi"', "line\nbreak"],
+        "valor": [1.5, None, 2.0, 1e20],
+        "nota": ["NA", None, "null", "None"],
+    }
+)
+# Order of the columns in the table, which the COPY follows
+TABLE_COLUMNS = {"valor": "double precision", "extra": "integer", "nota": "text", "id": "integer", "nombre": "text"}
+
+
+def write_csv(path, quoting):
+    DF.to_csv(path, sep=";", index=False, quoting=quoting, escapechar="\\")
+    return path
+
+
+def parse_copy(data):
+    """Read COPY data as PostgreSQL does with FORMAT csv, DELIMITER ';' and FORCE_NULL."""
+    return [[value if value != "" else None for value in row] for row in csv.reader(io.StringIO(data), delimiter=";")]
+
+
+def typed(value, column):
+    if value is None or pd.isna(value):
+        return None
+    if TABLE_COLUMNS[column] == "integer":
+        return int(float(value))
+    if TABLE_COLUMNS[column] == "double precision":
+        return float(value)
+    return str(value)
+
+
+@pytest.mark.parametrize("quoting", [csv.QUOTE_MINIMAL, csv.QUOTE_NONE])
+def test_read_rows_matches_pandas(tmp_path, quoting):
+    path = write_csv(tmp_path / "tabla.csv", quoting)
+    header = read_header(path)
+    integer_columns = [i for i, column in enumerate(header) if TABLE_COLUMNS[column] == "integer"]
+    rows = list(read_rows(path, integer_columns))
+
+    expected = pd.read_csv(path, sep=";", escapechar="\\")
+    assert header == list(expected.columns)
+    assert [[typed(value or None, column) for value, column in zip(row, header)] for row in rows] == [
+        [typed(value, column) for value, column in zip(row, header)] for row in expected.itertuples(index=False)
+    ]
+    # Integers written as floats because of the missing value are loaded as integers
+    assert [row[0] for row in rows] == ["1", "2", "", "3"]
+    assert [row[3] for row in rows] == ["", "", "", ""]
+
+
+def test_csv_stream_batches(monkeypatch):
+    monkeypatch.setattr(copy_csv_module, "COPY_BATCH_ROWS", 2)
+    rows = [[str(i), f'a;"{i}"\n', ""] for i in range(5)]
+    stream = CsvStream(iter(rows))
+    batches = []
+    while data := stream.read(8192):
+        batches.append(data)
+    assert [len(parse_copy(batch)) for batch in batches] == [2, 2, 1]
+    assert stream.rows == 5 and stream.read() == ""
+    assert parse_copy("".join(batches)) == [[i, value, None] for i, value, _ in rows]
+
+
+def test_csv_stream_batch_boundary():
+    stream = CsvStream(iter([[str(i)] for i in range(copy_csv_module.COPY_BATCH_ROWS + 1)]))
+    assert len(parse_copy(stream.read())) == copy_csv_module.COPY_BATCH_ROWS
+    assert parse_copy(stream.read()) == [[str(copy_csv_module.COPY_BATCH_ROWS)]]
+    assert stream.read() == "" and stream.rows == copy_csv_module.COPY_BATCH_ROWS + 1
+
+
+def test_copy_csv_reorders_columns(tmp_path, monkeypatch):
+    path = write_csv(tmp_path / "tabla.csv", csv.QUOTE_NONE)
+    copied = {}
+
+    def copy_stream(conn, table, columns, stream):
+        copied.update(table=table, columns=columns, data="".join(iter(lambda: stream.read(8192), "")))
+
+    monkeypatch.setattr(
+        copy_csv_module, "get_csv_columns", lambda conn, path, schema, table: (read_header(path), TABLE_COLUMNS)
+    )
+    monkeypatch.setattr(copy_csv_module, "copy_stream", copy_stream)
+    assert copy_csv(None, path, "salud", "tabla") == len(DF)
+    assert copied["table"] == "salud.tabla"
+    # Columns follow the table and the ones not in the CSV (with a default) are left out
+    assert copied["columns"] == ["valor", "nota", "id", "nombre"]
+    assert parse_copy(copied["data"]) == [
+        ["1.5", None, "1", "Álava"],
+        [None, None, "2", "a;b"],
+        ["2.0", None, None, 'say "hi"'],
+        ["1e+20", None, "3", "line\nbreak"],
+    ]
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import pytest
+
+import utils.script_paths as script_paths
+from utils.fingerprint import compute_fingerprint, is_up_to_date
+
+SCRIPT_SOURCE = """
+from pathlib import Path
+
+from utils.helper import clean
+
+RAW_DATA_DIR = Path("data") / "raw" / "salud"
+RAW_CSV_PATH = RAW_DATA_DIR / "casos.csv"
+RAW_DIR_PATH = RAW_DATA_DIR / "anexos"
+CLEAN_CSV_PATH = Path("data") / "clean" / "salud" / "casos.csv"
+"""
+
+
+@pytest.fixture
+def script(tmp_path, monkeypatch):
+    """An ET script with a raw CSV, a raw directory and a local module as inputs, and its clean CSV."""
+    monkeypatch.chdir(tmp_path)
+    for path, content in {
+        Path("data/raw/salud/casos.csv"): "a;b\n1;2\n",
+        Path("data/raw/salud/anexos/2020.csv"): "a\n1\n",
+        Path("data/clean/salud/casos.csv"): "a;b\n1;2\n",
+        Path("utils/helper.py"): "def clean(df):\n    return df\n",
+    }.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    script = tmp_path / "001_et_casos.py"
+    script.write_text(SCRIPT_SOURCE)
+    script_paths._parse_tree.cache_clear()
+    script_paths._parse_module.cache_clear()
+    yield script
+    script_paths._parse_tree.cache_clear()
+    script_paths._parse_module.cache_clear()
+
+
+def test_fingerprint_stable(script):
+    fingerprint = compute_fingerprint(script)
+    assert compute_fingerprint(script) == fingerprint
+    # Outputs are not part of the fingerprint
+    Path("data/clean/salud/casos.csv").write_text("a;b\n")
+    assert compute_fingerprint(script) == fingerprint
+    assert is_up_to_date(script, fingerprint, {str(script): fingerprint})
+    assert not is_up_to_date(script, fingerprint, {})
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda script: script.write_text(SCRIPT_SOURCE + "\nLIMIT = 10\n"),
+        lambda script: Path("utils/helper.py").write_text("def clean(df):\n    return df.dropna()\n"),
+        lambda script: Path("data/raw/salud/casos.csv").write_text("a;b\n1;3\n"),
+        lambda script: Path("data/raw/salud/casos.csv").unlink(),
+        lambda script: Path("data/raw/salud/anexos/2021.csv").write_text("a\n2\n"),
+        lambda script: Path("data/raw/salud/anexos/2020.csv").write_text("a\n2\n"),
+    ],
+    ids=["script", "module", "raw-csv", "raw-csv-missing", "raw-dir-new-file", "raw-dir-file"],
+)
+def test_fingerprint_changes(script, change):
+    fingerprint = compute_fingerprint(script)
+    change(script)
+    assert compute_fingerprint(script) != fingerprint
+    assert not is_up_to_date(script, compute_fingerprint(script), {str(script): fingerprint})
+
+
+def test_missing_output_not_up_to_date(script):
+    fingerprint = compute_fingerprint(script)
+    Path("data/clean/salud/casos.csv").unlink()
+    assert compute_fingerprint(script) == fingerprint
+    assert not is_up_to_date(script, fingerprint, {str(script): fingerprint})
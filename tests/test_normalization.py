@@ -5,13 +5,19 @@ import pytest
 
 from utils.normalization import (
     NormalizationStatus,
+    _BATCH_NORMALIZERS,  # type: ignore
     apply_and_check,  # type: ignore
     apply_and_check_dict,  # type: ignore
+    normalize_batch,
     normalize_age_group,
+    normalize_age_group_batch,
     normalize_comunidad_autonoma,
     normalize_date,
+    normalize_date_batch,
+    normalize_frame,
     normalize_json_string,
     normalize_month,
+    normalize_month_batch,
     normalize_municipio,
     normalize_municipio_id,
     normalize_nationality,
@@ -22,6 +28,32 @@ from utils.normalization import (
     normalize_quarter,
     normalize_year,
 )
+from utils.normalization import _normalize_region_name  # type: ignore
+import utils.normalization_cache as normalization_cache
+import utils.normalization_dicts as normalization_dicts
+from utils.normalization_dicts import DICT_PROVINCIAS, PROVINCIA_COMUNIDAD
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+    """Write the municipios snapshots and the normalization memo of each test to its tmp_path."""
+    monkeypatch.setattr(normalization_dicts, "SNAPSHOT_DIR", tmp_path)
+    monkeypatch.setattr(normalization_cache, "CACHE_DIR", tmp_path)
+    caches = [
+        normalization_dicts._load_municipios,
+        normalization_dicts.get_municipio_ids,
+        normalization_cache._cache_path,
+        normalization_cache._connect,
+    ]
+    for cache in caches:
+        cache.cache_clear()
+    yield
+    if normalization_cache._connect.cache_info().currsize:
+        connection = normalization_cache._connect()
+        if connection is not None:
+            connection.close()
+    for cache in caches:
+        cache.cache_clear()
 
 
 # ---------------------- municipio normalization ----------------------
@@ -118,6 +150,38 @@ def test_normalize_municipio_id_invalid():
     assert r1.status is r2.status is r3.status is NormalizationStatus.INVALID
 
 
+def test_municipio_lookup_arrays():
+    municipio_ids, municipio_provincia = normalization_dicts.MUNICIPIO_IDS, normalization_dicts.MUNICIPIO_PROVINCIA
+    for provincia_id, prov_dict in normalization_dicts.DICT_MUNICIPIOS.items():
+        for municipio_id in prov_dict.values():
+            assert municipio_id in municipio_ids
+            assert municipio_provincia[municipio_id] == provincia_id
+    assert all(PROVINCIA_COMUNIDAD[provincia_id] >= 0 for provincia_id in DICT_PROVINCIAS.values())
+    assert PROVINCIA_COMUNIDAD[28] == 13 and PROVINCIA_COMUNIDAD[8] == 9
+
+
+def test_municipios_snapshot(tmp_path):
+    built = normalization_dicts.get_municipios_dict()
+    built_provincias = normalization_dicts.get_municipio_provincia()
+    assert len(list(tmp_path.glob("municipios-*"))) == 2
+    normalization_dicts._load_municipios.cache_clear()
+    assert normalization_dicts.get_municipios_dict() == built
+    assert list(normalization_dicts.get_municipio_provincia()) == list(built_provincias)
+
+
+def test_normalization_cache(tmp_path):
+    (tmp_path / "normalization-0000000000000000.sqlite").touch()
+    serie = pd.Series(["Marruecos", "Nowhere", None, "Marruecos"])
+    expected = normalize_batch(serie, normalize_nationality)
+    assert [path.name for path in tmp_path.glob("*.sqlite")] == [normalization_cache._cache_path().name]
+    cached = normalization_cache.load_results("normalize_nationality", ["Marruecos", "Nowhere", "Francia"])
+    assert cached == [("Marruecos", NormalizationStatus.VALID.value, "Marruecos"), (None, 3, "Nowhere"), None]
+    normalize_batch(pd.Series(["Burgos"]), normalize_provincia)
+    assert normalization_cache.load_results("normalize_provincia", ["Burgos"]) == [None]
+    batch = normalize_batch(serie, normalize_nationality)
+    assert list(batch.status) == list(expected.status) and batch.invalid_raw == ["Nowhere"]
+
+
 # ---------------------- provincia normalization ----------------------
 def test_normalize_provincia_basic():
     result = normalize_provincia("Burgos")
@@ -175,6 +239,13 @@ def test_normalize_provincia_slash():
     )
 
 
+def test_normalize_region_name_tie_breaking():
+    mapping = {"Ávila": 1, "Avila": 2, "AVILA": 3, "Ávila Sur": 4, "Avila Sur": 5}
+    assert _normalize_region_name("avila", mapping) == 2  # case-insensitive before accent-insensitive
+    assert _normalize_region_name("ÁVILA", mapping) == 1  # first key folding to "ávila"
+    assert _normalize_region_name("avilasur", mapping) == 4  # first key without accents and spaces
+
+
 def test_normalize_provincia_unknown():
     result = normalize_provincia("Desconocida")
     assert result.value is None
@@ -574,6 +645,104 @@ def test_apply_and_check_invalid():
         apply_and_check(serie, normalize_month)
 
 
+def test_apply_and_check_repeated_values():
+    serie = pd.Series(["Enero", "Foo", "Enero", "Foo", None], index=[5, 4, 3, 2, 1], name="mes")
+    with pytest.raises(ValueError, match=r"Invalid values \(2\) in column 'mes: \{'Foo'\}"):
+        apply_and_check(serie, normalize_month)
+    result = apply_and_check(serie[serie != "Foo"], normalize_month)  # type: ignore
+    assert list(result.index) == [5, 3, 1]
+    assert list(result[:2]) == [1, 1] and pd.isna(result[1])
+
+
+def test_normalize_batch_columnar():
+    batch = normalize_month_batch(pd.Series(["Enero", "Foo", None, "Foo"]))
+    assert list(batch.values[:1]) == [1] and pd.isna(batch.values[2])
+    assert list(batch.status) == [
+        NormalizationStatus.VALID.value,
+        NormalizationStatus.INVALID.value,
+        NormalizationStatus.UNKNOWN.value,
+        NormalizationStatus.INVALID.value,
+    ]
+    assert batch.invalid_raw == ["Foo", "Foo"]
+
+
+@pytest.mark.parametrize(
+    "func", [normalize_positive_integer, normalize_positive_float, normalize_year, normalize_month, normalize_quarter]
+)
+def test_vectorized_batch_matches_scalar(func):
+    values = ["2020", " 3 ", "+5", "-1", "1.5", "Enero", "primero", "No consta", "", "x", "1_2", 2019, 7.9, -0.5, 0.5]
+    serie = pd.Series(values * 2, dtype=object)
+    expected, batch = normalize_batch(serie, func), _BATCH_NORMALIZERS[func](serie)
+    assert batch.values.dtype == expected.values.dtype
+    assert [repr(value) for value in batch.values] == [repr(value) for value in expected.values]
+    assert list(batch.status) == list(expected.status)
+    assert batch.invalid_raw == expected.invalid_raw
+
+
+@pytest.mark.parametrize("dtype", [float, object])
+@pytest.mark.parametrize(
+    "func", [normalize_municipio_id, normalize_positive_integer, normalize_year, normalize_quarter]
+)
+def test_batch_keeps_signed_zeros_apart(func, dtype):
+    serie = pd.Series([-0.0, 0.0, 1e9, -0.0, 0.0], dtype=dtype)
+    expected = [func(value) for value in serie]
+    batch = _BATCH_NORMALIZERS[func](serie)
+    assert list(batch.status) == [result.status.value for result in expected]
+    assert batch.invalid_raw == [result.raw for result in expected if result.status is NormalizationStatus.INVALID]
+
+
+def test_batch_keeps_equal_values_of_different_types():
+    values = [True, 1, 1.0, "1", None, 1.0, True]
+    serie = pd.Series(values, dtype=object)
+    expected = [normalize_year(value).raw for value in values]
+    for batch in (normalize_batch(serie, normalize_year), _BATCH_NORMALIZERS[normalize_year](serie)):
+        assert batch.invalid_raw == expected
+    assert expected[:3] == ["True", "1", "1.0"]
+
+
+@pytest.mark.parametrize(
+    "value, error", [(float("inf"), OverflowError), (float("-inf"), OverflowError), ("²", ValueError)]
+)
+def test_normalize_quarter_batch_unconvertible(value, error):
+    with pytest.raises(error):
+        normalize_quarter(value)
+    with pytest.raises(error):
+        _BATCH_NORMALIZERS[normalize_quarter](pd.Series(["1", value, 2], dtype=object))
+
+
+def test_normalize_date_batch():
+    values = ["2020-1-1", " 01/02/2020 ", "31-12-1999", "2020/02/30", "0999-01-01", "No consta", "bad", "2020-01-01"]
+    serie = pd.Series(values * 2, dtype=object)
+    expected, batch = normalize_batch(serie, normalize_date), normalize_date_batch(serie)
+    assert pd.Series(batch.values).equals(pd.Series(expected.values))
+    assert list(batch.status) == list(expected.status)
+    assert batch.invalid_raw == ["2020/02/30", "bad", "2020/02/30", "bad"]
+
+
+def test_normalize_age_group_batch():
+    values = ["De 0 a 15 años", "18-24", "+16", ">84", "65 años y más", "19 años", "No consta", "De 20 a 10 años", None]
+    batch = normalize_age_group_batch(pd.Series(values * 2, dtype=object))
+    assert list(batch.values[:6]) == ["<15", "18-24", "<16", ">84", ">65", "19"]
+    assert list(batch.values[6:9]) == [None, None, None]
+    assert batch.invalid_raw == ["De 20 a 10 años", "De 20 a 10 años"]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_normalize_frame(max_workers):
+    df = pd.DataFrame({"anio": ["2020", "2021"], "mes": ["Enero", "Foo"], "sexo": ["Hombres", "Otro"], "n": ["1", "2"]})
+    spec = {"anio": normalize_year, "n": normalize_positive_integer, "sexo": {"Hombres": "Hombre", "Mujeres": "Mujer"}}
+    result = normalize_frame(df.iloc[:1], spec, max_workers=max_workers)
+    assert result.to_dict("list") == {"anio": [2020], "mes": ["Enero"], "sexo": ["Hombre"], "n": [1]}
+    assert df["anio"].tolist() == ["2020", "2021"]
+    with pytest.raises(ValueError) as error:
+        normalize_frame(df, {**spec, "mes": normalize_month}, max_workers=max_workers)
+    assert str(error.value).splitlines() == [
+        "Invalid values in 2 of 4 columns:",
+        "Invalid values (1) in column 'sexo: {'Otro'}",
+        "Invalid values (1) in column 'mes: {'Foo'}",
+    ]
+
+
 def test_apply_and_check_dict_basic():
     serie = pd.Series(["2021", "2022"])
     result = apply_and_check(serie, normalize_year)  # type: ignore
@@ -0,0 +1,165 @@
+import asyncio
+import logging
+import signal
+import threading
+import time
+
+import pytest
+
+from utils.run_script import run_python_script, run_python_script_async, run_python_scripts, terminate_running_scripts
+
+SLEEP_SOURCE = """
+import sys
+import time
+from pathlib import Path
+
+Path(sys.argv[1]).write_text("started")
+time.sleep(float(sys.argv[2]))
+"""
+
+FAIL_SOURCE = """
+import json
+import sys
+
+print(json.dumps({"level": "ERROR", "logger": "root", "depth": 0, "created": 0.0, "message": "Missing raw CSV"}))
+sys.exit(1)
+"""
+
+LOG_SOURCE = """
+import json
+
+def log(level, message, logger="root", depth=0, **extra):
+    print(json.dumps({"level": level, "logger": logger, "depth": depth, "created": 0.0, "message": message, **extra}))
+
+log("INFO", "Reading raw CSV")
+log("WARNING", "Nested warning", logger="utils.normalization", depth=1)
+print("plain output")
+log("DEBUG", "Resource usage", logger="usage", usage={"cpu_time_s": 1.5, "maxrss": 2048})
+"""
+
+# Counts the scripts running at once through marker files in the directory of argv[1]
+CONCURRENCY_SOURCE = """
+import sys
+import time
+from pathlib import Path
+
+marker = Path(sys.argv[1])
+marker.touch()
+running = len(list(marker.parent.glob("*.running")))
+time.sleep(0.3)
+marker.unlink()
+marker.with_suffix(".count").write_text(str(running))
+"""
+
+
+def write_script(tmp_path, name, source):
+    script = tmp_path / name
+    script.write_text(source)
+    return script
+
+
+def test_log_lines_forwarded(tmp_path, caplog):
+    script = write_script(tmp_path, "001_et_log.py", LOG_SOURCE)
+    caplog.set_level(logging.INFO)
+    result = asyncio.run(run_python_script_async(script))
+
+    assert result.ok and result.errors == []
+    # Records of the script are tagged with its name, nested ones keep their logger
+    assert [(record.name, record.levelname, record.getMessage(), record.depth) for record in caplog.records] == [
+        ("001_et_log", "INFO", "Reading raw CSV", 1),
+        ("utils.normalization", "WARNING", "Nested warning", 2),
+        ("001_et_log", "INFO", "plain output", 1),
+    ]
+    # The resource usage is kept in the result instead of being logged
+    assert result.cpu_time_s == 1.5 and result.maxrss == 2048
+
+
+def test_failed_script_reported(tmp_path):
+    script = write_script(tmp_path, "001_et_fail.py", FAIL_SOURCE)
+    result = asyncio.run(run_python_script_async(script))
+    assert not result.ok and result.returncode == 1 and not result.timed_out
+    assert result.errors == ["Missing raw CSV"]
+    assert result.describe().startswith("Script 001_et_fail.py exited with code 1 after ")
+    assert result.describe().endswith(": Missing raw CSV")
+
+
+def test_timed_out_script_killed(tmp_path, caplog):
+    script = write_script(tmp_path, "001_et_sleep.py", SLEEP_SOURCE)
+    start = time.perf_counter()
+    (result,) = run_python_scripts([(script, [str(tmp_path / "started"), "30"])], timeout=1)
+
+    assert time.perf_counter() - start < 10
+    assert result.timed_out and not result.ok
+    assert result.returncode == -signal.SIGTERM
+    assert (tmp_path / "started").exists()
+    assert "timed out" in result.describe()
+    assert "Script 001_et_sleep.py timed out after 1s, terminating it" in caplog.messages
+
+
+def test_fail_fast_cancels_other_scripts(tmp_path):
+    sleep = write_script(tmp_path, "001_et_sleep.py", SLEEP_SOURCE)
+    fail = write_script(tmp_path, "002_et_fail.py", FAIL_SOURCE)
+    waiting = write_script(tmp_path, "003_et_waiting.py", SLEEP_SOURCE)
+    start = time.perf_counter()
+    results = run_python_scripts(
+        [
+            (sleep, [str(tmp_path / "sleep_started"), "30"]),
+            (fail, []),
+            (waiting, [str(tmp_path / "waiting_started"), "30"]),
+        ],
+        jobs=2,
+    )
+
+    assert time.perf_counter() - start < 10
+    assert [result.script for result in results] == [sleep, fail, waiting]
+    assert results[1].returncode == 1
+    # The running script is terminated and the one waiting for a slot never starts
+    assert all(result.returncode is None and not result.ok for result in (results[0], results[2]))
+    assert results[0].describe().startswith("Script 001_et_sleep.py was cancelled")
+    assert not (tmp_path / "waiting_started").exists()
+
+
+def test_without_fail_fast_all_scripts_run(tmp_path):
+    fail = write_script(tmp_path, "001_et_fail.py", FAIL_SOURCE)
+    sleep = write_script(tmp_path, "002_et_sleep.py", SLEEP_SOURCE)
+    results = run_python_scripts([(fail, []), (sleep, [str(tmp_path / "started"), "0"])], fail_fast=False)
+    assert [result.returncode for result in results] == [1, 0]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_semaphore_limits_running_scripts(tmp_path, jobs):
+    script = write_script(tmp_path, "001_et_concurrency.py", CONCURRENCY_SOURCE)
+    (tmp_path / "markers").mkdir()
+    markers = [tmp_path / "markers" / f"{i}.running" for i in range(4)]
+    results = run_python_scripts([(script, [str(marker)]) for marker in markers], jobs=jobs)
+
+    assert all(result.ok for result in results)
+    assert max(int(marker.with_suffix(".count").read_text()) for marker in markers) == jobs
+
+
+def test_terminate_running_scripts(tmp_path):
+    script = write_script(tmp_path, "001_et_sleep.py", SLEEP_SOURCE)
+    errors = []
+
+    def run():
+        try:
+            run_python_script(script, str(tmp_path / "started"), "30")
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    deadline = time.perf_counter() + 10
+    while not (tmp_path / "started").exists() and time.perf_counter() < deadline:
+        time.sleep(0.05)
+    terminate_running_scripts()
+    thread.join(10)
+
+    assert not thread.is_alive()
+    (error,) = errors
+    assert error.returncode == -signal.SIGTERM
+
+
+def test_missing_script(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(run_python_script_async(tmp_path / "missing.py"))
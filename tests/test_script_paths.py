@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+from pipelines.extract_transform_data import SCRIPTS, build_dependency_graph
+from utils.script_paths import get_script_paths
+
+RAW_DATA_DIR = Path("data") / "raw"
+CLEAN_DATA_DIR = Path("data") / "clean"
+
+PRODUCER_SOURCE = """
+from pathlib import Path
+
+RAW_CSV_PATH = Path("data") / "raw" / "geo" / "provincias.csv"
+CLEAN_CSV_PATH = Path("data") / "clean" / "geo" / "provincias.csv"
+"""
+
+CONSUMER_SOURCE = """
+from pathlib import Path
+
+RAW_CSV_PATH = Path("data") / "raw" / "salud" / "casos.csv"
+PROVINCIAS_CSV_PATH = Path("data") / "clean" / "geo" / "provincias.csv"
+CLEAN_CSV_PATHS = {"casos": Path("data") / "clean" / "salud" / "casos.csv"}
+"""
+
+
+@pytest.mark.parametrize("script", SCRIPTS, ids=lambda script: script.stem)
+def test_real_script_paths(script):
+    paths = get_script_paths(script)
+    assert any(path.is_relative_to(RAW_DATA_DIR) for path in paths.inputs)
+    assert paths.outputs and all(path.is_relative_to(CLEAN_DATA_DIR) for path in paths.outputs)
+
+
+def test_dependency_graph(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    producer, consumer = tmp_path / "001_et_provincias.py", tmp_path / "002_et_casos.py"
+    producer.write_text(PRODUCER_SOURCE)
+    consumer.write_text(CONSUMER_SOURCE)
+
+    assert get_script_paths(consumer).outputs == [CLEAN_DATA_DIR / "salud" / "casos.csv"]
+    assert build_dependency_graph([producer, consumer]) == {producer: set(), consumer: {producer}}
+    # Without its producer, the clean input must already exist
+    with pytest.raises(FileNotFoundError):
+        build_dependency_graph([consumer])
@@ -0,0 +1,129 @@
+import pytest
+
+import pipelines.create_schemas as create_schemas
+import pipelines.drop_schemas as drop_schemas
+from utils.sql_schema import (
+    SHARED_SCHEMAS,
+    get_dependent_views,
+    get_schema_enums,
+    get_schema_statements,
+    rename_schema,
+    split_statements,
+)
+
+SCHEMA_SQL = """
+-- Shared schemas; created first
+CREATE SCHEMA geo;
+CREATE SCHEMA enums;
+CREATE SCHEMA salud;
+CREATE SCHEMA politica;
+
+CREATE TYPE enums.sexo_enum AS ENUM ('Hombre', 'Mujer');
+CREATE TYPE enums.tipo_enum AS ENUM ('a;b', 'c');
+CREATE TYPE enums.tipo_enum_2 AS ENUM ('d');
+
+CREATE TABLE
+  geo.provincias (provincia_id int PRIMARY KEY, nombre varchar);
+
+CREATE TABLE
+  salud.casos (
+    -- Provincia of the case; NULL for national totals;
+    provincia_id int REFERENCES geo.provincias (provincia_id),
+    sexo enums.sexo_enum,
+    tipo enums.tipo_enum_2,
+    nota varchar CHECK (nota <> ';')
+  );
+
+CREATE TABLE
+  politica.cargos (sexo enums.sexo_enum, tipo enums.tipo_enum);
+"""
+
+VIEWS_SQL = """
+CREATE OR REPLACE VIEW analisis.v_casos AS
+SELECT p.nombre, c.sexo FROM salud.casos c JOIN geo.provincias p USING (provincia_id);
+
+-- Reads salud only through v_casos;
+CREATE VIEW analisis.v_casos_totales AS
+SELECT count(*) FROM analisis.v_casos;
+
+CREATE OR REPLACE VIEW analisis.v_cargos AS
+SELECT * FROM politica.cargos;
+
+CREATE OR REPLACE VIEW analisis.v_provincias AS
+SELECT * FROM geo.provincias;
+"""
+
+
+def test_split_statements():
+    statements = split_statements(SCHEMA_SQL)
+    assert [(statement.kind, statement.name) for statement in statements] == [
+        ("SCHEMA", "geo"),
+        ("SCHEMA", "enums"),
+        ("SCHEMA", "salud"),
+        ("SCHEMA", "politica"),
+        ("TYPE", "enums.sexo_enum"),
+        ("TYPE", "enums.tipo_enum"),
+        ("TYPE", "enums.tipo_enum_2"),
+        ("TABLE", "geo.provincias"),
+        ("TABLE", "salud.casos"),
+        ("TABLE", "politica.cargos"),
+    ]
+    casos = statements[8]
+    assert casos.sql.startswith("CREATE TABLE") and casos.sql.endswith(");")
+    assert "NULL for national totals" in casos.sql and "national totals" not in casos.code
+
+
+def test_split_statements_views():
+    views = split_statements(VIEWS_SQL)
+    assert [(view.kind, view.name) for view in views] == [
+        ("VIEW", "analisis.v_casos"),
+        ("VIEW", "analisis.v_casos_totales"),
+        ("VIEW", "analisis.v_cargos"),
+        ("VIEW", "analisis.v_provincias"),
+    ]
+
+
+def test_schema_enums_word_boundary():
+    # tipo_enum_2 does not make salud a user of tipo_enum
+    assert get_schema_enums(SCHEMA_SQL, "salud") == ["enums.tipo_enum_2"]
+    assert get_schema_enums(SCHEMA_SQL, "politica") == ["enums.tipo_enum"]
+
+
+def test_schema_statements():
+    names = [statement.name for statement in get_schema_statements(SCHEMA_SQL, "salud")]
+    assert names == ["salud", "enums.tipo_enum_2", "salud.casos"]
+    assert get_schema_statements(SCHEMA_SQL, "unknown") == []
+
+
+def test_dependent_views():
+    assert [view.name for view in get_dependent_views(VIEWS_SQL, "salud")] == [
+        "analisis.v_casos",
+        "analisis.v_casos_totales",
+    ]
+    assert [view.name for view in get_dependent_views(VIEWS_SQL, "geo")] == [
+        "analisis.v_casos",
+        "analisis.v_casos_totales",
+        "analisis.v_provincias",
+    ]
+    # Views reading politica_x do not depend on politica
+    assert [view.name for view in get_dependent_views(VIEWS_SQL.replace("politica.", "politica_x."), "politica")] == []
+
+
+def test_rename_schema():
+    sql = split_statements(SCHEMA_SQL)[8].sql
+    renamed = rename_schema(rename_schema(sql, "salud", "salud__staging"), "geo", "geo__staging")
+    assert "salud__staging.casos" in renamed and "REFERENCES geo__staging.provincias" in renamed
+    assert "enums.sexo_enum" in renamed
+
+
+@pytest.mark.parametrize("schema", sorted(SHARED_SCHEMAS))
+def test_shared_schemas_refused(schema, monkeypatch):
+    def run_sql_script(sql):
+        raise AssertionError("No SQL should be run for a shared schema")
+
+    monkeypatch.setattr(drop_schemas, "run_sql_script", run_sql_script)
+    monkeypatch.setattr(create_schemas, "run_sql_script", run_sql_script)
+    with pytest.raises(ValueError):
+        drop_schemas.drop_schema(schema)
+    with pytest.raises(ValueError):
+        create_schemas.create_schema(schema)
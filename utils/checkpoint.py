@@ -0,0 +1,56 @@
+"""Checkpoints of the pipeline run started by pipelines/main.py.
+
+The state file records the plan of the run and, per section, the items that finished:
+pipeline steps, extract-transform scripts (with their fingerprint) and loaded tables
+(with their row count and the hash of their CSV). A resumed run skips the items whose
+outputs are still intact."""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+STATE_PATH = Path("logs") / "main" / "state.json"
+SECTIONS = ("steps", "et", "load")
+
+
+def load_state(path: Path = STATE_PATH) -> dict[str, Any]:
+    """Load the state of the last run, or an empty state if there is none."""
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        logging.warning(f"Ignoring corrupted checkpoint file: {path}")
+        return {}
+
+
+def save_state(state: dict[str, Any], path: Path = STATE_PATH) -> None:
+    """Atomically write the state."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(state, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def start_run(plan: list[list[str]], path: Path = STATE_PATH) -> None:
+    """Start a new run, discarding the checkpoints of the previous one."""
+    save_state({"plan": plan, **{section: {} for section in SECTIONS}}, path)
+
+
+def clear_state(path: Path = STATE_PATH) -> None:
+    """Remove the state once the run has finished successfully."""
+    path.unlink(missing_ok=True)
+
+
+def get_completed(section: str, path: Path = STATE_PATH) -> dict[str, Any]:
+    """Return the completed items of a section with their recorded value."""
+    return load_state(path).get(section, {})
+
+
+def mark_completed(section: str, key: str, value: Any = True, path: Path = STATE_PATH) -> None:
+    """Record a completed item. The state is re-read as other processes update it too."""
+    state = load_state(path)
+    state.setdefault(section, {})[key] = value
+    save_state(state, path)
+
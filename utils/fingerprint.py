@@ -0,0 +1,75 @@
+"""Content fingerprints of the pipeline scripts and their inputs.
+
+A fingerprint hashes the data files a script reads and the source of the script and
+of the repository modules it imports (see utils.script_paths). Fingerprints of the
+last successful runs are kept in a JSON manifest so unchanged scripts can be skipped."""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from utils.script_paths import get_script_paths
+
+MANIFEST_PATH = Path("data") / "et_manifest.json"
+CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: Path) -> str:
+    """Return the sha256 of a file content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _hash_entries(path: Path) -> list[str]:
+    """Return "path:sha256" entries for a file, every file under a directory, or a missing marker."""
+    if path.is_file():
+        files = [path]
+    elif path.is_dir():
+        files = sorted(p for p in path.rglob("*") if p.is_file() and not p.name.startswith("."))
+    else:
+        return [f"{path}:missing"]
+    return [f"{file}:{hash_file(file)}" for file in files]
+
+
+def compute_fingerprint(script: Path) -> str:
+    """Return a hash of the script inputs and of its source code and local imports."""
+    paths = get_script_paths(script)
+    digest = hashlib.sha256()
+    for path in paths.modules + paths.inputs:
+        # Files inside an input directory are already hashed with it
+        if any(path != other and path.is_relative_to(other) for other in paths.inputs):
+            continue
+        for entry in _hash_entries(path):
+            digest.update(f"{entry}\n".encode())
+    return digest.hexdigest()
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict[str, Any]:
+    """Load the fingerprints of the last successful runs, keyed by script path."""
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        logging.warning(f"Ignoring corrupted manifest: {path}")
+        return {}
+
+
+def save_manifest(manifest: dict[str, Any], path: Path = MANIFEST_PATH) -> None:
+    """Atomically write the manifest."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def is_up_to_date(script: Path, fingerprint: str, manifest: dict[str, str]) -> bool:
+    """Return True if the script ran with the same fingerprint and its outputs still exist."""
+    if manifest.get(str(script)) != fingerprint:
+        return False
+    return all(output.exists() for output in get_script_paths(script).outputs)
@@ -1,13 +1,65 @@
+import atexit
+import json
 import logging
+import os
 import re
+import resource
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 from colorama import Fore, Style
 
+# Set by utils.run_script so that child scripts log JSON lines instead of plain text
+LOG_FORMAT_ENV_VAR = "PIPELINE_LOG_FORMAT"
+JSON_LOG_FORMAT = "json"
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+LOG_RECORD_KEYS = {"level", "logger", "depth", "created", "message"}
+# Logger of the record with the resource usage written by a JSON logging child at exit
+USAGE_LOGGER = "usage"
 
-class ColorFormatter(logging.Formatter):
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
+_METADATA_PATTERN = re.compile(
+    r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3} (DEBUG|INFO|WARNING|ERROR|CRITICAL) \[[^\]]+\] "
+)
+
+
+class DepthFormatter(logging.Formatter):
+    """Formatter that indents messages forwarded from child processes by their depth."""
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        depth = getattr(record, "depth", 0)
+        if not depth:
+            return super().formatMessage(record)
+        message = record.message
+        record.message = "\t" * depth + message
+        try:
+            return super().formatMessage(record)
+        finally:
+            record.message = message
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formatter that writes each record as a JSON line, read back by utils.run_script."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        if record.exc_info:
+            message = f"{message}\n{self.formatException(record.exc_info)}"
+        data = {
+            "level": record.levelname,
+            "logger": record.name,
+            "depth": getattr(record, "depth", 0),
+            "created": record.created,
+            "message": message,
+        }
+        if hasattr(record, "usage"):
+            data["usage"] = record.usage
+        return json.dumps(data, ensure_ascii=False)
+
+
+class ColorFormatter(DepthFormatter):
     """Formatter that adds colors based on the log level and applies it to the entire line."""
 
     LEVEL_COLORS = {
@@ -32,27 +84,99 @@ class ColorFormatter(logging.Formatter):
 def strip_metadata(line: str) -> tuple[str, int]:
     """Strip repeated logging metadata and return indentation depth."""
     # Remove ANSI escape sequences for colors
-    ansi_escape = re.compile(r"\x1b\[[0-9;]*m")
-    clean_line = ansi_escape.sub("", line)
-    pattern = re.compile(
-        r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3} (?:DEBUG|INFO|WARNING|ERROR|CRITICAL) \[[^\]]+\] "
-    )
+    clean_line = _ANSI_ESCAPE.sub("", line)
     depth = 0
     previous = None
     while previous != clean_line:
         previous = clean_line
-        clean_line = pattern.sub("", clean_line)
+        clean_line = _METADATA_PATTERN.sub("", clean_line)
         if previous != clean_line:
             depth += 1
     return clean_line, depth
 
 
+def parse_json_record(line: str) -> Optional[logging.LogRecord]:
+    """Build the record of a JSON log line written by a child process, one level deeper.
+
+    Returns None if the line is not a JSON log record."""
+    if not line.startswith("{"):
+        return None
+    try:
+        data = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(data, dict) or not LOG_RECORD_KEYS <= data.keys():
+        return None
+    levelno = logging.getLevelName(data["level"])
+    return logging.makeLogRecord(
+        {
+            "name": data["logger"],
+            "levelno": levelno if isinstance(levelno, int) else logging.INFO,
+            "levelname": data["level"],
+            "msg": data["message"],
+            "created": data["created"],
+            "msecs": (data["created"] - int(data["created"])) * 1000,
+            "depth": data["depth"] + 1,
+            **({"usage": data["usage"]} if "usage" in data else {}),
+        }
+    )
+
+
+def parse_plain_line(line: str) -> logging.LogRecord:
+    """Build the record of a plain text line written by a child process.
+
+    The level is taken from the logging metadata of the line; lines without metadata
+    (third-party output, tracebacks...) are logged as INFO."""
+    match = _METADATA_PATTERN.match(_ANSI_ESCAPE.sub("", line))
+    clean, depth = strip_metadata(line)
+    level = match.group(1) if match else "INFO"
+    return logging.makeLogRecord(
+        {
+            "name": "root",
+            "levelno": logging.getLevelName(level),
+            "levelname": level,
+            "msg": clean,
+            "depth": max(depth, 1),
+        }
+    )
+
+
+def _log_usage() -> None:
+    """Log the CPU time and peak memory of this process, read by the parent at exit."""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    logging.getLogger(USAGE_LOGGER).debug(
+        "Resource usage",
+        extra={
+            "usage": {
+                "cpu_time_s": usage.ru_utime + usage.ru_stime + children.ru_utime + children.ru_stime,
+                "maxrss": max(usage.ru_maxrss, children.ru_maxrss),
+            }
+        },
+    )
+
+
+def _log_uncaught_exception(exc_type, exc, traceback) -> None:
+    """Log an uncaught exception as an error record instead of a plain traceback."""
+    logging.getLogger().error(f"{exc_type.__name__}: {exc}", exc_info=(exc_type, exc, traceback))
+
+
 def setup_logging() -> None:
     """Configure root logger with colored output and file logging."""
     LOG_DIR = Path("logs") / "main"
 
+    # Child scripts started by utils.run_script log JSON lines, forwarded by the parent
+    if os.getenv(LOG_FORMAT_ENV_VAR) == JSON_LOG_FORMAT:
+        json_handler = logging.StreamHandler()
+        json_handler.setFormatter(JsonLinesFormatter())
+        logging.basicConfig(level=logging.INFO, handlers=[json_handler])
+        logging.getLogger(USAGE_LOGGER).setLevel(logging.DEBUG)
+        atexit.register(_log_usage)
+        sys.excepthook = _log_uncaught_exception
+        return
+
     stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(ColorFormatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+    stream_handler.setFormatter(ColorFormatter(LOG_FORMAT))
 
     # Save to file only if the file name is main.py
     if Path(sys.argv[0]).name == "main.py":
@@ -60,7 +184,7 @@ def setup_logging() -> None:
         LOG_DIR.mkdir(exist_ok=True)
         log_path = LOG_DIR / f"{datetime.now().isoformat()}.log"
         file_handler = logging.FileHandler(log_path)
-        file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+        file_handler.setFormatter(DepthFormatter(LOG_FORMAT))
         logging.basicConfig(level=logging.INFO, handlers=[stream_handler, file_handler])
     else:
         logging.basicConfig(level=logging.INFO, handlers=[stream_handler])
@@ -1,27 +1,35 @@
 import json
+import os
 import re
 import unicodedata
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
-from typing import Any, Callable, Optional, Union
+from functools import lru_cache
+from typing import Any, Callable, Hashable, Optional, Union
 
+import numpy as np
 import pandas as pd
 
+from utils.normalization_cache import load_results, save_results
 from utils.normalization_dicts import (
     DICT_COMUNIDADES_AUTOMAS,
     DICT_MONTHS,
-    DICT_MUNICIPIOS,
     DICT_NATIONALITIES,
     DICT_PROVINCIAS,
     DICT_QUARTER,
     DICT_UNKNOWN_STRINGS,
+    get_municipio_ids,
+    get_municipios_dict,
 )
 
 """Utility functions for normalizing various types of data.
 
 Each normalizer returns a :class:`NormalizationResult` describing the normalized
-value and whether the original input was valid, unknown or invalid."""
+value and whether the original input was valid, unknown or invalid. Each normalizer
+has a ``*_batch`` counterpart normalizing a whole series into a columnar
+:class:`NormalizationBatch`, which ``apply_and_check`` uses."""
 
 
 class NormalizationStatus(Enum):
@@ -32,7 +40,7 @@ class NormalizationStatus(Enum):
     INVALID = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizationResult:
     """Container for a normalization result."""
 
@@ -41,6 +49,32 @@ class NormalizationResult:
     raw: Union[str, int, float, None]
 
 
+@dataclass
+class NormalizationBatch:
+    """Columnar container for the normalization results of a series.
+
+    ``status`` holds the ``NormalizationStatus`` value of each row and ``invalid_raw`` the
+    raw input of the invalid rows only, in row order."""
+
+    values: np.ndarray
+    status: np.ndarray
+    invalid_raw: list[Any] = field(default_factory=list)
+
+    def describe_invalid(self, column: Optional[Hashable]) -> str:
+        """Describe the invalid raw values of the column."""
+        return f"Invalid values ({len(self.invalid_raw)}) in column '{column}: {set(self.invalid_raw)}"
+
+    def check(self, column: Optional[Hashable]) -> None:
+        """Raise a ValueError listing the invalid raw values of the column, if any."""
+        if self.invalid_raw:
+            raise ValueError(self.describe_invalid(column))
+
+
+BatchNormalizer = Callable[[pd.Series], NormalizationBatch]
+# Batch counterpart of each normalizer, used by apply_and_check
+_BATCH_NORMALIZERS: dict[Callable[[Any], NormalizationResult], BatchNormalizer] = {}
+
+
 def _is_unknown(value: Optional[Union[str, int, float]]) -> bool:
     """Return True if the cleaned value represents an explicit unknown."""
     if value is None or pd.isna(value):
@@ -55,6 +89,47 @@ def _strip_accents(text: str) -> str:
     return "".join(c for c in unicodedata.normalize("NFD", text) if unicodedata.category(c) != "Mn")
 
 
+@dataclass(frozen=True)
+class _FoldedIndex:
+    """Keys of a normalization dictionary folded by case, then accents, then spaces.
+
+    Each level keeps the first key in dictionary order that folds to a given string,
+    which is the key a linear scan over the dictionary would match."""
+
+    lower: dict[str, Any]
+    no_accents: dict[str, Any]
+    no_spaces: dict[str, Any]
+
+
+# Folded indexes by dictionary id, with the dictionary to detect reused ids
+_FOLDED_INDEXES: dict[int, tuple[dict[str, Any], _FoldedIndex]] = {}
+_NUMBERS_IN_PARENTHESES = re.compile(r"\(\d+\)")
+_NUMBERS = re.compile(r"\d+")
+
+
+def _fold_accents(text: str) -> str:
+    return _strip_accents(text).lower()
+
+
+def _fold_spaces(text: str) -> str:
+    return _strip_accents(text).replace(" ", "").lower()
+
+
+def _get_folded_index(normalization_dict: dict[str, Any]) -> _FoldedIndex:
+    """Return the folded index of a normalization dictionary, building it on first use."""
+    cached = _FOLDED_INDEXES.get(id(normalization_dict))
+    if cached is not None and cached[0] is normalization_dict:
+        return cached[1]
+
+    index = _FoldedIndex({}, {}, {})
+    for key, value in normalization_dict.items():
+        index.lower.setdefault(key.lower(), value)
+        index.no_accents.setdefault(_fold_accents(key), value)
+        index.no_spaces.setdefault(_fold_spaces(key), value)
+    _FOLDED_INDEXES[id(normalization_dict)] = (normalization_dict, index)
+    return index
+
+
 def _normalize_region_name(name: str, normalization_dict: dict[str, int]) -> int | None:
     """
     Generic normalization function for names using a provided normalization dictionary.
@@ -62,31 +137,22 @@ def _normalize_region_name(name: str, normalization_dict: dict[str, int]) -> int
     Returns the normalized name, or None if not found.
     """
     # Remove all numbers and numbers in parentheses, then strip whitespace
-    cleaned = re.sub(r"\(\d+\)", "", name)  # Remove numbers in parentheses like (1), (123)
-    cleaned = re.sub(r"\d+", "", cleaned)  # Remove all remaining numbers
+    cleaned = _NUMBERS_IN_PARENTHESES.sub("", name)  # Remove numbers in parentheses like (1), (123)
+    cleaned = _NUMBERS.sub("", cleaned)  # Remove all remaining numbers
     cleaned = cleaned.strip()
 
     # Try direct match first
     if cleaned in normalization_dict:
         return normalization_dict[cleaned]
-    # Try case-insensitive match
-    for key in normalization_dict:
-        if cleaned.lower() == key.lower():
-            return normalization_dict[key]
-    # Try accent-insensitive and case-insensitive match
-    cleaned_no_accents = _strip_accents(cleaned).lower()
-    for key in normalization_dict:
-        if _strip_accents(key).lower() == cleaned_no_accents:
-            return normalization_dict[key]
-
-    # Try accent-insensitive, case-insensitive, and space-insensitive match
-    def normalize_spaces(s: str):
-        return _strip_accents(s).replace(" ", "").lower()
-
-    cleaned_no_spaces = normalize_spaces(cleaned)
-    for key in normalization_dict:
-        if normalize_spaces(key) == cleaned_no_spaces:
-            return normalization_dict[key]
+    # Try case-insensitive, then accent-insensitive, then space-insensitive match
+    index = _get_folded_index(normalization_dict)
+    for folded, level in (
+        (cleaned.lower(), index.lower),
+        (_fold_accents(cleaned), index.no_accents),
+        (_fold_spaces(cleaned), index.no_spaces),
+    ):
+        if folded in level:
+            return level[folded]
     return None
 
 
@@ -141,8 +207,7 @@ def normalize_municipio_id(municipio_id: Union[str, int]) -> NormalizationResult
         normalized_id = int(municipio_id)
         if 1001 <= normalized_id <= 99999:
             # Check if the ID exists in the municipios dictionary
-            found = any(normalized_id in prov_dict.values() for prov_dict in DICT_MUNICIPIOS.values())
-            if found:
+            if normalized_id in get_municipio_ids():
                 return NormalizationResult(normalized_id, NormalizationStatus.VALID, raw_str)
         return NormalizationResult(None, NormalizationStatus.INVALID, raw_str)
     except (ValueError, TypeError):
@@ -166,7 +231,7 @@ def normalize_municipio(args: tuple[str, Union[str, int]]) -> NormalizationResul
     else:
         provincia_id = int(provincia)
 
-    prov_dict = DICT_MUNICIPIOS.get(provincia_id)
+    prov_dict = get_municipios_dict().get(provincia_id)
     if prov_dict is None:
         return NormalizationResult(None, NormalizationStatus.INVALID, name)
 
@@ -187,14 +252,13 @@ def normalize_nationality(name: str) -> NormalizationResult:
     if cleaned in DICT_NATIONALITIES:
         return NormalizationResult(DICT_NATIONALITIES[cleaned], NormalizationStatus.VALID, name)
     # Case-insensitive match
-    for key in DICT_NATIONALITIES:
-        if cleaned.lower() == key.lower():
-            return NormalizationResult(DICT_NATIONALITIES[key], NormalizationStatus.VALID, name)
+    index = _get_folded_index(DICT_NATIONALITIES)
+    if cleaned.lower() in index.lower:
+        return NormalizationResult(index.lower[cleaned.lower()], NormalizationStatus.VALID, name)
     # Accent-insensitive, case-insensitive match
-    cleaned_no_accents = _strip_accents(cleaned).lower()
-    for key in DICT_NATIONALITIES:
-        if _strip_accents(key).lower() == cleaned_no_accents:
-            return NormalizationResult(DICT_NATIONALITIES[key], NormalizationStatus.VALID, name)
+    cleaned_no_accents = _fold_accents(cleaned)
+    if cleaned_no_accents in index.no_accents:
+        return NormalizationResult(index.no_accents[cleaned_no_accents], NormalizationStatus.VALID, name)
     # Match with plural forms (+s or +es)
     if cleaned_no_accents.endswith("es"):
         singular = cleaned_no_accents[:-2]
@@ -202,9 +266,8 @@ def normalize_nationality(name: str) -> NormalizationResult:
         singular = cleaned_no_accents[:-1]
     else:
         singular = cleaned_no_accents
-    for key in DICT_NATIONALITIES:
-        if _strip_accents(key).lower() == singular:
-            return NormalizationResult(DICT_NATIONALITIES[key], NormalizationStatus.VALID, name)
+    if singular in index.no_accents:
+        return NormalizationResult(index.no_accents[singular], NormalizationStatus.VALID, name)
     return NormalizationResult(None, NormalizationStatus.INVALID, name)
 
 
@@ -263,6 +326,9 @@ def normalize_year(year: Union[str, int, float]) -> NormalizationResult:
         return NormalizationResult(None, NormalizationStatus.INVALID, raw_str)
 
 
+_DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%Y/%m/%d")
+
+
 def normalize_date(date_str: str) -> NormalizationResult:
     """Normalize a date string to a datetime object."""
 
@@ -276,7 +342,7 @@ def normalize_date(date_str: str) -> NormalizationResult:
 
     try:
         # Try parsing the date in various formats
-        for fmt in ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%Y/%m/%d"):
+        for fmt in _DATE_FORMATS:
             try:
                 date_obj = datetime.strptime(raw_str, fmt)
                 return NormalizationResult(date_obj, NormalizationStatus.VALID, raw_str)
@@ -317,27 +383,41 @@ def normalize_quarter(quarter: Union[str, int]) -> NormalizationResult:
         return NormalizationResult(None, NormalizationStatus.INVALID, raw_str)
 
 
+_AGE_SINGLE = re.compile(r"^(\d+)$")
+_AGE_DE_RANGE = re.compile(r"^de(\d+)a(\d+)")
+_AGE_RANGE = re.compile(r"^(\d+)-(\d+)")
+_AGE_LESS = re.compile(r"^[<+](\d+)")
+_AGE_GREATER = re.compile(r"^[>+](\d+)")
+_AGE_AND_MORE = re.compile(r"^(?:de)?(\d+)(?:años)?y?más(?:años)?")
+
+
 def normalize_age_group(raw: Optional[str]) -> NormalizationResult:
     """Normalizes a raw age group string to the format '<min>-<max>'."""
 
     if raw is None:
         return NormalizationResult(None, NormalizationStatus.UNKNOWN, "")
+    value, status = _parse_age_group(raw)
+    return NormalizationResult(value, status, raw)
+
 
+@lru_cache(maxsize=4096)
+def _parse_age_group(raw: str) -> tuple[Optional[str], NormalizationStatus]:
+    """Parse an age group label. Labels repeat across rows and tables, so they are memoized."""
     clean = raw.strip().lower().replace("años", "").replace(" ", "")
 
     if _is_unknown(clean):
-        return NormalizationResult(None, NormalizationStatus.UNKNOWN, raw)
+        return None, NormalizationStatus.UNKNOWN
 
     # Special case: "19 años"
-    match_single = re.match(r"^(\d+)$", clean)
+    match_single = _AGE_SINGLE.match(clean)
     if match_single:
         age = int(match_single.group(1))
         if age < 0:
-            return NormalizationResult(None, NormalizationStatus.INVALID, raw)
-        return NormalizationResult(f"{age}", NormalizationStatus.VALID, raw)
+            return None, NormalizationStatus.INVALID
+        return f"{age}", NormalizationStatus.VALID
 
     # Special cases: "De 0 a 15 años", "De 16 a 64 años"
-    match_de_range = re.match(r"de(\d+)a(\d+)", clean)
+    match_de_range = _AGE_DE_RANGE.match(clean)
     if match_de_range:
         min_age = int(match_de_range.group(1))
         max_age = int(match_de_range.group(2))
@@ -345,39 +425,36 @@ def normalize_age_group(raw: Optional[str]) -> NormalizationResult:
             normalized = f"<{max_age}"
         else:
             if min_age >= max_age:
-                return NormalizationResult(None, NormalizationStatus.INVALID, raw)
+                return None, NormalizationStatus.INVALID
             normalized = f"{min_age}-{max_age}"
-        return NormalizationResult(normalized, NormalizationStatus.VALID, raw)
+        return normalized, NormalizationStatus.VALID
 
     # Handle formats like 18-24
-    match_range = re.match(r"(\d+)-(\d+)", clean)
+    match_range = _AGE_RANGE.match(clean)
     if match_range:
         min_age = int(match_range.group(1))
         max_age = int(match_range.group(2))
         if min_age >= max_age:
-            return NormalizationResult(None, NormalizationStatus.INVALID, raw)
+            return None, NormalizationStatus.INVALID
         normalized = f"{min_age}-{max_age}"
-        return NormalizationResult(normalized, NormalizationStatus.VALID, raw)
+        return normalized, NormalizationStatus.VALID
 
     # Handle formats like <16 or +16
-    match_less = re.match(r"[<+](\d+)", clean)
+    match_less = _AGE_LESS.match(clean)
     if match_less:
-        normalized = f"<{int(match_less.group(1))}"
-        return NormalizationResult(normalized, NormalizationStatus.VALID, raw)
+        return f"<{int(match_less.group(1))}", NormalizationStatus.VALID
 
     # Handle formats like >84 or +84
-    match_greater = re.match(r"[>+](\d+)", clean)
+    match_greater = _AGE_GREATER.match(clean)
     if match_greater:
-        normalized = f">{int(match_greater.group(1))}"
-        return NormalizationResult(normalized, NormalizationStatus.VALID, raw)
+        return f">{int(match_greater.group(1))}", NormalizationStatus.VALID
 
     # Handle formats like '65añosymás' or '65años y más' or 'de 65 años y más años'
-    match_and_more = re.match(r"(?:de)?(\d+)(?:años)?y?más(?:años)?", raw.strip().replace(" ", "").lower())
+    match_and_more = _AGE_AND_MORE.match(raw.strip().replace(" ", "").lower())
     if match_and_more:
-        normalized = f">{int(match_and_more.group(1))}"
-        return NormalizationResult(normalized, NormalizationStatus.VALID, raw)
+        return f">{int(match_and_more.group(1))}", NormalizationStatus.VALID
 
-    return NormalizationResult(None, NormalizationStatus.INVALID, raw)
+    return None, NormalizationStatus.INVALID
 
 
 def normalize_positive_integer(value: Union[str, int, float]) -> NormalizationResult:
@@ -440,18 +517,125 @@ def normalize_json_string(json_str: str) -> NormalizationResult:
         return NormalizationResult(None, NormalizationStatus.INVALID, json_str)
 
 
+def _factorize(series: pd.Series) -> tuple[np.ndarray, list[Any]]:
+    """Encode a series as codes into its distinct values.
+
+    Distinct values are python objects, as ``Series.apply`` passes them. Missing values
+    are grouped as None and as any other missing value (NaN, NaT...). Equal values of
+    different types (True, 1 and 1.0) or signs (0.0 and -0.0) are kept apart, as they may
+    normalize differently."""
+    codes, uniques = pd.factorize(series)
+    values = list(np.asarray(uniques, dtype=object))
+    missing = codes < 0
+    if series.dtype == object and len(values) > 1:
+        present = series[~missing].to_numpy()
+        type_codes, types = pd.factorize(pd.Series(present).map(type))
+        if len(types) > 1:
+            # Factorize on the pair (value, type) so that merged values are split by type
+            tagged_codes, _ = pd.factorize(codes[~missing].astype(np.int64) * len(types) + type_codes)
+            _, first = np.unique(tagged_codes, return_index=True)
+            codes[~missing] = tagged_codes
+            values = list(present[first])
+    # pd.factorize also merges -0.0 and 0.0, whose raw strings differ
+    for code in [i for i, value in enumerate(values) if isinstance(value, float) and value == 0]:
+        rows = np.flatnonzero(codes == code)
+        zeros = series.iloc[rows].astype(object).to_numpy()
+        negative = np.signbit(zeros.astype(float))
+        if negative.any() and not negative.all():
+            split = negative != negative[0]
+            codes[rows[split]] = len(values)
+            values.append(zeros[split][0])
+    if missing.any():
+        missing_values = series[missing].astype(object).to_numpy()
+        is_none = np.array([value is None for value in missing_values])
+        missing_codes = np.empty(len(missing_values), dtype=codes.dtype)
+        for group in (is_none, ~is_none):
+            if group.any():
+                missing_codes[group] = len(values)
+                values.append(missing_values[group][0])
+        codes[missing] = missing_codes
+    return codes, values
+
+
+def _normalize_values(values: list[Any], func: Callable[[Any], NormalizationResult]) -> list[NormalizationResult]:
+    """Normalize distinct values, through the on-disk cache for the dictionary based normalizers."""
+    if func not in _PERSISTENT_NORMALIZERS:
+        return [func(value) for value in values]
+
+    # Missing values are cheap to normalize, so only strings and tuples (municipios) are cached
+    keyed = [i for i, value in enumerate(values) if isinstance(value, (str, tuple))]
+    cached = dict(zip(keyed, load_results(func.__name__, [values[i] for i in keyed])))
+    results: list[NormalizationResult] = []
+    new_results: list[tuple[Any, tuple[Any, int, Any]]] = []
+    for i, value in enumerate(values):
+        hit = cached.get(i)
+        if hit is not None:
+            results.append(NormalizationResult(hit[0], NormalizationStatus(hit[1]), hit[2]))
+            continue
+        result = func(value)
+        results.append(result)
+        if i in cached:
+            new_results.append((value, (result.value, result.status.value, result.raw)))
+    save_results(func.__name__, new_results)
+    return results
+
+
+def normalize_batch(series: pd.Series, func: Callable[[Any], NormalizationResult]) -> NormalizationBatch:
+    """Normalize a series with a scalar normalizer, called once per distinct value."""
+    if series.empty:
+        return NormalizationBatch(np.empty(0, dtype=object), np.empty(0, dtype=np.uint8))
+    codes, uniques = _factorize(series)
+    results = pd.Series(_normalize_values(uniques, func), dtype=object)
+
+    values = results.map(lambda r: r.value).to_numpy()
+    statuses = np.fromiter((r.status.value for r in results), dtype=np.uint8, count=len(results))
+    status = statuses[codes]
+    invalid_rows = np.flatnonzero(status == NormalizationStatus.INVALID.value)
+    invalid_raw = [results[code].raw for code in codes[invalid_rows]]
+    return NormalizationBatch(values[codes], status, invalid_raw)
+
+
+def _batch_of(func: Callable[[Any], NormalizationResult]) -> Callable[[BatchNormalizer], BatchNormalizer]:
+    """Register the decorated function as the batch counterpart of a scalar normalizer."""
+
+    def register(batch: BatchNormalizer) -> BatchNormalizer:
+        _BATCH_NORMALIZERS[func] = batch
+        return batch
+
+    return register
+
+
+def _register_batch(func: Callable[[Any], NormalizationResult]) -> BatchNormalizer:
+    """Create and register the generic batch counterpart of a scalar normalizer."""
+
+    def batch(series: pd.Series) -> NormalizationBatch:
+        return normalize_batch(series, func)
+
+    batch.__name__ = batch.__qualname__ = f"{func.__name__}_batch"
+    batch.__doc__ = f"Batch version of {func.__name__}."
+    return _batch_of(func)(batch)
+
+
+def _normalize_series(series: pd.Series, func: Callable[[Any], NormalizationResult]) -> NormalizationBatch:
+    """Normalize a series with the batch counterpart of a normalizer, or the generic batch."""
+    batch_func = _BATCH_NORMALIZERS.get(func)
+    return batch_func(series) if batch_func is not None else normalize_batch(series, func)
+
+
 def apply_and_check(series: pd.Series, func: Callable[[Any], NormalizationResult]):
-    """Apply a normalization function and fail on invalid results."""
-    results = series.apply(func)  # type: ignore
+    """Apply a normalization function and fail on invalid results.
 
-    invalid = [r.raw for r in results if r.status is NormalizationStatus.INVALID]
-    if invalid:
-        raise ValueError(f"Invalid values ({len(invalid)}) in column '{series.name}: {set(invalid)}")
-    return results.map(lambda r: r.value)
+    The series is normalized by the batch counterpart of the function, or by calling it
+    once per distinct value, and the values are broadcast to the rows."""
+    if series.empty:
+        return series.copy()
+    batch = _normalize_series(series, func)
+    batch.check(series.name)
+    return pd.Series(batch.values, index=series.index, name=series.name)
 
 
-def apply_and_check_dict(series: pd.Series, mapping: dict[str, Any]):
-    """Normalize a string using a custom mapping dictionary."""
+def _mapping_normalizer(mapping: dict[str, Any]) -> Callable[[Any], NormalizationResult]:
+    """Return a normalizer looking up values in a custom mapping dictionary."""
 
     def mapping_func(value: str) -> NormalizationResult:
         if _is_unknown(value):
@@ -460,4 +644,361 @@ def apply_and_check_dict(series: pd.Series, mapping: dict[str, Any]):
             return NormalizationResult(mapping[value], NormalizationStatus.VALID, value)
         return NormalizationResult(None, NormalizationStatus.INVALID, value)
 
-    return apply_and_check(series, mapping_func)
+    return mapping_func
+
+
+def apply_and_check_dict(series: pd.Series, mapping: dict[str, Any]):
+    """Normalize a string using a custom mapping dictionary."""
+    return apply_and_check(series, _mapping_normalizer(mapping))
+
+
+# Frames with fewer rows are normalized column by column in the calling thread
+PARALLEL_MIN_ROWS = 100_000
+FrameSpec = dict[Hashable, Union[Callable[[Any], NormalizationResult], dict[str, Any]]]
+
+
+def normalize_frame(df: pd.DataFrame, spec: FrameSpec, max_workers: Optional[int] = None) -> pd.DataFrame:
+    """Normalize the columns of a DataFrame and fail on the invalid results of any of them.
+
+    ``spec`` maps each column to a normalizer or, as apply_and_check_dict, to a mapping
+    dictionary. Large frames are normalized by a thread per column, as the vectorized
+    normalizers mostly run in numpy and pandas. All the invalid values of all the columns
+    are reported in a single ValueError. Returns a copy of the frame."""
+    normalizers = {
+        column: _mapping_normalizer(normalizer) if isinstance(normalizer, dict) else normalizer
+        for column, normalizer in spec.items()
+    }
+    missing = [column for column in normalizers if column not in df.columns]
+    if missing:
+        raise KeyError(f"Columns not found: {missing}")
+    if len(df) == 0:
+        return df.copy()
+    if max_workers is None:
+        max_workers = min(len(normalizers), os.cpu_count() or 1) if len(df) >= PARALLEL_MIN_ROWS else 1
+
+    def normalize(column: Hashable) -> NormalizationBatch:
+        return _normalize_series(df[column], normalizers[column])
+
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            batches = dict(zip(normalizers, executor.map(normalize, normalizers)))
+    else:
+        batches = {column: normalize(column) for column in normalizers}
+
+    errors = [batch.describe_invalid(column) for column, batch in batches.items() if batch.invalid_raw]
+    if errors:
+        raise ValueError(f"Invalid values in {len(errors)} of {len(batches)} columns:\n" + "\n".join(errors))
+
+    normalized = df.copy(deep=False)
+    for column, batch in batches.items():
+        normalized[column] = pd.Series(batch.values, index=df.index, name=column)
+    return normalized
+
+
+# Normalizers whose results are memoized on disk across scripts and runs (see utils.normalization_cache).
+# Provincias and comunidades are a single dictionary lookup, cheaper than reading the memo.
+_PERSISTENT_NORMALIZERS = {
+    normalize_municipio,
+    normalize_nationality,
+}
+
+normalize_provincia_batch = _register_batch(normalize_provincia)
+normalize_comunidad_autonoma_batch = _register_batch(normalize_comunidad_autonoma)
+normalize_municipio_id_batch = _register_batch(normalize_municipio_id)
+normalize_municipio_batch = _register_batch(normalize_municipio)
+normalize_nationality_batch = _register_batch(normalize_nationality)
+normalize_plain_text_batch = _register_batch(normalize_plain_text)
+normalize_json_string_batch = _register_batch(normalize_json_string)
+
+
+# Vectorized batch normalizers. They work on the distinct values of the series and leave
+# the values their masks do not cover (unusual strings, infinities...) to the scalar
+# normalizer, so that both always agree.
+
+# Integers parsed exactly through float64
+_MAX_EXACT_INTEGER = 2**53
+_INTEGER_PATTERN = r"[+-]?[0-9]{1,15}"
+_FLOAT_PATTERN = r"[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?"
+_YEAR_PATTERN = r"\b(19\d{2}|20\d{2})\b"
+_MONTHS_LOWER = {key.lower(): value for key, value in DICT_MONTHS.items()}
+_PENDING = 0
+
+
+@dataclass
+class _Uniques:
+    """Distinct values of a series split by type for the vectorized normalizers."""
+
+    values: pd.Series
+    missing: np.ndarray
+    real: np.ndarray
+    text: pd.Series
+    unknown_text: np.ndarray
+    numbers: np.ndarray
+    status: np.ndarray
+
+    @classmethod
+    def split(cls, values: list[Any]) -> "_Uniques":
+        series = pd.Series(values, dtype=object)
+        types = series.map(type)
+        missing = series.isna().to_numpy()
+        real = types.isin([int, float]).to_numpy() & ~missing
+        numbers = np.full(len(series), np.nan)
+        if real.any():
+            real_numbers = series[real].astype(float).to_numpy()
+            # Infinities and huge numbers are left to the scalar normalizer
+            real_numbers[~(np.abs(real_numbers) < _MAX_EXACT_INTEGER)] = np.nan
+            numbers[real] = real_numbers
+            real &= ~np.isnan(numbers)
+        text = series.where(types.isin([str]).to_numpy()).str.strip()
+        unknown_text = text.str.lower().isin(DICT_UNKNOWN_STRINGS).to_numpy()
+        status = np.full(len(series), _PENDING, dtype=np.uint8)
+        return cls(series, missing, real, text, unknown_text, numbers, status)
+
+    def parse_text(self, pattern: str, integer: bool = True) -> np.ndarray:
+        """Parse the strings fully matching a pattern into numbers and return their mask."""
+        matches = self.text.str.fullmatch(pattern, na=False).to_numpy() & ~self.unknown_text
+        if matches.any():
+            text = self.text[matches]
+            # pd.to_numeric rounds some float strings differently than float()
+            self.numbers[matches] = pd.to_numeric(text) if integer else text.astype(float)
+        return matches
+
+    def set_status(self, mask: np.ndarray, valid: np.ndarray) -> None:
+        """Set the status of the values of a mask still pending."""
+        mask = mask & (self.status == _PENDING)
+        self.status[mask] = np.where(valid[mask], NormalizationStatus.VALID.value, NormalizationStatus.INVALID.value)
+
+
+def _vectorized_batch(
+    series: pd.Series,
+    func: Callable[[Any], NormalizationResult],
+    kernel: Callable[[_Uniques], None],
+    integer: bool = True,
+) -> NormalizationBatch:
+    """Normalize the distinct values of a series with a kernel setting their numbers and status.
+
+    Values the kernel leaves pending are normalized by the scalar function. Values are
+    returned with the dtype ``normalize_batch`` would infer from the same results."""
+    if series.empty:
+        return NormalizationBatch(np.empty(0, dtype=object), np.empty(0, dtype=np.uint8))
+    codes, values = _factorize(series)
+    uniques = _Uniques.split(values)
+    kernel(uniques)
+    numbers, status = uniques.numbers, uniques.status
+
+    raws: dict[int, Any] = {}
+    for i in np.flatnonzero(status == _PENDING):
+        result = func(values[i])
+        if isinstance(result.value, int) and not abs(result.value) < _MAX_EXACT_INTEGER:
+            return normalize_batch(series, func)
+        numbers[i] = np.nan if result.value is None else result.value
+        status[i] = result.status.value
+        raws[i] = result.raw
+
+    if integer:
+        # int() has no negative zero (int(-0.5) == 0)
+        numbers += 0.0
+    valid = status == NormalizationStatus.VALID.value
+    if not valid.any():
+        normalized = np.full(len(values), None, dtype=object)
+    elif valid.all():
+        normalized = numbers.astype(np.int64) if integer else numbers
+    else:
+        normalized = np.where(valid, numbers, np.nan)
+
+    return _broadcast_batch(codes, values, normalized, status, raws)
+
+
+def _broadcast_batch(
+    codes: np.ndarray, values: list[Any], normalized: np.ndarray, status: np.ndarray, raws: dict[int, Any]
+) -> NormalizationBatch:
+    """Broadcast the normalized values and status of the distinct values to the rows.
+
+    The raw value of an invalid distinct value is taken from ``raws`` or is its string."""
+    row_status = status[codes]
+    invalid_codes = codes[row_status == NormalizationStatus.INVALID.value]
+    invalid_raw = [raws[code] if code in raws else str(values[code]) for code in invalid_codes]
+    return NormalizationBatch(normalized[codes], row_status, invalid_raw)
+
+
+def _positive_kernel(pattern: str, integer: bool) -> Callable[[_Uniques], None]:
+    """Kernel of normalize_positive_integer and normalize_positive_float."""
+
+    def kernel(uniques: _Uniques) -> None:
+        uniques.status[uniques.missing | uniques.unknown_text] = NormalizationStatus.UNKNOWN.value
+        if integer:
+            uniques.numbers[uniques.real] = np.trunc(uniques.numbers[uniques.real])
+        parsed = uniques.parse_text(pattern, integer) | uniques.real
+        uniques.set_status(parsed, uniques.numbers >= 0)
+
+    return kernel
+
+
+@_batch_of(normalize_positive_integer)
+def normalize_positive_integer_batch(series: pd.Series) -> NormalizationBatch:
+    """Vectorized normalize_positive_integer."""
+    return _vectorized_batch(series, normalize_positive_integer, _positive_kernel(_INTEGER_PATTERN, True))
+
+
+@_batch_of(normalize_positive_float)
+def normalize_positive_float_batch(series: pd.Series) -> NormalizationBatch:
+    """Vectorized normalize_positive_float."""
+    return _vectorized_batch(series, normalize_positive_float, _positive_kernel(_FLOAT_PATTERN, False), False)
+
+
+def _year_kernel(uniques: _Uniques) -> None:
+    """Kernel of normalize_year."""
+    uniques.status[uniques.unknown_text] = NormalizationStatus.UNKNOWN.value
+    # Only strings are checked for unknowns: None and NaN are invalid years
+    is_none = uniques.values.map(lambda value: value is None).to_numpy()
+    is_nan = uniques.missing & uniques.values.map(lambda value: isinstance(value, float)).to_numpy()
+    uniques.status[is_none | is_nan] = NormalizationStatus.INVALID.value
+
+    uniques.numbers[uniques.real] = np.trunc(uniques.numbers[uniques.real])
+    in_text = uniques.text.str.extract(_YEAR_PATTERN, expand=False).to_numpy(dtype=object)
+    has_year = pd.notna(in_text) & ~uniques.unknown_text
+    parsed = uniques.parse_text(_INTEGER_PATTERN) & ~has_year
+    uniques.numbers[has_year] = in_text[has_year].astype(float)
+    parsed |= has_year | uniques.real
+    uniques.set_status(parsed, (uniques.numbers >= 1900) & (uniques.numbers <= datetime.now().year))
+
+
+@_batch_of(normalize_year)
+def normalize_year_batch(series: pd.Series) -> NormalizationBatch:
+    """Vectorized normalize_year."""
+    return _vectorized_batch(series, normalize_year, _year_kernel)
+
+
+def _month_kernel(uniques: _Uniques) -> None:
+    """Kernel of normalize_month."""
+    uniques.status[uniques.missing | uniques.unknown_text] = NormalizationStatus.UNKNOWN.value
+    uniques.numbers[uniques.real] = np.trunc(uniques.numbers[uniques.real])
+    names = uniques.text.str.lower().map(_MONTHS_LOWER).to_numpy(dtype=float)
+    named = ~np.isnan(names)
+    uniques.numbers[named] = names[named]
+    parsed = (uniques.parse_text(_INTEGER_PATTERN) & ~named) | named | uniques.real
+    uniques.set_status(parsed, (uniques.numbers >= 1) & (uniques.numbers <= 12))
+
+
+@_batch_of(normalize_month)
+def normalize_month_batch(series: pd.Series) -> NormalizationBatch:
+    """Vectorized normalize_month."""
+    return _vectorized_batch(series, normalize_month, _month_kernel)
+
+
+def _quarter_kernel(uniques: _Uniques) -> None:
+    """Kernel of normalize_quarter. Missing values are left to the scalar normalizer, which raises."""
+    uniques.status[uniques.unknown_text] = NormalizationStatus.UNKNOWN.value
+    uniques.numbers[uniques.real] = np.trunc(uniques.numbers[uniques.real])
+    digits = uniques.parse_text(r"[0-9]{1,15}")
+    names = uniques.text.str.lower().map(DICT_QUARTER).to_numpy(dtype=float)
+    named = ~np.isnan(names)
+    uniques.numbers[named] = names[named]
+    uniques.set_status(digits | named | uniques.real, (uniques.numbers >= 1) & (uniques.numbers <= 4))
+    # Other strings are invalid unless str.isdigit accepts them (e.g. superscripts)
+    other_text = uniques.text.notna().to_numpy() & ~uniques.text.str.isdigit().eq(True).to_numpy()
+    uniques.set_status(other_text, np.zeros(len(uniques.status), dtype=bool))
+
+
+@_batch_of(normalize_quarter)
+def normalize_quarter_batch(series: pd.Series) -> NormalizationBatch:
+    """Vectorized normalize_quarter."""
+    return _vectorized_batch(series, normalize_quarter, _quarter_kernel)
+
+
+# Strings of digits shaped like each format, which pd.to_datetime parses as strptime does
+_DATE_PATTERNS = {
+    fmt: fmt.replace("%Y", "[0-9]{4}").replace("%m", "[0-9]{1,2}").replace("%d", "[0-9]{1,2}") for fmt in _DATE_FORMATS
+}
+
+
+@_batch_of(normalize_date)
+def normalize_date_batch(series: pd.Series) -> NormalizationBatch:
+    """Vectorized normalize_date.
+
+    Each format is tried with pd.to_datetime over the distinct strings still unparsed.
+    Strings no format parses are left to normalize_date, which reports them."""
+    if series.empty:
+        return NormalizationBatch(np.empty(0, dtype=object), np.empty(0, dtype=np.uint8))
+    codes, values = _factorize(series)
+    uniques = _Uniques.split(values)
+    status = uniques.status
+    dates = np.full(len(values), None, dtype=object)
+
+    is_datetime = uniques.values.map(lambda value: isinstance(value, datetime)).to_numpy()
+    dates[is_datetime] = uniques.values[is_datetime].to_numpy()
+    status[is_datetime] = NormalizationStatus.VALID.value
+    status[uniques.unknown_text] = NormalizationStatus.UNKNOWN.value
+    for fmt, pattern in _DATE_PATTERNS.items():
+        pending = uniques.text.str.fullmatch(pattern, na=False).to_numpy() & (status == _PENDING)
+        if not pending.any():
+            continue
+        parsed = pd.to_datetime(uniques.text[pending].to_numpy(), format=fmt, errors="coerce")
+        rows = np.flatnonzero(pending)[parsed.notna()]
+        dates[rows] = parsed[parsed.notna()].to_pydatetime()
+        status[rows] = NormalizationStatus.VALID.value
+
+    raws: dict[int, Any] = {}
+    for i in np.flatnonzero(status == _PENDING):
+        result = normalize_date(values[i])
+        dates[i] = result.value
+        status[i] = result.status.value
+        raws[i] = result.raw
+    # Same dtype inference as normalize_batch
+    normalized = pd.Series(list(dates)).to_numpy()
+    return _broadcast_batch(codes, values, normalized, status, raws)
+
+
+@_batch_of(normalize_age_group)
+def normalize_age_group_batch(series: pd.Series) -> NormalizationBatch:
+    """Vectorized normalize_age_group.
+
+    The distinct labels are matched with str.extract against the patterns of the scalar
+    normalizer, in the same order, each one over the labels still unmatched."""
+    if series.empty:
+        return NormalizationBatch(np.empty(0, dtype=object), np.empty(0, dtype=np.uint8))
+    codes, values = _factorize(series)
+    uniques = _Uniques.split(values)
+    status = uniques.status
+    groups = np.full(len(values), None, dtype=object)
+
+    status[uniques.values.map(lambda value: value is None).to_numpy()] = NormalizationStatus.UNKNOWN.value
+    clean = uniques.text.str.lower().str.replace("años", "", regex=False).str.replace(" ", "", regex=False)
+    status[clean.str.strip().str.lower().isin(DICT_UNKNOWN_STRINGS).to_numpy()] = NormalizationStatus.UNKNOWN.value
+
+    def extract(pattern: re.Pattern, text: pd.Series) -> tuple[np.ndarray, list[pd.Series]]:
+        """Return the pending labels matching a pattern and its groups as integers."""
+        pending = np.flatnonzero(text.notna().to_numpy() & (status == _PENDING))
+        matches = text.iloc[pending].str.extract(pattern).dropna()
+        return matches.index.to_numpy(), [matches[column].map(int) for column in matches]
+
+    def set_groups(rows: np.ndarray, normalized: pd.Series, valid: Union[bool, pd.Series] = True) -> None:
+        valid = np.broadcast_to(np.asarray(valid, dtype=bool), rows.shape)
+        groups[rows[valid]] = normalized[valid].to_numpy()
+        status[rows] = np.where(valid, NormalizationStatus.VALID.value, NormalizationStatus.INVALID.value)
+
+    rows, (age,) = extract(_AGE_SINGLE, clean)
+    set_groups(rows, age.astype(str))
+    rows, (min_age, max_age) = extract(_AGE_DE_RANGE, clean)
+    set_groups(
+        rows,
+        ("<" + max_age.astype(str)).where(min_age == 0, min_age.astype(str) + "-" + max_age.astype(str)),
+        (min_age == 0) | (min_age < max_age),
+    )
+    rows, (min_age, max_age) = extract(_AGE_RANGE, clean)
+    set_groups(rows, min_age.astype(str) + "-" + max_age.astype(str), min_age < max_age)
+    rows, (age,) = extract(_AGE_LESS, clean)
+    set_groups(rows, "<" + age.astype(str))
+    rows, (age,) = extract(_AGE_GREATER, clean)
+    set_groups(rows, ">" + age.astype(str))
+    rows, (age,) = extract(_AGE_AND_MORE, uniques.text.str.replace(" ", "", regex=False).str.lower())
+    set_groups(rows, ">" + age.astype(str))
+    status[uniques.text.notna().to_numpy() & (status == _PENDING)] = NormalizationStatus.INVALID.value
+
+    raws: dict[int, Any] = {}
+    for i in np.flatnonzero(status == _PENDING):
+        result = normalize_age_group(values[i])
+        groups[i] = result.value
+        status[i] = result.status.value
+        raws[i] = result.raw
+    return _broadcast_batch(codes, values, groups, status, raws)
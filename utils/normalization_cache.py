@@ -0,0 +1,117 @@
+"""On-disk memo of normalization results shared by every ET script and run.
+
+Results of the costlier dictionary based normalizers (nationalities and municipios)
+are stored in a SQLite database keyed by normalizer and raw value. The
+database is named after the hash of the normalization code, its dictionaries and
+``municipios.csv``, so any change to them starts a new, empty cache."""
+
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from utils.normalization_dicts import MUNICIPIOS_PATH
+
+CACHE_DIR = Path("data") / "cache"
+# Set to "0" to normalize without the cache (e.g. to benchmark the normalizers)
+CACHE_ENV_VAR = "NORMALIZATION_CACHE"
+# Files whose content determines the normalization results
+VERSION_PATHS = [Path(__file__).with_name("normalization.py"), Path(__file__).with_name("normalization_dicts.py")]
+# SQLite limits the number of parameters of a statement
+QUERY_CHUNK_SIZE = 500
+_disabled = False
+# normalize_frame normalizes columns in threads sharing the connection
+_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _cache_path() -> Path:
+    """Return the database path for the current normalization code and data."""
+    digest = hashlib.sha256()
+    for path in VERSION_PATHS + [MUNICIPIOS_PATH]:
+        digest.update(path.read_bytes())
+    return CACHE_DIR / f"normalization-{digest.hexdigest()[:16]}.sqlite"
+
+
+@lru_cache(maxsize=None)
+def _connect() -> Optional[sqlite3.Connection]:
+    """Open the cache of the current version, removing the ones of previous versions.
+
+    Returns None if the cache cannot be used, in which case nothing is memoized."""
+    try:
+        path = _cache_path()
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        if not path.exists():
+            for old_path in CACHE_DIR.glob("normalization-*.sqlite*"):
+                if not old_path.name.startswith(path.name):
+                    old_path.unlink(missing_ok=True)
+        # Scripts running in parallel share the database
+        connection = sqlite3.connect(path, timeout=60, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS results (normalizer TEXT, raw BLOB, result BLOB, PRIMARY KEY (normalizer, raw))"
+        )
+        return connection
+    except (OSError, sqlite3.Error) as e:
+        logging.warning(f"Normalization cache disabled: {e}")
+        return None
+
+
+def _disable(e: Exception) -> None:
+    """Stop using the cache for the rest of the process after an error."""
+    global _disabled
+    logging.warning(f"Normalization cache disabled: {e}")
+    _disabled = True
+
+
+def _get_connection() -> Optional[sqlite3.Connection]:
+    """Return the connection to the cache, or None if it is disabled."""
+    if _disabled or os.getenv(CACHE_ENV_VAR) == "0":
+        return None
+    return _connect()
+
+
+def load_results(normalizer: str, values: list[Any]) -> list[Optional[tuple[Any, int, Any]]]:
+    """Return the cached ``(value, status, raw)`` result of each value, or None if it is not cached."""
+    connection = _get_connection()
+    if connection is None:
+        return [None] * len(values)
+    keys = [pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL) for value in values]
+    found: dict[bytes, bytes] = {}
+    try:
+        with _lock:
+            for start in range(0, len(keys), QUERY_CHUNK_SIZE):
+                chunk = keys[start : start + QUERY_CHUNK_SIZE]
+                rows = connection.execute(
+                    f"SELECT raw, result FROM results WHERE normalizer = ? AND raw IN ({', '.join('?' * len(chunk))})",
+                    [normalizer, *chunk],
+                )
+                found.update(rows)
+    except sqlite3.Error as e:
+        _disable(e)
+        return [None] * len(values)
+    return [pickle.loads(found[key]) if key in found else None for key in keys]
+
+
+def save_results(normalizer: str, results: Iterable[tuple[Any, tuple[Any, int, Any]]]) -> None:
+    """Store ``(value, (value, status, raw))`` pairs of a normalizer."""
+    connection = _get_connection()
+    if connection is None:
+        return
+    rows = [
+        (normalizer, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), pickle.dumps(result))
+        for value, result in results
+    ]
+    if not rows:
+        return
+    try:
+        with _lock, connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.executemany("INSERT OR IGNORE INTO results VALUES (?, ?, ?)", rows)
+    except sqlite3.Error as e:
+        _disable(e)
@@ -1,7 +1,17 @@
 import csv
+import hashlib
+import logging
+import os
+import pickle
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+
 MUNICIPIOS_PATH = Path("data") / "clean" / "geo" / "municipios.csv"
+# Snapshots of the municipios lookups, named after the hash of the CSV and of this module
+SNAPSHOT_DIR = Path("data") / "cache"
+MAX_MUNICIPIO_ID = 99999
 
 
 def _load_municipios_dict() -> dict[int, dict[str, int]]:
@@ -34,7 +44,92 @@ def _load_municipios_dict() -> dict[int, dict[str, int]]:
     return municipios_dict
 
 
-DICT_MUNICIPIOS: dict[int, dict[str, int]] = _load_municipios_dict()
+def _build_municipio_provincia_array(municipios_dict: dict[int, dict[str, int]]) -> np.ndarray:
+    """Array indexed by municipio id with its provincia id (-1 for ids that do not exist)"""
+    municipio_provincia = np.full(MAX_MUNICIPIO_ID + 1, -1, dtype=np.int16)
+    for provincia_id, prov_dict in municipios_dict.items():
+        municipio_provincia[list(prov_dict.values())] = provincia_id
+    return municipio_provincia
+
+
+def _snapshot_paths() -> tuple[Path, Path]:
+    """Return the snapshot paths of the municipios dictionary and array for the current CSV."""
+    digest = hashlib.sha256()
+    digest.update(MUNICIPIOS_PATH.read_bytes())
+    digest.update(Path(__file__).read_bytes())
+    name = f"municipios-{digest.hexdigest()[:16]}"
+    return SNAPSHOT_DIR / f"{name}.pickle", SNAPSHOT_DIR / f"{name}.npy"
+
+
+def _save_snapshot(dict_path: Path, array_path: Path, municipios_dict: dict, municipio_provincia: np.ndarray):
+    """Atomically write the snapshot, removing the ones of previous CSV versions."""
+    SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+    for old_path in SNAPSHOT_DIR.glob("municipios-*"):
+        if not old_path.name.startswith(dict_path.stem):
+            old_path.unlink(missing_ok=True)
+    # Scripts running in parallel may write the same snapshot at the same time
+    tmp_dict_path = dict_path.with_name(f"{dict_path.name}.{os.getpid()}.tmp")
+    tmp_array_path = array_path.with_name(f"{array_path.name}.{os.getpid()}.tmp")
+    with open(tmp_dict_path, "wb") as f:
+        pickle.dump(municipios_dict, f, protocol=pickle.HIGHEST_PROTOCOL)
+    with open(tmp_array_path, "wb") as f:
+        np.save(f, municipio_provincia)
+    # The dictionary is written last, as its presence marks the snapshot as complete
+    tmp_array_path.replace(array_path)
+    tmp_dict_path.replace(dict_path)
+
+
+@lru_cache(maxsize=None)
+def _load_municipios() -> tuple[dict[int, dict[str, int]], np.ndarray]:
+    """Load the municipios lookups from the snapshot of the current CSV, creating it if needed.
+
+    The array is memory-mapped, so every process shares the pages of the snapshot."""
+    dict_path, array_path = _snapshot_paths()
+    try:
+        with open(dict_path, "rb") as f:
+            municipios_dict = pickle.load(f)
+        return municipios_dict, np.load(array_path, mmap_mode="r")
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        pass
+
+    municipios_dict = _load_municipios_dict()
+    municipio_provincia = _build_municipio_provincia_array(municipios_dict)
+    try:
+        _save_snapshot(dict_path, array_path, municipios_dict, municipio_provincia)
+    except OSError as e:
+        logging.warning(f"Could not save municipios snapshot: {e}")
+    return municipios_dict, municipio_provincia
+
+
+def get_municipios_dict() -> dict[int, dict[str, int]]:
+    """Municipio names (with their variants) to municipio id, keyed by provincia id."""
+    return _load_municipios()[0]
+
+
+def get_municipio_provincia() -> np.ndarray:
+    """Array indexed by municipio id with its provincia id (-1 for ids that do not exist)."""
+    return _load_municipios()[1]
+
+
+@lru_cache(maxsize=None)
+def get_municipio_ids() -> frozenset[int]:
+    """Ids of every municipio."""
+    return frozenset(np.flatnonzero(get_municipio_provincia() >= 0).tolist())
+
+
+_LAZY_ATTRIBUTES = {
+    "DICT_MUNICIPIOS": get_municipios_dict,
+    "MUNICIPIO_PROVINCIA": get_municipio_provincia,
+    "MUNICIPIO_IDS": get_municipio_ids,
+}
+
+
+def __getattr__(name: str):
+    """Load the municipios lookups on first access instead of at import time."""
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 DICT_UNKNOWN_STRINGS = {"", "unknown", "n/c", "no consta", "noconsta", "desconocida", "NC", "N.C."}
 
@@ -224,6 +319,36 @@ DICT_PROVINCIAS = {
     "Melilla": 52,
 }
 
+# Comunidad autónoma of every provincia (INE codes), "Total nacional" included
+DICT_PROVINCIA_COMUNIDAD = {
+    0: 0,
+    **{provincia_id: 1 for provincia_id in (4, 11, 14, 18, 21, 23, 29, 41)},
+    **{provincia_id: 2 for provincia_id in (22, 44, 50)},
+    33: 3,
+    7: 4,
+    35: 5,
+    38: 5,
+    39: 6,
+    **{provincia_id: 7 for provincia_id in (5, 9, 24, 34, 37, 40, 42, 47, 49)},
+    **{provincia_id: 8 for provincia_id in (2, 13, 16, 19, 45)},
+    **{provincia_id: 9 for provincia_id in (8, 17, 25, 43)},
+    **{provincia_id: 10 for provincia_id in (3, 12, 46)},
+    6: 11,
+    10: 11,
+    **{provincia_id: 12 for provincia_id in (15, 27, 32, 36)},
+    28: 13,
+    30: 14,
+    31: 15,
+    **{provincia_id: 16 for provincia_id in (1, 20, 48)},
+    26: 17,
+    51: 18,
+    52: 19,
+}
+
+# Array indexed by provincia id with its comunidad autónoma id
+PROVINCIA_COMUNIDAD: np.ndarray = np.full(max(DICT_PROVINCIA_COMUNIDAD) + 1, -1, dtype=np.int16)
+PROVINCIA_COMUNIDAD[list(DICT_PROVINCIA_COMUNIDAD)] = list(DICT_PROVINCIA_COMUNIDAD.values())
+
 DICT_NATIONALITIES = {
     "Otro": "Otros",
     "Otra": "Otros",
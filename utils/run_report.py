@@ -0,0 +1,189 @@
+"""Per-step metrics (wall time, CPU time, peak memory and rows) of a pipeline run.
+
+The process that starts a report exports its path in ``RUN_REPORT_ENV_VAR`` so that
+every child process appends its steps to the same JSON lines file. When the run ends,
+the starting process writes the JSON and CSV reports and logs the slowest steps.
+
+Counting the rows of the CSVs read and written by every ET script reads all of them
+again, so it is only done when the report is started with ``count_rows``."""
+
+import csv
+import json
+import logging
+import os
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+from utils.script_paths import get_script_paths
+
+REPORT_DIR = Path("logs") / "reports"
+RUN_REPORT_ENV_VAR = "RUN_REPORT_PATH"
+# Set to count the rows of the CSVs of every ET script in the report
+COUNT_ROWS_ENV_VAR = "RUN_REPORT_COUNT_ROWS"
+# Delimiters tried when sniffing the dialect of a raw CSV
+RAW_CSV_DELIMITERS = ",;\t|"
+
+
+@dataclass
+class StepMetrics:
+    """Resources used by a single pipeline step (an ET script, a loaded table...)."""
+
+    stage: str
+    step: str
+    status: str = "ok"
+    wall_time_s: float = 0.0
+    cpu_time_s: Optional[float] = 0.0
+    peak_rss_mb: Optional[float] = None
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+
+
+def maxrss_to_mb(maxrss: int) -> float:
+    """Convert ru_maxrss to MB (it is reported in bytes on macOS and in KB elsewhere)."""
+    if sys.platform == "darwin":
+        return maxrss / 1024 / 1024
+    return maxrss / 1024
+
+
+def count_csv_rows(path: Path, raw: bool = False) -> Optional[int]:
+    """Return the number of records of a CSV file without its header, or None if it cannot be read.
+
+    Line breaks inside quoted or escaped fields do not start a record and blank lines are
+    skipped, as in pandas. Clean CSVs are read with the format they are written in (``;``
+    separated, ``\\`` escapes) and raw CSVs with the dialect sniffed from their start."""
+    if not path.is_file():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace", newline="") as f:
+            if raw:
+                try:
+                    dialect = csv.Sniffer().sniff(f.read(64 * 1024), delimiters=RAW_CSV_DELIMITERS)
+                except csv.Error:
+                    dialect = csv.excel
+                f.seek(0)
+                reader = csv.reader(f, dialect)
+            else:
+                reader = csv.reader(f, delimiter=";", escapechar="\\")
+            return max(sum(1 for row in reader if row) - 1, 0)
+    except csv.Error as e:
+        logging.warning(f"Could not count the rows of {path}: {e}")
+        return None
+
+
+def count_script_rows(script: Path) -> tuple[Optional[int], Optional[int]]:
+    """Return the rows of the raw CSV inputs and of the clean CSV outputs of a script.
+
+    Inputs that are not CSV files (xlsx, sav...) are not counted."""
+    raw_csvs: list[Path] = []
+    paths = get_script_paths(script)
+    for path in paths.inputs:
+        if not path.is_relative_to(Path("data") / "raw"):
+            continue
+        raw_csvs.extend(sorted(path.rglob("*.csv")) if path.is_dir() else [path] if path.suffix == ".csv" else [])
+    rows_in = [rows for rows in (count_csv_rows(path, raw=True) for path in raw_csvs) if rows is not None]
+    rows_out = [rows for rows in map(count_csv_rows, paths.outputs) if rows is not None]
+    return (sum(rows_in) if rows_in else None, sum(rows_out) if rows_out else None)
+
+
+def record_script(
+    script: Path, status: str, wall_time_s: float, cpu_time_s: Optional[float], maxrss: Optional[int]
+) -> None:
+    """Record the metrics of a script run by utils.run_script. CPU time and peak memory
+    are None when the script did not report them, rows when they are not counted."""
+    if not os.getenv(RUN_REPORT_ENV_VAR):
+        return
+    rows_in, rows_out = count_script_rows(script) if os.getenv(COUNT_ROWS_ENV_VAR) else (None, None)
+    record_step(
+        StepMetrics(
+            stage=script.parent.name,
+            step=script.name,
+            status=status,
+            wall_time_s=wall_time_s,
+            cpu_time_s=cpu_time_s,
+            peak_rss_mb=maxrss_to_mb(maxrss) if maxrss is not None else None,
+            rows_in=rows_in,
+            rows_out=rows_out,
+        )
+    )
+
+
+def start_run_report(count_rows: bool = False) -> Optional[Path]:
+    """Start a report for this run unless a parent process already started one. If count_rows
+    is set, the rows of the CSVs of every ET script are counted too.
+
+    Returns the path of the report if this process owns it (and must finish it)."""
+    if os.getenv(RUN_REPORT_ENV_VAR):
+        return None
+    REPORT_DIR.mkdir(parents=True, exist_ok=True)
+    path = REPORT_DIR / f"{datetime.now().isoformat()}.jsonl"
+    path.touch()
+    os.environ[RUN_REPORT_ENV_VAR] = str(path)
+    if count_rows:
+        os.environ[COUNT_ROWS_ENV_VAR] = "1"
+    return path
+
+
+def record_step(metrics: StepMetrics) -> None:
+    """Append the metrics of a step to the report of the current run, if any."""
+    report_path = os.getenv(RUN_REPORT_ENV_VAR)
+    if not report_path:
+        return
+    record = {key: round(value, 3) if isinstance(value, float) else value for key, value in asdict(metrics).items()}
+    # A single short write in append mode is not interleaved with other processes
+    with open(report_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+@contextmanager
+def measure_step(stage: str, step: str) -> Iterator[StepMetrics]:
+    """Measure wall time, CPU time and peak memory of the enclosed block in this process.
+
+    Row counts can be set on the yielded metrics. Peak memory is the peak of the whole
+    process so far, as it cannot be reset."""
+    metrics = StepMetrics(stage=stage, step=step)
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield metrics
+    except BaseException:
+        metrics.status = "failed"
+        raise
+    finally:
+        metrics.wall_time_s = time.perf_counter() - wall_start
+        metrics.cpu_time_s = time.process_time() - cpu_start
+        metrics.peak_rss_mb = maxrss_to_mb(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+        record_step(metrics)
+
+
+def finish_run_report(path: Path, top_n: int = 10) -> None:
+    """Write the JSON and CSV reports of the run and log the slowest steps."""
+    with open(path, "r", encoding="utf-8") as f:
+        steps = [StepMetrics(**json.loads(line)) for line in f if line.strip()]
+    os.environ.pop(RUN_REPORT_ENV_VAR, None)
+    os.environ.pop(COUNT_ROWS_ENV_VAR, None)
+
+    json_path = path.with_suffix(".json")
+    json_path.write_text(json.dumps([asdict(step) for step in steps], indent=2), encoding="utf-8")
+
+    csv_path = path.with_suffix(".csv")
+    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=[field.name for field in fields(StepMetrics)], delimiter=";")
+        writer.writeheader()
+        writer.writerows(asdict(step) for step in steps)
+    path.unlink()
+
+    logging.info(f"Run report saved to {json_path} and {csv_path}")
+    logging.info(f"Top {top_n} slowest steps:")
+    for step in sorted(steps, key=lambda s: s.wall_time_s, reverse=True)[:top_n]:
+        peak = f"{step.peak_rss_mb:.0f} MB" if step.peak_rss_mb is not None else "-"
+        cpu = f"{step.cpu_time_s:.1f}s" if step.cpu_time_s is not None else "-"
+        logging.info(
+            f"\t{step.wall_time_s:8.1f}s wall {cpu:>9} cpu {peak:>8} peak "
+            f"[{step.stage}] {step.step} ({step.status}, rows in {step.rows_in}, rows out {step.rows_out})"
+        )
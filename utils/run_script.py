@@ -1,17 +1,71 @@
+import asyncio
+import contextlib
+import importlib
+import importlib.util
 import logging
+import logging.handlers
+import multiprocessing
 import os
+import queue
+import resource
+import signal
 import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional, Sequence
 
 from dotenv import load_dotenv
 
-from utils.logging import strip_metadata
+from utils.logging import JSON_LOG_FORMAT, LOG_FORMAT_ENV_VAR, parse_json_record, parse_plain_line
+from utils.run_report import record_script
 
 load_dotenv()
 
+# Child processes started by run_python_script, so they can be terminated from other threads
+_RUNNING_PROCESSES: set[subprocess.Popen] = set()
+_RUNNING_PROCESSES_LOCK = threading.Lock()
+
+# Modules imported once by each warm worker, shared by all the scripts it runs
+PRELOAD_MODULES = ["numpy", "pandas", "utils.normalization"]
+# Longest line read from the output of a script by the asyncio runner
+OUTPUT_LINE_LIMIT = 16 * 1024 * 1024
+
+
+@dataclass
+class ScriptResult:
+    """Outcome of a script run by run_python_script_async."""
+
+    script: Path
+    args: tuple[str, ...] = ()
+    returncode: Optional[int] = None
+    duration_s: float = 0.0
+    timed_out: bool = False
+    errors: list[str] = field(default_factory=list)
+    cpu_time_s: Optional[float] = None
+    maxrss: Optional[int] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out
+
+    def describe(self) -> str:
+        """Return a one-line summary of a failed script."""
+        if self.timed_out:
+            reason = "timed out"
+        elif self.returncode is None:
+            reason = "was cancelled"
+        else:
+            reason = f"exited with code {self.returncode}"
+        summary = f"Script {self.script.name} {reason} after {self.duration_s:.1f}s"
+        return f"{summary}: {self.errors[-1].splitlines()[0]}" if self.errors else summary
+
 
 def run_python_script(script: Path, *args: str):
-    """Run a standalone python script and capture its output."""
+    """Run a standalone python script and capture its output. Its wall time, CPU time
+    and peak memory are added to the run report."""
 
     if not script.exists():
         logging.error(f"Script path does not exist: {script}")
@@ -20,35 +74,375 @@ def run_python_script(script: Path, *args: str):
     # Build command with additional arguments
     cmd = ["python", str(script)] + [str(arg) for arg in args]
 
+    start = time.perf_counter()
     process = subprocess.Popen(
         cmd,
         text=True,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
+        env={**os.environ, LOG_FORMAT_ENV_VAR: JSON_LOG_FORMAT},
+    )
+    with _RUNNING_PROCESSES_LOCK:
+        _RUNNING_PROCESSES.add(process)
+
+    try:
+        _stream_output(process)
+    finally:
+        # Removed before reaping it so terminate_running_scripts never signals a reused pid
+        with _RUNNING_PROCESSES_LOCK:
+            _RUNNING_PROCESSES.discard(process)
+
+    # Reap the child with wait4 to get its own resource usage
+    _, wait_status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(wait_status)
+    record_script(
+        script,
+        "ok" if process.returncode == 0 else "failed",
+        time.perf_counter() - start,
+        usage.ru_utime + usage.ru_stime,
+        usage.ru_maxrss,
     )
 
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd)
+
+
+def _forward_line(line: str, name: Optional[str] = None) -> Optional[logging.LogRecord]:
+    """Forward a line written by a child process to the logging system and return its record.
+
+    Scripts using utils.logging.setup_logging write JSON log records, which keep their
+    level, logger, depth and time. Any other line is forwarded as plain text. If name is
+    given, it replaces the logger of the records written by the child itself. The record
+    with the resource usage of the child is returned without being forwarded."""
+
+    line = line.strip()
+    if not line:
+        return None
+    record = parse_json_record(line) or parse_plain_line(line)
+    if hasattr(record, "usage"):
+        return record
+    if name is not None and record.depth <= 1:
+        record.name = name
+    logger = logging.getLogger(record.name)
+    if logger.isEnabledFor(record.levelno):
+        logger.handle(record)
+    return record
+
+
+def _stream_output(process: subprocess.Popen):
+    """Forward the output of a child process to the logging system."""
+
     # Stream output line by line
     if process.stdout:
         for line in process.stdout:
-            line = line.strip()
-            clean, level = strip_metadata(line)
-            indent = "\t" * (level)
-            if "DEBUG" in line:
-                logging.debug(indent + clean)
-            elif "WARNING" in line:
-                logging.warning(indent + clean)
-            elif "ERROR" in line:
-                logging.error(indent + clean)
-            elif "CRITICAL" in line:
-                logging.critical(indent + clean)
-            elif "INFO" in line:
-                logging.info(indent + clean)
-            # else:
-            #     print(line, end="")  # fallback for lines without log level
-
-    process.wait()
-    if process.returncode != 0:
-        raise subprocess.CalledProcessError(process.returncode, cmd)
+            _forward_line(line)
+
+
+async def run_python_script_async(
+    script: Path,
+    *args: str,
+    timeout: Optional[float] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> ScriptResult:
+    """Run a standalone python script as an asyncio subprocess and return its result.
+
+    Its log records are forwarded tagged with the script name, so the output of scripts
+    running concurrently can be told apart, and its errors are kept in the result. The
+    script is terminated if it runs longer than ``timeout`` seconds or the task is
+    cancelled. At most one script per ``semaphore`` slot runs at a time."""
+
+    if not script.exists():
+        logging.error(f"Script path does not exist: {script}")
+        raise FileNotFoundError(f"Script path does not exist: {script}")
+
+    async with semaphore or contextlib.nullcontext():
+        result = ScriptResult(script, tuple(str(arg) for arg in args))
+        start = time.perf_counter()
+        process = await asyncio.create_subprocess_exec(
+            "python",
+            str(script),
+            *result.args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            env={**os.environ, LOG_FORMAT_ENV_VAR: JSON_LOG_FORMAT},
+            limit=OUTPUT_LINE_LIMIT,
+        )
+        try:
+            await asyncio.wait_for(_forward_output_async(process, result), timeout)
+        except asyncio.TimeoutError:
+            logging.error(f"Script {script.name} timed out after {timeout}s, terminating it")
+            result.timed_out = True
+            await _terminate_process(process)
+        except asyncio.CancelledError:
+            await _terminate_process(process)
+            raise
+        finally:
+            result.duration_s = time.perf_counter() - start
+
+        result.returncode = process.returncode
+        record_script(script, "ok" if result.ok else "failed", result.duration_s, result.cpu_time_s, result.maxrss)
+        return result
+
+
+async def _forward_output_async(process: asyncio.subprocess.Process, result: ScriptResult):
+    """Forward the output of a child process until it exits, collecting its errors and usage."""
+
+    assert process.stdout is not None
+    name = result.script.stem
+    async for line in process.stdout:
+        record = _forward_line(line.decode(errors="replace"), name)
+        if record is None:
+            continue
+        if hasattr(record, "usage"):
+            result.cpu_time_s = record.usage["cpu_time_s"]
+            result.maxrss = record.usage["maxrss"]
+        elif record.levelno >= logging.ERROR:
+            result.errors.append(record.getMessage())
+    await process.wait()
+
+
+async def _terminate_process(process: asyncio.subprocess.Process):
+    """Terminate a child process, killing it if it does not exit in a few seconds."""
+
+    with contextlib.suppress(ProcessLookupError):
+        process.terminate()
+    try:
+        await asyncio.wait_for(process.wait(), 5)
+    except asyncio.TimeoutError:
+        with contextlib.suppress(ProcessLookupError):
+            process.kill()
+        await process.wait()
+
+
+async def run_python_scripts_async(
+    commands: Sequence[tuple[Path, Sequence[str]]],
+    jobs: int = 1,
+    timeout: Optional[float] = None,
+    fail_fast: bool = True,
+) -> list[ScriptResult]:
+    """Run scripts with their arguments, up to ``jobs`` at a time, and return their results
+    in the same order. With ``fail_fast``, the first failure cancels the other scripts."""
+
+    semaphore = asyncio.Semaphore(jobs)
+    tasks = [
+        asyncio.create_task(run_python_script_async(script, *args, timeout=timeout, semaphore=semaphore))
+        for script, args in commands
+    ]
+    try:
+        for task in asyncio.as_completed(tasks):
+            result = await task
+            if fail_fast and not result.ok:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return [
+        task.result() if not task.cancelled() else ScriptResult(script, tuple(str(arg) for arg in args))
+        for task, (script, args) in zip(tasks, commands)
+    ]
+
+
+def run_python_scripts(
+    commands: Sequence[tuple[Path, Sequence[str]]],
+    jobs: int = 1,
+    timeout: Optional[float] = None,
+    fail_fast: bool = True,
+) -> list[ScriptResult]:
+    """Blocking version of run_python_scripts_async."""
+    return asyncio.run(run_python_scripts_async(commands, jobs, timeout, fail_fast))
+
+
+def terminate_running_scripts():
+    """Terminate every python script currently started by run_python_script."""
+
+    with _RUNNING_PROCESSES_LOCK:
+        for process in _RUNNING_PROCESSES:
+            logging.warning(f"Terminating script: {' '.join(str(arg) for arg in process.args)}")  # type: ignore
+            try:
+                os.kill(process.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+
+class _ScriptContextFilter(logging.Filter):
+    """Attach the running script to the records of a worker, one level deeper like subprocess output."""
+
+    def __init__(self):
+        super().__init__()
+        self.script: Optional[str] = None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.depth = getattr(record, "depth", 0) + 1
+        if self.script is not None:
+            record.name = self.script
+        return True
+
+
+class _ForwardHandler(logging.Handler):
+    """Hand records received from the workers to the loggers of the orchestrator."""
+
+    def handle(self, record: logging.LogRecord) -> bool:  # type: ignore[override]
+        logging.getLogger(record.name).handle(record)
+        return True
+
+
+def _worker_loop(conn, log_queue) -> None:
+    """Entry point of a warm worker: preload modules, then run scripts until told to stop."""
+
+    context_filter = _ScriptContextFilter()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(context_filter)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler], force=True)
+
+    for module in PRELOAD_MODULES:
+        importlib.import_module(module)
+
+    while True:
+        job = conn.recv()
+        if job is None:
+            break
+        script, args = job
+        context_filter.script = script.stem
+        usage_start = resource.getrusage(resource.RUSAGE_SELF)
+        error = None
+        try:
+            _run_script_main(script, *args)
+        except BaseException as e:
+            logging.error(f"{type(e).__name__}: {e}")
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            context_filter.script = None
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        cpu_time = usage.ru_utime + usage.ru_stime - usage_start.ru_utime - usage_start.ru_stime
+        conn.send((error, cpu_time, usage.ru_maxrss))
+
+
+def _run_script_main(script: Path, *args: str) -> None:
+    """Import a script as a fresh module and call its main() function."""
+
+    module_name = f"_script_{script.stem}"
+    spec = importlib.util.spec_from_file_location(module_name, script)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not load script: {script}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    argv = sys.argv
+    sys.argv = [str(script)] + [str(arg) for arg in args]
+    try:
+        spec.loader.exec_module(module)
+        module.main()
+    finally:
+        sys.argv = argv
+        sys.modules.pop(module_name, None)
+
+
+class _ScriptWorker:
+    """Long-lived python process running scripts in-process."""
+
+    def __init__(self, log_queue):
+        context = multiprocessing.get_context("spawn")
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_loop, args=(child_conn, log_queue), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def run(self, script: Path, *args: str) -> tuple[Optional[str], Optional[float], Optional[int]]:
+        """Run a script and return its error (None if it succeeded), CPU time and worker peak memory."""
+        try:
+            self.conn.send((script, args))
+            return self.conn.recv()
+        except (EOFError, OSError):
+            self.process.join(timeout=5)
+            return f"Worker exited with code {self.process.exitcode}", None, None
+
+    def close(self):
+        if self.process.is_alive():
+            try:
+                self.conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.conn.close()
+
+
+class ScriptWorkerPool:
+    """Small pool of warm python workers that run scripts by calling their ``main()``.
+
+    Workers import pandas, numpy and utils.normalization once, so each script only pays
+    for its own module. Every script is loaded as a fresh module, its log records are
+    tagged with its name and an exception is raised like ``run_python_script`` does. A
+    worker that dies is replaced by a new one. The peak memory reported for a script is
+    the peak of its worker so far."""
+
+    def __init__(self, workers: int = 1):
+        context = multiprocessing.get_context("spawn")
+        self._log_queue = context.Queue()
+        self._listener = logging.handlers.QueueListener(self._log_queue, _ForwardHandler())
+        self._listener.start()
+        self._idle: queue.Queue[_ScriptWorker] = queue.Queue()
+        self._busy: set[_ScriptWorker] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        for _ in range(workers):
+            self._idle.put(_ScriptWorker(self._log_queue))
+
+    def run_python_script(self, script: Path, *args: str):
+        """Run a script in an idle worker, blocking until it is done."""
+
+        if not script.exists():
+            logging.error(f"Script path does not exist: {script}")
+            raise FileNotFoundError(f"Script path does not exist: {script}")
+
+        worker = self._idle.get()
+        with self._lock:
+            self._busy.add(worker)
+        start = time.perf_counter()
+        try:
+            error, cpu_time, maxrss = worker.run(script, *args)
+            record_script(script, "ok" if error is None else "failed", time.perf_counter() - start, cpu_time, maxrss)
+        finally:
+            with self._lock:
+                self._busy.discard(worker)
+            if worker.process.is_alive():
+                self._idle.put(worker)
+            else:
+                worker.close()
+                if not self._closed:
+                    self._idle.put(_ScriptWorker(self._log_queue))
+
+        if error is not None:
+            raise RuntimeError(f"Script {script} failed: {error}")
+
+    def terminate(self):
+        """Terminate the workers that are running a script. Dead workers are not replaced."""
+
+        self._closed = True
+        with self._lock:
+            workers = list(self._busy)
+        for worker in workers:
+            if worker.process.is_alive():
+                logging.warning(f"Terminating worker running a script (pid {worker.process.pid})")
+                worker.process.terminate()
+
+    def close(self):
+        """Stop every worker and the log listener."""
+
+        self._closed = True
+        while not self._idle.empty():
+            self._idle.get().close()
+        self._listener.stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
 
 def run_sql_script(script: str):
@@ -0,0 +1,153 @@
+"""Static discovery of the files read and written by pipeline scripts.
+
+Scripts declare their inputs and outputs as module level ``Path`` constants
+(``RAW_CSV_PATH``, ``CLEAN_CSV_PATH``...). They are collected by parsing the
+source, so scripts are never imported (importing ``utils.normalization`` would
+already read ``municipios.csv``)."""
+
+import ast
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+CLEAN_DATA_DIR = Path("data") / "clean"
+# Caches are rebuilt from other inputs, so they are not inputs themselves
+CACHE_DATA_DIR = Path("data") / "cache"
+LOCAL_PACKAGES = {"utils"}
+
+
+@dataclass(frozen=True)
+class ScriptPaths:
+    """Files a script depends on and produces."""
+
+    inputs: list[Path] = field(default_factory=list)
+    outputs: list[Path] = field(default_factory=list)
+    modules: list[Path] = field(default_factory=list)
+
+
+def _evaluate(node: ast.expr, names: dict[str, Any]) -> Any:
+    """Evaluate the subset of expressions used to build paths in the scripts."""
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Name):
+        return names.get(node.id)
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "Path":
+        args = [_evaluate(arg, names) for arg in node.args]
+        if args and all(isinstance(arg, str) for arg in args):
+            return Path(*args)
+        return None
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Div):
+        left = _evaluate(node.left, names)
+        right = _evaluate(node.right, names)
+        if isinstance(left, Path) and isinstance(right, (str, Path)):
+            return left / right
+        return None
+    if isinstance(node, ast.Dict):
+        return [_evaluate(value, names) for value in node.values]
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        return [_evaluate(elt, names) for elt in node.elts]
+    return None
+
+
+def _collect_paths(value: Any) -> list[Path]:
+    """Flatten nested containers returned by _evaluate into a list of paths."""
+    if isinstance(value, Path):
+        return [value]
+    if isinstance(value, list):
+        return [path for item in value for path in _collect_paths(item)]
+    return []
+
+
+def _local_module_path(module: Optional[str]) -> Optional[Path]:
+    """Return the source file of a repository module (e.g. utils.normalization)."""
+    if module is None or module.split(".")[0] not in LOCAL_PACKAGES:
+        return None
+    path = Path(*module.split(".")).with_suffix(".py")
+    return path if path.exists() else None
+
+
+@lru_cache(maxsize=None)
+def _parse_tree(source_path: Path) -> ast.Module:
+    """Parse a python file."""
+    return ast.parse(source_path.read_text(encoding="utf-8"), filename=str(source_path))
+
+
+@lru_cache(maxsize=None)
+def _parse_module(source_path: Path) -> tuple[dict[str, list[Path]], tuple[Path, ...]]:
+    """Return the path constants and the local imports of a python file."""
+    tree = _parse_tree(source_path)
+
+    names: dict[str, Any] = {}
+    constants: dict[str, list[Path]] = {}
+    imports: list[Path] = []
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            value = _evaluate(node.value, names)
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    names[target.id] = value
+                    paths = _collect_paths(value)
+                    if paths:
+                        constants[target.id] = paths
+        elif isinstance(node, ast.ImportFrom):
+            module_path = _local_module_path(node.module)
+            if module_path is not None:
+                imports.append(module_path)
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                module_path = _local_module_path(alias.name)
+                if module_path is not None:
+                    imports.append(module_path)
+    return constants, tuple(imports)
+
+
+def _is_output(name: str, path: Path) -> bool:
+    """Clean CSV constants (CLEAN_CSV_PATH...) are the outputs of a script."""
+    return name.startswith("CLEAN_") and path.is_relative_to(CLEAN_DATA_DIR)
+
+
+def get_script_paths(script: Path) -> ScriptPaths:
+    """Return the data inputs, outputs and local source modules of a script.
+
+    Data paths declared by imported repository modules (e.g. ``MUNICIPIOS_PATH``
+    in ``utils.normalization_dicts``) are inputs of the script as well."""
+    inputs: list[Path] = []
+    outputs: list[Path] = []
+    modules: list[Path] = []
+
+    pending = [script]
+    while pending:
+        source_path = pending.pop(0)
+        if source_path in modules:
+            continue
+        modules.append(source_path)
+        constants, imports = _parse_module(source_path)
+        for name, paths in constants.items():
+            for path in paths:
+                if path.is_relative_to(CACHE_DATA_DIR):
+                    continue
+                if source_path == script and _is_output(name, path):
+                    outputs.append(path)
+                elif path not in inputs:
+                    inputs.append(path)
+        pending.extend(imports)
+
+    return ScriptPaths(inputs=inputs, outputs=outputs, modules=modules)
+
+
+def get_script_targets(script: Path) -> list[str]:
+    """Return the schema qualified tables listed in the ``Target tables:`` docstring header.
+
+    The schema is the name of the directory of the script."""
+    docstring = ast.get_docstring(_parse_tree(script)) or ""
+    targets: list[str] = []
+    in_targets = False
+    for line in docstring.splitlines():
+        if not line.strip():
+            continue
+        if not line[0].isspace():
+            in_targets = line.strip() == "Target tables:"
+        elif in_targets:
+            targets.append(f"{script.parent.name}.{line.split()[0]}")
+    return targets
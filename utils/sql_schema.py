@@ -0,0 +1,97 @@
+"""Statements of the SQL schema files scoped to a single database schema.
+
+``sql/schema.sql`` and ``sql/views.sql`` are split into statements (every statement
+ends with ``;`` at the end of a line) so that a schema can be dropped and created
+again without touching the rest of the database: its tables, the enums used only by
+its tables and the ``analisis`` views that read from it."""
+
+import re
+from dataclasses import dataclass
+
+ENUMS_SCHEMA = "enums"
+VIEWS_SCHEMA = "analisis"
+# Schemas used by every other schema, which are only dropped and created all together
+SHARED_SCHEMAS = {"geo", "metadata", ENUMS_SCHEMA, VIEWS_SCHEMA, "public"}
+_CREATE_PATTERN = re.compile(r"CREATE\s+(?:OR\s+REPLACE\s+)?(SCHEMA|TABLE|TYPE|VIEW)\s+([\w.]+)", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Statement:
+    """A SQL statement with the kind and name of the object it creates, if any."""
+
+    sql: str
+    code: str
+    kind: str = ""
+    name: str = ""
+
+    def references(self, name: str) -> bool:
+        """Return True if the code of the statement mentions an object (``schema.object``)
+        or, given a bare schema name, any object of that schema."""
+        suffix = r"\b" if "." in name else r"\.\w"
+        return re.search(rf"(?<![\w.]){re.escape(name)}{suffix}", self.code) is not None
+
+
+def split_statements(sql: str) -> list[Statement]:
+    """Split a SQL script into its statements. Comment lines ending with ``;`` do not end one."""
+    statements: list[Statement] = []
+    lines: list[str] = []
+    for line in [*sql.splitlines(), ";"]:
+        if line.strip().startswith("--") or not line.rstrip().endswith(";"):
+            lines.append(line)
+            continue
+        lines.append(line.rstrip()[:-1])
+        sql_statement = "\n".join(lines).strip()
+        lines = []
+        code = "\n".join(line for line in sql_statement.splitlines() if not line.strip().startswith("--"))
+        if not code.strip():
+            continue
+        match = _CREATE_PATTERN.search(code)
+        kind, name = (match.group(1).upper(), match.group(2).lower()) if match else ("", "")
+        statements.append(Statement(f"{sql_statement};", code.strip(), kind, name))
+    return statements
+
+
+def get_schema_enums(schema_sql: str, schema: str) -> list[str]:
+    """Return the enums used by the tables of a schema and by no table of another schema."""
+    statements = split_statements(schema_sql)
+    tables = [statement for statement in statements if statement.kind == "TABLE"]
+    enums: list[str] = []
+    for statement in statements:
+        if statement.kind != "TYPE" or not statement.name.startswith(f"{ENUMS_SCHEMA}."):
+            continue
+        users = {table.name.split(".")[0] for table in tables if table.references(statement.name)}
+        if users == {schema}:
+            enums.append(statement.name)
+    return enums
+
+
+def get_schema_statements(schema_sql: str, schema: str) -> list[Statement]:
+    """Return the statements creating a schema, its tables and its enums, in file order."""
+    enums = set(get_schema_enums(schema_sql, schema))
+    return [
+        statement
+        for statement in split_statements(schema_sql)
+        if (statement.kind == "SCHEMA" and statement.name == schema)
+        or (statement.kind == "TABLE" and statement.name.startswith(f"{schema}."))
+        or (statement.kind == "TYPE" and statement.name in enums)
+    ]
+
+
+def rename_schema(sql: str, schema: str, new_schema: str) -> str:
+    """Return the SQL with the objects of a schema (``schema.object``) moved to another schema."""
+    return re.sub(rf"(?<![\w.]){re.escape(schema)}\.(?=\w)", f"{new_schema}.", sql)
+
+
+def get_dependent_views(views_sql: str, schema: str) -> list[Statement]:
+    """Return the statements creating the views that read from a schema, directly or through
+    other views, in file order."""
+    views = [statement for statement in split_statements(views_sql) if statement.kind == "VIEW"]
+    dependent: list[str] = []
+    pending = [schema]
+    while pending:
+        name = pending.pop()
+        for view in views:
+            if view.name not in dependent and view.references(name):
+                dependent.append(view.name)
+                pending.append(view.name)
+    return [view for view in views if view.name in dependent]